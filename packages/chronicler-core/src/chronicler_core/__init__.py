@@ -1,11 +1,8 @@
-"""Chronicler Core - shared library for VCS crawling, LLM drafting, and document generation."""
+"""Chronicler Core - shared library for VCS crawling, LLM drafting, and document generation.
 
-from chronicler_core.vcs import VCSProvider, GitHubProvider, VCSCrawler, create_provider
-from chronicler_core.llm import LLMProvider, create_llm_provider
-from chronicler_core.drafter import Drafter, ContextBuilder
-from chronicler_core.output import TechMdWriter, TechMdValidator
-from chronicler_core.converter import DocumentConverter
-from chronicler_core.config import ChroniclerConfig, load_config
+Uses PEP 562 lazy imports so importing a single submodule (e.g. from the
+Claude Code hooks) does not pull in the LLM, VCS and converter stacks.
+"""
 
 __version__ = "0.1.0"
 
@@ -24,3 +21,29 @@ __all__ = [
     "create_provider",
     "load_config",
 ]
+
+_class_map = {
+    "VCSProvider": ".vcs",
+    "GitHubProvider": ".vcs",
+    "VCSCrawler": ".vcs",
+    "create_provider": ".vcs",
+    "LLMProvider": ".llm",
+    "create_llm_provider": ".llm",
+    "Drafter": ".drafter",
+    "ContextBuilder": ".drafter",
+    "TechMdWriter": ".output",
+    "TechMdValidator": ".output",
+    "DocumentConverter": ".converter",
+    "ChroniclerConfig": ".config",
+    "load_config": ".config",
+}
+
+
+def __getattr__(name: str):
+    import importlib
+
+    if name in _class_map:
+        mod = importlib.import_module(_class_map[name], __name__)
+        return getattr(mod, name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import stat
 from pathlib import Path
 
 from pydantic import BaseModel, Field
@@ -78,9 +79,13 @@ def check_staleness(project_path: str | Path) -> StalenessReport:
 
     for node in file_nodes:
         fpath = project_path / node.path
-        if not fpath.is_file():
+        try:
+            st = fpath.stat()
+        except OSError:
             continue
-        current = compute_file_hash(fpath)
+        if not stat.S_ISREG(st.st_mode) or node.stat_matches(st):
+            continue
+        current = compute_file_hash(fpath, tree.algorithm)
         if current != node.source_hash:
             stale_entries.append(StaleEntry(
                 source_path=node.path,
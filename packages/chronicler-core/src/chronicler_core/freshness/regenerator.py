@@ -71,7 +71,7 @@ def regenerate_stale(
         # Update the merkle node with fresh hashes
         source_file = project_path / entry.source_path
         if source_file.is_file():
-            new_source_hash = compute_file_hash(source_file)
+            new_source_hash = compute_file_hash(source_file, tree.algorithm)
 
             # Try to compute the new doc hash if a doc_path exists
             new_doc_hash = None
@@ -79,7 +79,7 @@ def regenerate_stale(
             if node and node.doc_path:
                 doc_file = project_path / node.doc_path
                 if doc_file.is_file():
-                    new_doc_hash = compute_file_hash(doc_file)
+                    new_doc_hash = compute_file_hash(doc_file, tree.algorithm)
 
             tree.update_node(
                 entry.source_path,
@@ -16,6 +16,11 @@ class Permission(BaseModel):
     action: str
     conditions: dict[str, Any] = {}
 
+    def __hash__(self) -> int:
+        # conditions is a dict, so the generated frozen-model hash would raise;
+        # equal permissions always share resource/action, so this is consistent
+        return hash((self.resource, self.action))
+
 
 @runtime_checkable
 class RBACPlugin(Protocol):
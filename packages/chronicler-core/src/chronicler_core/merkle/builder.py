@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import functools
+import os
+import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -11,12 +15,32 @@ from chronicler_core.merkle.tree import (
     DEFAULT_IGNORE,
     MerkleTree,
     _find_doc_for_source,
-    _matches_any,
+    _iter_files,
     compute_file_hash,
     compute_hash,
     compute_merkle_hash,
 )
 
+# Stat entries newer than this (relative to scan start) are not cached
+_RACY_WINDOW_NS = 2_000_000_000
+
+# Below this many files a thread pool costs more than it saves
+_PARALLEL_MIN_FILES = 8
+
+
+def _hash_files(paths: list[Path], algorithm: str) -> list[str]:
+    """Hash *paths* in order, in parallel when there are enough of them.
+
+    hashlib releases the GIL while digesting large buffers, and cold-cache
+    reads block in the kernel, so threads overlap both.
+    """
+    hash_one = functools.partial(compute_file_hash, algorithm=algorithm)
+    if len(paths) < _PARALLEL_MIN_FILES:
+        return [hash_one(p) for p in paths]
+    workers = min(32, os.cpu_count() or 1, len(paths))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(hash_one, paths))
+
 
 class MerkleTreeBuilder:
     """Builds a MerkleTree by walking a source directory on disk."""
@@ -26,12 +50,19 @@ class MerkleTreeBuilder:
         root_path: Path,
         doc_dir: str = ".chronicler",
         ignore_patterns: list[str] | None = None,
+        algorithm: str = "sha256",
+        stat_cache: dict[str, tuple[int, int, str]] | None = None,
     ) -> MerkleTree:
         """Walk *root_path* and construct a full Merkle tree.
 
         Files matching *ignore_patterns* (and the built-in defaults) are
         skipped. For each source file we also search for a paired
-        ``.tech.md`` inside *doc_dir*.
+        ``.tech.md`` inside *doc_dir*. File contents are hashed with
+        *algorithm* (``sha256`` or ``blake3``), which is recorded on the tree.
+
+        *stat_cache* (see :meth:`MerkleTree.stat_cache`) maps relative paths
+        to ``(mtime_ns, size, hash)`` from a previous build with the same
+        algorithm; files whose stat still matches reuse that hash.
         """
         root_path = root_path.resolve()
         ignore = set(DEFAULT_IGNORE)
@@ -43,24 +74,58 @@ class MerkleTreeBuilder:
         children_map: dict[str, list[str]] = defaultdict(list)
 
         # Collect all source files
-        all_files: list[Path] = []
-        for p in sorted(root_path.rglob("*")):
-            if _matches_any(p.relative_to(root_path), ignore):
-                continue
-            if p.is_file():
-                all_files.append(p)
-
-        for fpath in all_files:
-            rel = str(fpath.relative_to(root_path))
-            source_hash = compute_file_hash(fpath)
+        all_files = list(_iter_files(root_path, ignore))
+
+        stat_cache = stat_cache or {}
+        # Files modified this close to the scan may change again within the
+        # same mtime tick; don't record their stat so the next build rehashes
+        racy_after = time.time_ns() - _RACY_WINDOW_NS
+        # rel path -> (hash, mtime_ns, size); docs are usually tree files too
+        hashed: dict[str, tuple[str, int | None, int | None]] = {}
+
+        def _cached(rel: str, st: os.stat_result) -> str | None:
+            cached = stat_cache.get(rel)
+            if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                return cached[2]
+            return None
+
+        def _record(rel: str, digest: str, st: os.stat_result) -> None:
+            if st.st_mtime_ns < racy_after:
+                hashed[rel] = (digest, st.st_mtime_ns, st.st_size)
+            else:
+                hashed[rel] = (digest, None, None)
+
+        # Reuse cached digests; everything else is hashed on a thread pool.
+        # DirEntry caches its stat, so this is the only stat() per file.
+        pending: list[tuple[str, Path, os.stat_result]] = []
+        for rel, entry in all_files:
+            st = entry.stat()
+            digest = _cached(rel, st)
+            if digest is None:
+                pending.append((rel, Path(entry.path), st))
+            else:
+                _record(rel, digest, st)
+        digests = _hash_files([fpath for _, fpath, _ in pending], algorithm)
+        for (rel, _, st), digest in zip(pending, digests):
+            _record(rel, digest, st)
+
+        def _hash(fpath: Path, rel: str) -> tuple[str, int | None, int | None]:
+            # Only reached for docs outside the walk (e.g. an ignored dir)
+            if rel not in hashed:
+                st = fpath.stat()
+                _record(rel, _cached(rel, st) or compute_file_hash(fpath, algorithm), st)
+            return hashed[rel]
+
+        for rel, _ in all_files:
+            source_hash, mtime_ns, size = hashed[rel]
 
             # Look for a paired doc
             doc_path_obj = _find_doc_for_source(rel, doc_dir, root_path)
             doc_hash: str | None = None
             doc_path: str | None = None
             if doc_path_obj is not None:
-                doc_hash = compute_file_hash(doc_path_obj)
                 doc_path = str(doc_path_obj.relative_to(root_path))
+                doc_hash = _hash(doc_path_obj, doc_path)[0]
 
             node = MerkleNode(
                 path=rel,
@@ -68,14 +133,14 @@ class MerkleTreeBuilder:
                 source_hash=source_hash,
                 doc_hash=doc_hash,
                 doc_path=doc_path,
+                mtime_ns=mtime_ns,
+                size=size,
             )
             nodes[rel] = node
 
             # Register file as direct child of its parent, and ensure
             # all ancestor directories are linked so intermediate dirs get nodes.
-            parent = str(fpath.parent.relative_to(root_path))
-            if parent == ".":
-                parent = ""
+            parent = rel.rpartition("/")[0]
             children_map[parent].append(rel)
 
             # Walk up the ancestor chain
@@ -116,4 +181,5 @@ class MerkleTreeBuilder:
             nodes=nodes,
             last_scan=datetime.now(timezone.utc),
             root_path=str(root_path),
+            algorithm=algorithm,
         )
@@ -61,7 +61,7 @@ class MerkleTreeDiffer:
             fpath = root / node.path
             if not fpath.is_file():
                 continue
-            current = compute_file_hash(fpath)
+            current = compute_file_hash(fpath, tree.algorithm)
             if current != node.source_hash:
                 updated = replace(node, stale=True)
                 tree.nodes[path] = updated
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import re
 from dataclasses import dataclass, field
 
@@ -19,11 +20,23 @@ class MerkleNode:
     doc_hash: str | None = None
     doc_path: str | None = None
     stale: bool = False
+    # Source file stat when source_hash was computed; lets a rebuild skip
+    # rehashing files whose mtime and size are unchanged
+    mtime_ns: int | None = None
+    size: int | None = None
 
     def __post_init__(self) -> None:
         if not _HEX12_RE.fullmatch(self.hash):
             raise ValueError(f"hash must be 12-char hex, got {self.hash!r}")
 
+    def stat_matches(self, st: os.stat_result) -> bool:
+        """True if *st* is the stat recorded when source_hash was computed."""
+        return (
+            self.mtime_ns is not None
+            and self.mtime_ns == st.st_mtime_ns
+            and self.size == st.st_size
+        )
+
 
 @dataclass(frozen=True)
 class MerkleDiff:
@@ -10,7 +10,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 
 from chronicler_core.config.models import MerkleConfig
-from chronicler_core.merkle.tree import compute_file_hash, _matches_any
+from chronicler_core.merkle.tree import compute_file_hash, _iter_files
 
 logger = logging.getLogger(__name__)
 
@@ -149,13 +149,8 @@ class MercatorScanner:
         ignore = set(self.config.ignore_patterns)
         files: dict[str, str] = {}
 
-        for p in sorted(root.rglob("*")):
-            if not p.is_file():
-                continue
-            rel = p.relative_to(root)
-            if _matches_any(rel, ignore):
-                continue
-            files[str(rel)] = compute_file_hash(p)
+        for rel, entry in _iter_files(root, ignore):
+            files[rel] = compute_file_hash(Path(entry.path), self.config.algorithm)
 
         return ScanResult(files=files)
 
@@ -4,13 +4,22 @@ from __future__ import annotations
 
 import hashlib
 import json
+import mmap
+import os
 import re
 from dataclasses import replace
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
+from typing import Iterator
 
 from chronicler_core.merkle.models import MerkleDiff, MerkleNode
 
+try:
+    import blake3
+except ImportError:
+    blake3 = None  # type: ignore[assignment]
+
 # Directories always skipped during tree build
 DEFAULT_IGNORE = {
     ".git",
@@ -24,14 +33,44 @@ DEFAULT_IGNORE = {
 }
 
 
-def compute_hash(content: bytes) -> str:
-    """SHA-256 hash, truncated to the first 12 hex characters."""
-    return hashlib.sha256(content).hexdigest()[:12]
+# Below this size a single read() beats mmap setup/teardown
+_MMAP_MIN_SIZE = 1 << 20
+
+
+def _new_hasher(algorithm: str):
+    if algorithm == "sha256":
+        return hashlib.sha256()
+    if algorithm == "blake3":
+        if blake3 is None:
+            raise ImportError(
+                "merkle algorithm 'blake3' requires the blake3 package: pip install blake3"
+            )
+        return blake3.blake3()
+    raise ValueError(f"Unsupported merkle hash algorithm: {algorithm!r}")
+
 
+def compute_hash(content: bytes, algorithm: str = "sha256") -> str:
+    """Content hash (SHA-256 by default), truncated to the first 12 hex characters."""
+    hasher = _new_hasher(algorithm)
+    hasher.update(content)
+    return hasher.hexdigest()[:12]
 
-def compute_file_hash(path: Path) -> str:
-    """Read a file from disk and return its truncated SHA-256 hash."""
-    return compute_hash(path.read_bytes())
+
+def compute_file_hash(path: Path, algorithm: str = "sha256") -> str:
+    """Hash a file on disk and return the truncated digest.
+
+    Files of at least ``_MMAP_MIN_SIZE`` bytes are memory-mapped and fed to
+    the hasher without a copy; smaller ones are read in one call, which is
+    cheaper than setting up a mapping.
+    """
+    hasher = _new_hasher(algorithm)
+    with open(path, "rb", buffering=0) as f:
+        if os.fstat(f.fileno()).st_size >= _MMAP_MIN_SIZE:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                hasher.update(mm)
+        else:
+            hasher.update(f.readall())
+    return hasher.hexdigest()[:12]
 
 
 def compute_merkle_hash(child_hashes: list[str]) -> str:
@@ -48,6 +87,34 @@ def _matches_any(path: Path, patterns: set[str]) -> bool:
     return any(part in patterns for part in path.parts)
 
 
+def _iter_files(root: Path, ignore: set[str]) -> Iterator[tuple[str, os.DirEntry]]:
+    """Yield ``(relative_path, entry)`` for every file under *root*.
+
+    Walks with :func:`os.scandir`, so files and directories are told apart
+    from the directory listing itself rather than a ``stat()`` per entry.
+    Entries named in *ignore* are pruned before descending. Output is in
+    sorted path order, and symlinked directories are not followed
+    (both as with ``sorted(root.rglob("*"))``).
+    """
+
+    def walk(path: str, prefix: str) -> Iterator[tuple[str, os.DirEntry]]:
+        try:
+            with os.scandir(path) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except PermissionError:
+            return
+        for entry in entries:
+            if entry.name in ignore:
+                continue
+            rel = prefix + entry.name
+            if entry.is_dir(follow_symlinks=False):
+                yield from walk(entry.path, rel + "/")
+            elif entry.is_file():
+                yield rel, entry
+
+    return walk(str(root), "")
+
+
 def _find_doc_for_source(
     source_rel: str, doc_dir: str, root: Path
 ) -> Path | None:
@@ -89,11 +156,22 @@ class MerkleTree:
         nodes: dict[str, MerkleNode],
         last_scan: datetime,
         root_path: str = "",
+        algorithm: str = "sha256",
     ) -> None:
         self.root_hash = root_hash
         self.nodes = nodes
         self.last_scan = last_scan
         self.root_path = root_path
+        self.algorithm = algorithm
+
+    @cached_property
+    def by_doc_path(self) -> dict[str, MerkleNode]:
+        """Map each node's ``doc_path`` to the node, built on first access.
+
+        Reset by :meth:`update_node`; callers that assign into ``nodes``
+        directly should ``del tree.by_doc_path`` afterwards.
+        """
+        return {n.doc_path: n for n in self.nodes.values() if n.doc_path}
 
     # ------------------------------------------------------------------
     # Build
@@ -105,6 +183,8 @@ class MerkleTree:
         root_path: Path,
         doc_dir: str = ".chronicler",
         ignore_patterns: list[str] | None = None,
+        algorithm: str = "sha256",
+        stat_cache: dict[str, tuple[int, int, str]] | None = None,
     ) -> MerkleTree:
         """Walk *root_path* and construct a full Merkle tree.
 
@@ -112,7 +192,20 @@ class MerkleTree:
         """
         from chronicler_core.merkle.builder import MerkleTreeBuilder
 
-        return MerkleTreeBuilder.build(root_path, doc_dir, ignore_patterns)
+        return MerkleTreeBuilder.build(
+            root_path, doc_dir, ignore_patterns, algorithm, stat_cache
+        )
+
+    def stat_cache(self) -> dict[str, tuple[int, int, str]]:
+        """Return ``{path: (mtime_ns, size, source_hash)}`` for :meth:`build`.
+
+        Only file nodes with a recorded stat are included.
+        """
+        return {
+            path: (n.mtime_ns, n.size, n.source_hash)
+            for path, n in self.nodes.items()
+            if n.source_hash is not None and n.mtime_ns is not None and n.size is not None
+        }
 
     # ------------------------------------------------------------------
     # Drift detection
@@ -158,6 +251,7 @@ class MerkleTree:
         if doc_hash is not None:
             updates["doc_hash"] = doc_hash
         self.nodes[path] = replace(node, **updates)
+        self.__dict__.pop("by_doc_path", None)
 
     # ------------------------------------------------------------------
     # Serialization
@@ -180,6 +274,8 @@ class MerkleTree:
                     "doc_hash": n.doc_hash,
                     "doc_path": n.doc_path,
                     "stale": n.stale,
+                    "mtime_ns": n.mtime_ns,
+                    "size": n.size,
                 }
                 for path, n in self.nodes.items()
             },
@@ -200,12 +296,15 @@ class MerkleTree:
                 doc_hash=ndata.get("doc_hash"),
                 doc_path=ndata.get("doc_path"),
                 stale=ndata.get("stale", False),
+                mtime_ns=ndata.get("mtime_ns"),
+                size=ndata.get("size"),
             )
         return cls(
             root_hash=obj["root_hash"],
             nodes=nodes,
             last_scan=datetime.fromisoformat(obj["last_scan"]),
             root_path=obj.get("root_path", ""),
+            algorithm=obj.get("algorithm", "sha256"),
         )
 
     def save(self, path: Path) -> None:
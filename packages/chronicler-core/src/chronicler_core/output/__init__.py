@@ -1,10 +1,29 @@
 """Output subsystem — writes and indexes .tech.md files."""
 
-from chronicler_core.output.validator import TechMdValidator, ValidationResult
-from chronicler_core.output.writer import TechMdWriter
+from __future__ import annotations
 
 __all__ = [
     "TechMdValidator",
     "TechMdWriter",
     "ValidationResult",
+    "split_frontmatter",
 ]
+
+# Loaded on first access so importing output.frontmatter alone stays cheap;
+# the writer pulls in the whole drafter/LLM stack.
+_class_map = {
+    "TechMdValidator": ".validator",
+    "ValidationResult": ".validator",
+    "TechMdWriter": ".writer",
+    "split_frontmatter": ".frontmatter",
+}
+
+
+def __getattr__(name: str):
+    import importlib
+
+    if name in _class_map:
+        mod = importlib.import_module(_class_map[name], __name__)
+        return getattr(mod, name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
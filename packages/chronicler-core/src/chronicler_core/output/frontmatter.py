@@ -0,0 +1,24 @@
+"""Shared YAML frontmatter fence detection for .tech.md files."""
+
+from __future__ import annotations
+
+import re
+
+# Opening fence on the first line, closing fence on a line of its own.
+_FRONTMATTER_RE = re.compile(
+    r"\A---[ \t]*\r?\n(.*?)^---[ \t]*(?:\r?\n|\Z)",
+    re.DOTALL | re.MULTILINE,
+)
+
+
+def split_frontmatter(text: str) -> tuple[str | None, str]:
+    """Split markdown into (frontmatter text, body).
+
+    Returns (None, text) when the text does not open with a '---' fence or
+    the fence is never closed. The body starts right after the closing
+    fence's line break; the tail of the file is not scanned.
+    """
+    m = _FRONTMATTER_RE.match(text)
+    if m is None:
+        return None, text
+    return m.group(1), text[m.end():]
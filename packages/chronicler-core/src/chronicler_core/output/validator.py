@@ -8,6 +8,13 @@ from pathlib import Path
 import yaml
 from pydantic import BaseModel, Field
 
+from chronicler_core.output.frontmatter import split_frontmatter
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # libyaml not available
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 # Required top-level YAML fields and their expected types.
@@ -40,17 +47,10 @@ def _split_frontmatter(content: str) -> tuple[str | None, str]:
 
     Returns (yaml_str, body). yaml_str is None if no frontmatter found.
     """
-    if not content.startswith("---"):
+    yaml_str, body = split_frontmatter(content)
+    if yaml_str is None:
         return None, content
-
-    # Find the closing --- marker (skip the opening one)
-    end = content.find("---", 3)
-    if end == -1:
-        return None, content
-
-    yaml_str = content[3:end].strip()
-    body = content[end + 3:]
-    return yaml_str, body
+    return yaml_str.strip(), body
 
 
 class TechMdValidator:
@@ -122,7 +122,7 @@ class TechMdValidator:
 
         # Parse YAML
         try:
-            data = yaml.safe_load(yaml_str)
+            data = yaml.load(yaml_str, Loader=_SafeLoader)
         except yaml.YAMLError as exc:
             self._add_issue(result, f"YAML parse error: {exc}")
             return result
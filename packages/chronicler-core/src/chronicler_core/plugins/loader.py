@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import importlib.metadata
 import logging
+import sys
+from collections.abc import Iterator, Mapping
 from typing import TYPE_CHECKING
 
 from chronicler_core.interfaces.graph import GraphPlugin
@@ -29,6 +31,30 @@ class PluginNotFoundError(Exception):
         super().__init__(msg)
 
 
+class _LazyDiscovery(Mapping[str, list[str]]):
+    """Read-only {plugin_type: [name, ...]} view that scans each group on first access."""
+
+    def __init__(self, groups: Mapping[str, str]):
+        self._groups = groups
+        self._names: dict[str, list[str]] = {}
+
+    def __getitem__(self, plugin_type: str) -> list[str]:
+        if plugin_type not in self._names:
+            group = self._groups[plugin_type]
+            eps = importlib.metadata.entry_points(group=group)
+            self._names[plugin_type] = [ep.name for ep in eps]
+        return self._names[plugin_type]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._groups)
+
+    def __len__(self) -> int:
+        return len(self._groups)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+
 class PluginLoader:
     """Discovers and loads plugins via entry points or config."""
 
@@ -46,16 +72,25 @@ class PluginLoader:
         "storage": ("chronicler_lite.storage.memvid_storage", "MemVidStorage"),
     }
 
+    # Plugin types key every lookup on the load path; interning makes those
+    # hashes/compares pointer-cheap (group names contain "." so aren't
+    # interned by the compiler).
+    GROUPS = {sys.intern(k): sys.intern(v) for k, v in GROUPS.items()}
+    LITE_DEFAULTS = {sys.intern(k): v for k, v in LITE_DEFAULTS.items()}
+
     def __init__(self, config: ChroniclerConfig):
         self._config = config
+        # (plugin_type, resolved name or "<default>") -> loaded plugin class,
+        # or None for a named plugin that isn't registered
+        self._loaded: dict[tuple[str, str], object] = {}
 
-    def discover(self) -> dict[str, list[str]]:
-        """Scan entry_points for registered plugins. Returns {type: [name, ...]}."""
-        result: dict[str, list[str]] = {}
-        for plugin_type, group in self.GROUPS.items():
-            eps = importlib.metadata.entry_points(group=group)
-            result[plugin_type] = [ep.name for ep in eps]
-        return result
+    def discover(self) -> Mapping[str, list[str]]:
+        """Map each plugin type to its registered names: {type: [name, ...]}.
+
+        Entry-point groups are scanned lazily, only for the types a caller
+        actually reads.
+        """
+        return _LazyDiscovery(self.GROUPS)
 
     def _resolve_name(self, plugin_type: str, name: str | None) -> str | None:
         """Resolve plugin name: explicit arg > config > None."""
@@ -76,10 +111,13 @@ class PluginLoader:
         """Try to import the Lite default for this plugin type."""
         if plugin_type not in self.LITE_DEFAULTS:
             return None
+        key = (plugin_type, "<default>")
+        if key in self._loaded:
+            return self._loaded[key]
         module_path, class_name = self.LITE_DEFAULTS[plugin_type]
         try:
             module = __import__(module_path, fromlist=[class_name])
-            return getattr(module, class_name)
+            plugin_cls = getattr(module, class_name)
         except (ImportError, AttributeError) as e:
             logger.warning(
                 "Failed to import Lite default %s.%s: %s",
@@ -88,12 +126,24 @@ class PluginLoader:
                 e,
             )
             return None
+        self._loaded[key] = plugin_cls
+        return plugin_cls
 
     def _load_plugin(self, plugin_type: str, name: str | None) -> object | None:
-        """Fallback chain: name/config > entry_points > Lite defaults."""
+        """Fallback chain: name/config > entry_points > Lite defaults.
+
+        Lookups are memoized per loader so repeated calls skip the
+        entry-point scan and module import. A missing named plugin is cached
+        as None and still raises on every call.
+        """
         resolved = self._resolve_name(plugin_type, name)
         if resolved is not None:
-            result = self._load_from_entry_point(plugin_type, resolved)
+            key = (plugin_type, resolved)
+            if key in self._loaded:
+                result = self._loaded[key]
+            else:
+                result = self._load_from_entry_point(plugin_type, resolved)
+                self._loaded[key] = result
             if result is not None:
                 return result
             # Name was explicit but not found -- don't fallback silently
@@ -1,10 +1,15 @@
 """Pydantic models for VCS data."""
 
+import re
+from dataclasses import dataclass
 from typing import Literal
 from urllib.parse import urlparse
 
 from pydantic import BaseModel, Field, field_validator
 
+# http(s) scheme followed by a non-empty host; schemes are case-insensitive
+_URL_RE = re.compile(r"^https?://[^/?#\s]+", re.IGNORECASE)
+
 
 class RepoMetadata(BaseModel):
     """Metadata for a repository."""
@@ -32,8 +37,9 @@ class RepoMetadata(BaseModel):
     @field_validator("url")
     @classmethod
     def validate_url(cls, v: str) -> str:
-        if v == "":
+        if v == "" or _URL_RE.match(v):
             return v
+        # Slow path only to build a precise error message
         parsed = urlparse(v)
         if parsed.scheme not in ("http", "https"):
             raise ValueError(f"url must use http or https scheme, got {parsed.scheme!r}")
@@ -42,8 +48,14 @@ class RepoMetadata(BaseModel):
         return v
 
 
-class FileNode(BaseModel):
-    """A file or directory in a repository tree."""
+@dataclass(frozen=True, slots=True)
+class FileNode:
+    """A file or directory in a repository tree.
+
+    A slotted dataclass rather than a BaseModel: crawls build one per file
+    and the fields carry no validators. Pydantic models embedding it (e.g.
+    CrawlResult) still accept and dump it as-is.
+    """
 
     path: str
     name: str
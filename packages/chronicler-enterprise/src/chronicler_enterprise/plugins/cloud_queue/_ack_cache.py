@@ -0,0 +1,74 @@
+"""Bounded job_id -> broker handle cache shared by the cloud queue plugins."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Generic, TypeVar
+
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+class AckCache(Generic[V]):
+    """Insertion-ordered map with a size cap and a per-entry TTL.
+
+    Holds the receipt/ack handle for each dequeued job until it is acked or
+    nacked. If a consumer dies in between, the entry would otherwise live
+    forever; here it is dropped once the TTL passes (the broker redelivers
+    the message after its visibility timeout anyway) or when the cache is
+    full, oldest first.
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl: float | None = None) -> None:
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be >= 1, got {maxsize!r}")
+        self._maxsize = maxsize
+        self._ttl = ttl
+        # key -> (expires_at, value); a constant TTL keeps expiry in insertion order
+        self._data: OrderedDict[str, tuple[float, V]] = OrderedDict()
+
+    def _expire(self) -> None:
+        if self._ttl is None:
+            return
+        now = time.monotonic()
+        while self._data:
+            key, (expires_at, _) = next(iter(self._data.items()))
+            if expires_at > now:
+                break
+            del self._data[key]
+
+    def __setitem__(self, key: str, value: V) -> None:
+        self._expire()
+        expires_at = time.monotonic() + self._ttl if self._ttl is not None else float("inf")
+        self._data.pop(key, None)
+        self._data[key] = (expires_at, value)
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def __getitem__(self, key: str) -> V:
+        expires_at, value = self._data[key]
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        try:
+            self[key]  # type: ignore[index]
+        except KeyError:
+            return False
+        return True
+
+    def __len__(self) -> int:
+        self._expire()
+        return len(self._data)
+
+    def pop(self, key: str, default: object = _MISSING) -> V | object:
+        entry = self._data.pop(key, None)
+        if entry is None or entry[0] <= time.monotonic():
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        return entry[1]
@@ -2,33 +2,121 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+import json
+import weakref
+from collections.abc import Mapping
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from chronicler_core.interfaces.queue import Job, JobStatus
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps_payload(payload: dict[str, Any]) -> bytes:
+    """Serialize a job payload to UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+def loads_payload(data: bytes | str) -> dict[str, Any]:
+    """Parse a job payload from JSON bytes or text."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# value -> member, skipping EnumMeta.__call__ on every dequeue
+_STATUS: dict[str, JobStatus] = {m.value: m for m in JobStatus}
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _format_ts(dt: datetime) -> str:
+    """Encode a timestamp as integer epoch microseconds (naive is taken as UTC)."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return str((dt - _EPOCH) // _MICROSECOND)
+
+
+def _parse_ts(value: str) -> datetime:
+    """Decode epoch microseconds, or ISO-8601 from messages enqueued by older clients."""
+    if value.lstrip("-").isdigit():
+        return _EPOCH + timedelta(microseconds=int(value))
+    return datetime.fromisoformat(value)
+
+
+# id(job) -> (weakref to job, field snapshot, attrs). Jobs are unhashable
+# (mutable Pydantic models), so entries are keyed by id and dropped by the
+# weakref callback when the Job is collected, before the id can be reused.
+_ATTRS_CACHE: dict[int, tuple[weakref.ref, tuple, dict[str, str]]] = {}
+
 
 def job_to_attrs(job: Job) -> dict[str, str]:
-    """Serialize Job metadata to a flat string dict (common across all cloud queues)."""
-    return {
+    """Serialize Job metadata to a flat string dict (common across all cloud queues).
+
+    The result is cached per Job instance and reused while its mutable fields
+    are unchanged, so republishing the same Job skips timestamp formatting.
+    A fresh dict is returned each time since some SDKs keep a reference to it.
+    """
+    key = id(job)
+    snapshot = (job.id, job.status, job.created_at, job.updated_at, job.attempts, job.error)
+    entry = _ATTRS_CACHE.get(key)
+    if entry is not None and entry[0]() is job and entry[1] == snapshot:
+        return dict(entry[2])
+    attrs = {
         "job_id": job.id,
         "status": job.status.value,
-        "created_at": job.created_at.isoformat(),
-        "updated_at": job.updated_at.isoformat(),
+        "created_at": _format_ts(job.created_at),
+        "updated_at": _format_ts(job.updated_at),
         "attempts": str(job.attempts),
         "error": job.error or "",
     }
+    ref = weakref.ref(job, lambda _, key=key: _ATTRS_CACHE.pop(key, None))
+    _ATTRS_CACHE[key] = (ref, snapshot, attrs)
+    return dict(attrs)
+
+
+def attrs_to_job(
+    attrs: Mapping[str, Any],
+    payload: dict,
+    *,
+    status: JobStatus | None = None,
+    updated_at: datetime | None = None,
+) -> Job:
+    """Deserialize Job from a flat string mapping + payload.
+
+    *attrs* only needs ``__getitem__``, so SDK attribute maps can be passed
+    without copying them into a dict first.
 
+    *status* and *updated_at* override the serialized values, so callers that
+    immediately transition the job (e.g. to processing on dequeue) get the
+    final Job from one construction.
 
-def attrs_to_job(attrs: dict[str, Any], payload: dict) -> Job:
-    """Deserialize Job from a flat string dict + payload."""
+    Every field is converted to its final type here, so the Job is built with
+    model_construct to skip a second Pydantic validation pass per message.
+    The Job field constraints are checked inline instead.
+    """
+    job_id = attrs["job_id"]
+    attempts = int(attrs["attempts"])
+    if not job_id.strip() or attempts < 0 or not isinstance(payload, dict):
+        raise ValueError(f"malformed job attributes: {attrs!r}")
+    if status is None:
+        status = _STATUS.get(attrs["status"])
+        if status is None:
+            raise ValueError(f"unknown job status: {attrs['status']!r}")
     error = attrs["error"]
-    return Job(
-        id=attrs["job_id"],
+    return Job.model_construct(
+        id=job_id,
         payload=payload,
-        status=JobStatus(attrs["status"]),
-        created_at=datetime.fromisoformat(attrs["created_at"]),
-        updated_at=datetime.fromisoformat(attrs["updated_at"]),
+        status=status,
+        created_at=_parse_ts(attrs["created_at"]),
+        updated_at=updated_at if updated_at is not None else _parse_ts(attrs["updated_at"]),
         error=error if error else None,
-        attempts=int(attrs["attempts"]),
+        attempts=attempts,
     )
@@ -2,18 +2,21 @@
 
 from __future__ import annotations
 
-import json
 import logging
+from collections import deque
+from concurrent.futures import Future
 from datetime import UTC, datetime
 
-from google.cloud import pubsub_v1
-
 from chronicler_core.interfaces.queue import Job, JobStatus
 
-from ._serialization import attrs_to_job, job_to_attrs
+from ._ack_cache import AckCache
+from ._serialization import attrs_to_job, dumps_payload, job_to_attrs, loads_payload
 
 logger = logging.getLogger(__name__)
 
+# Publish futures are awaited in groups of this size by enqueue()
+_FLUSH_EVERY = 100
+
 
 class PubSubQueue:
     """Google Cloud Pub/Sub queue that conforms to the QueuePlugin protocol.
@@ -22,49 +25,98 @@ class PubSubQueue:
     as Pub/Sub message attributes; the payload goes in the message body.
     """
 
-    def __init__(self, project_id: str, topic: str, subscription: str) -> None:
+    def __init__(
+        self,
+        project_id: str,
+        topic: str,
+        subscription: str,
+        ack_ttl_seconds: float | None = None,
+        max_pending_acks: int = 10_000,
+    ) -> None:
+        # Deferred so resolving the class doesn't load the Pub/Sub SDK
+        from google.cloud import pubsub_v1
+
         self._project_id = project_id
         self._topic_path = f"projects/{project_id}/topics/{topic}"
         self._subscription_path = (
             f"projects/{project_id}/subscriptions/{subscription}"
         )
-        self._publisher = pubsub_v1.PublisherClient()
+        # Let the client coalesce up to 100 messages / 50 ms per publish RPC
+        self._publisher = pubsub_v1.PublisherClient(
+            batch_settings=pubsub_v1.types.BatchSettings(max_messages=100, max_latency=0.05)
+        )
         self._subscriber = pubsub_v1.SubscriberClient()
-        # ack_id cache: job_id -> ack_id
-        self._ack_ids: dict[str, str] = {}
+        # ack_id cache: job_id -> ack_id. Bounded so ack ids of jobs that are
+        # never acked don't accumulate; set ack_ttl_seconds to the ack deadline.
+        self._ack_ids: AckCache[str] = AckCache(max_pending_acks, ack_ttl_seconds)
+        # Outstanding publish futures, checked by flush()
+        self._pending: deque[Future] = deque()
+
+    def flush(self) -> None:
+        """Wait for outstanding publishes; re-raises the first publish error."""
+        while self._pending:
+            self._pending.popleft().result()
 
     def close(self) -> None:
+        self.flush()
         self._publisher.transport.close()
         self._subscriber.close()
 
     # -- serialization helpers ------------------------------------------------
 
     @staticmethod
-    def _message_to_job(msg) -> Job:
-        return attrs_to_job(dict(msg.attributes), json.loads(msg.data.decode("utf-8")))
+    def _message_to_job(msg, **overrides) -> Job:
+        return attrs_to_job(msg.attributes, loads_payload(msg.data), **overrides)
 
     # -- QueuePlugin protocol -------------------------------------------------
 
+    def _publish(self, job: Job) -> None:
+        future = self._publisher.publish(
+            self._topic_path, data=dumps_payload(job.payload), **job_to_attrs(job)
+        )
+        self._pending.append(future)
+
     def enqueue(self, job: Job) -> str:
-        data = json.dumps(job.payload).encode("utf-8")
-        attrs = job_to_attrs(job)
-        self._publisher.publish(self._topic_path, data=data, **attrs)
+        """Publish without blocking; results are checked every _FLUSH_EVERY jobs.
+
+        Not waiting per message lets the publisher batch sends. Call flush()
+        (or close()) to confirm delivery of the most recent jobs.
+        """
+        self._publish(job)
+        if len(self._pending) >= _FLUSH_EVERY:
+            self.flush()
         return job.id
 
+    def enqueue_many(self, jobs: list[Job]) -> list[str]:
+        """Publish all jobs, then wait on the futures together.
+
+        The publisher client batches outstanding messages, so issuing every
+        publish before blocking lets them share round-trips.
+        """
+        for job in jobs:
+            self._publish(job)
+        self.flush()
+        return [job.id for job in jobs]
+
     def dequeue(self) -> Job | None:
+        jobs = self.dequeue_many(1)
+        return jobs[0] if jobs else None
+
+    def dequeue_many(self, max_messages: int = 10) -> list[Job]:
+        """Pull up to *max_messages* jobs in one request."""
         resp = self._subscriber.pull(
             subscription=self._subscription_path,
-            max_messages=1,
+            max_messages=max_messages,
         )
-        if not resp.received_messages:
-            return None
-
-        received = resp.received_messages[0]
-        job = self._message_to_job(received.message)
-        job.status = JobStatus.processing
-        job.updated_at = datetime.now(UTC)
-        self._ack_ids[job.id] = received.ack_id
-        return job
+        jobs: list[Job] = []
+        now = datetime.now(UTC)
+        for received in resp.received_messages:
+            job = self._message_to_job(
+                received.message, status=JobStatus.processing, updated_at=now
+            )
+            self._ack_ids[job.id] = received.ack_id
+            jobs.append(job)
+        return jobs
 
     def ack(self, job_id: str) -> None:
         ack_id = self._ack_ids.pop(job_id, None)
@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from datetime import UTC, datetime
-
-from azure.servicebus import ServiceBusClient, ServiceBusMessage
+from typing import TYPE_CHECKING
 
 from chronicler_core.interfaces.queue import Job, JobStatus
 
-from ._serialization import attrs_to_job, job_to_attrs
+from ._ack_cache import AckCache
+from ._serialization import attrs_to_job, dumps_payload, job_to_attrs, loads_payload
+
+if TYPE_CHECKING:
+    from azure.servicebus import ServiceBusMessage
 
 logger = logging.getLogger(__name__)
 
@@ -22,13 +24,24 @@ class ServiceBusQueue:
     as application properties; the payload goes in the message body as JSON.
     """
 
-    def __init__(self, connection_string: str, queue_name: str) -> None:
+    def __init__(
+        self,
+        connection_string: str,
+        queue_name: str,
+        ack_ttl_seconds: float | None = None,
+        max_pending_acks: int = 10_000,
+    ) -> None:
+        # Deferred so resolving the class doesn't load the Service Bus SDK
+        from azure.servicebus import ServiceBusClient
+
         self._queue_name = queue_name
         self._client = ServiceBusClient.from_connection_string(connection_string)
         self._sender = self._client.get_queue_sender(queue_name=queue_name)
         self._receiver = self._client.get_queue_receiver(queue_name=queue_name)
-        # message cache: job_id -> ServiceBusReceivedMessage
-        self._messages: dict[str, object] = {}
+        # message cache: job_id -> ServiceBusReceivedMessage. Bounded so locked
+        # messages that are never settled don't accumulate; set
+        # ack_ttl_seconds to the queue's lock duration.
+        self._messages: AckCache[object] = AckCache(max_pending_acks, ack_ttl_seconds)
 
     def close(self) -> None:
         self._sender.close()
@@ -39,13 +52,17 @@ class ServiceBusQueue:
 
     @staticmethod
     def _job_to_message(job: Job) -> ServiceBusMessage:
-        msg = ServiceBusMessage(json.dumps(job.payload))
+        from azure.servicebus import ServiceBusMessage
+
+        msg = ServiceBusMessage(dumps_payload(job.payload))
         msg.application_properties = job_to_attrs(job)
         return msg
 
     @staticmethod
-    def _received_to_job(msg) -> Job:
-        return attrs_to_job(dict(msg.application_properties), json.loads(str(msg.body)))
+    def _received_to_job(msg, **overrides) -> Job:
+        return attrs_to_job(
+            msg.application_properties, loads_payload(str(msg.body)), **overrides
+        )
 
     # -- QueuePlugin protocol -------------------------------------------------
 
@@ -54,17 +71,43 @@ class ServiceBusQueue:
         self._sender.send_messages(msg)
         return job.id
 
+    def enqueue_many(self, jobs: list[Job]) -> list[str]:
+        """Send jobs in as few ServiceBusMessageBatch sends as will fit."""
+        batch = self._sender.create_message_batch()
+        pending = 0
+        for job in jobs:
+            msg = self._job_to_message(job)
+            try:
+                batch.add_message(msg)
+            except ValueError:
+                # Batch is full (MessageSizeExceededError) -- flush and start over
+                if not pending:
+                    raise
+                self._sender.send_messages(batch)
+                batch = self._sender.create_message_batch()
+                batch.add_message(msg)
+                pending = 0
+            pending += 1
+        if pending:
+            self._sender.send_messages(batch)
+        return [job.id for job in jobs]
+
     def dequeue(self) -> Job | None:
-        messages = self._receiver.receive_messages(max_message_count=1, max_wait_time=0)
-        if not messages:
-            return None
-
-        raw = messages[0]
-        job = self._received_to_job(raw)
-        job.status = JobStatus.processing
-        job.updated_at = datetime.now(UTC)
-        self._messages[job.id] = raw
-        return job
+        jobs = self.dequeue_many(1)
+        return jobs[0] if jobs else None
+
+    def dequeue_many(self, max_messages: int = 10) -> list[Job]:
+        """Receive up to *max_messages* jobs in one request."""
+        messages = self._receiver.receive_messages(
+            max_message_count=max_messages, max_wait_time=0
+        )
+        jobs: list[Job] = []
+        now = datetime.now(UTC)
+        for raw in messages:
+            job = self._received_to_job(raw, status=JobStatus.processing, updated_at=now)
+            self._messages[job.id] = raw
+            jobs.append(job)
+        return jobs
 
     def ack(self, job_id: str) -> None:
         msg = self._messages.pop(job_id, None)
@@ -2,18 +2,31 @@
 
 from __future__ import annotations
 
-import json
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 
-import boto3
-
 from chronicler_core.interfaces.queue import Job, JobStatus
 
-from ._serialization import attrs_to_job, job_to_attrs
+from ._ack_cache import AckCache
+from ._serialization import attrs_to_job, dumps_payload, job_to_attrs, loads_payload
 
 logger = logging.getLogger(__name__)
 
+# SQS caps batch send/receive at 10 messages per call
+_SQS_BATCH_MAX = 10
+
+# SQS DataType for each attribute produced by job_to_attrs
+_SQS_DTYPES: dict[str, str] = {
+    "job_id": "String",
+    "status": "String",
+    "created_at": "String",
+    "updated_at": "String",
+    "attempts": "Number",
+    "error": "String",
+}
+
 
 class SQSQueue:
     """AWS SQS queue that conforms to the QueuePlugin protocol.
@@ -27,35 +40,42 @@ class SQSQueue:
         queue_url: str,
         region: str = "us-east-1",
         dlq_url: str | None = None,
+        ack_ttl_seconds: float | None = None,
+        max_pending_acks: int = 10_000,
         **boto_kwargs,
     ) -> None:
+        # Deferred so resolving the class doesn't load boto3
+        import boto3
+
         self._queue_url = queue_url
         self._dlq_url = dlq_url
         self._client = boto3.client("sqs", region_name=region, **boto_kwargs)
-        # receipt handle cache: job_id -> receipt_handle (needed for ack/nack)
-        self._receipts: dict[str, str] = {}
+        # receipt handle cache: job_id -> receipt_handle (needed for ack/nack).
+        # Bounded so receipts of jobs that are never acked don't accumulate;
+        # set ack_ttl_seconds to the queue's visibility timeout.
+        self._receipts: AckCache[str] = AckCache(max_pending_acks, ack_ttl_seconds)
 
     # -- serialization helpers ------------------------------------------------
 
     @staticmethod
     def _job_to_message(job: Job) -> dict:
-        attrs = job_to_attrs(job)
         # SQS wraps each attribute in DataType/StringValue
-        sqs_attrs = {}
-        for key, val in attrs.items():
-            dtype = "Number" if key == "attempts" else "String"
-            sqs_attrs[key] = {"DataType": dtype, "StringValue": val}
+        sqs_attrs = {
+            key: {"DataType": _SQS_DTYPES[key], "StringValue": val}
+            for key, val in job_to_attrs(job).items()
+        }
         return {
-            "MessageBody": json.dumps(job.payload),
+            # SQS bodies are text; payload JSON is always valid UTF-8
+            "MessageBody": dumps_payload(job.payload).decode("utf-8"),
             "MessageAttributes": sqs_attrs,
         }
 
     @staticmethod
-    def _message_to_job(msg: dict) -> Job:
+    def _message_to_job(msg: dict, **overrides) -> Job:
         raw = msg["MessageAttributes"]
         # Unwrap SQS DataType/StringValue back to flat dict
         attrs = {k: v["StringValue"] for k, v in raw.items()}
-        return attrs_to_job(attrs, json.loads(msg["Body"]))
+        return attrs_to_job(attrs, loads_payload(msg["Body"]), **overrides)
 
     # -- QueuePlugin protocol -------------------------------------------------
 
@@ -68,23 +88,51 @@ class SQSQueue:
         )
         return job.id
 
+    def enqueue_many(self, jobs: list[Job]) -> list[str]:
+        """Send jobs with send_message_batch, 10 per request.
+
+        Returns the ids of jobs SQS accepted; rejected entries are logged.
+        """
+        sent: list[str] = []
+        for start in range(0, len(jobs), _SQS_BATCH_MAX):
+            chunk = jobs[start : start + _SQS_BATCH_MAX]
+            entries = []
+            for i, job in enumerate(chunk):
+                msg = self._job_to_message(job)
+                entries.append({"Id": str(i), **msg})
+            resp = self._client.send_message_batch(
+                QueueUrl=self._queue_url,
+                Entries=entries,
+            )
+            for ok in resp.get("Successful", []):
+                sent.append(chunk[int(ok["Id"])].id)
+            for failed in resp.get("Failed", []):
+                logger.warning(
+                    "enqueue failed job=%s code=%s",
+                    chunk[int(failed["Id"])].id,
+                    failed.get("Code"),
+                )
+        return sent
+
     def dequeue(self) -> Job | None:
+        jobs = self.dequeue_many(1)
+        return jobs[0] if jobs else None
+
+    def dequeue_many(self, max_messages: int = _SQS_BATCH_MAX) -> list[Job]:
+        """Receive up to *max_messages* (capped at 10) jobs in one request."""
         resp = self._client.receive_message(
             QueueUrl=self._queue_url,
             MessageAttributeNames=["All"],
-            MaxNumberOfMessages=1,
+            MaxNumberOfMessages=min(max_messages, _SQS_BATCH_MAX),
             WaitTimeSeconds=0,
         )
-        messages = resp.get("Messages", [])
-        if not messages:
-            return None
-
-        msg = messages[0]
-        job = self._message_to_job(msg)
-        job.status = JobStatus.processing
-        job.updated_at = datetime.now(UTC)
-        self._receipts[job.id] = msg["ReceiptHandle"]
-        return job
+        jobs: list[Job] = []
+        now = datetime.now(UTC)
+        for msg in resp.get("Messages", []):
+            job = self._message_to_job(msg, status=JobStatus.processing, updated_at=now)
+            self._receipts[job.id] = msg["ReceiptHandle"]
+            jobs.append(job)
+        return jobs
 
     def ack(self, job_id: str) -> None:
         receipt = self._receipts.pop(job_id, None)
@@ -107,24 +155,41 @@ class SQSQueue:
             VisibilityTimeout=0,
         )
 
-    def dead_letters(self, max_results: int = 1000) -> list[Job]:
+    def dead_letters(self, max_results: int = 1000, workers: int = 16) -> list[Job]:
+        """Read up to *max_results* jobs from the DLQ.
+
+        DLQ draining is network-bound, so *workers* threads poll concurrently
+        (boto3 clients are thread-safe). Each worker stops at its first empty
+        long-poll response or once *max_results* jobs are collected.
+        """
         if not self._dlq_url:
             return []
 
         jobs: list[Job] = []
-        while len(jobs) < max_results:
-            batch_size = min(10, max_results - len(jobs))
-            resp = self._client.receive_message(
-                QueueUrl=self._dlq_url,
-                MessageAttributeNames=["All"],
-                MaxNumberOfMessages=batch_size,
-                WaitTimeSeconds=0,
-            )
-            messages = resp.get("Messages", [])
-            if not messages:
-                break
-            for msg in messages:
-                job = self._message_to_job(msg)
-                job.status = JobStatus.dead
-                jobs.append(job)
+        lock = threading.Lock()
+
+        def drain() -> None:
+            while True:
+                with lock:
+                    remaining = max_results - len(jobs)
+                if remaining <= 0:
+                    return
+                resp = self._client.receive_message(
+                    QueueUrl=self._dlq_url,
+                    MessageAttributeNames=["All"],
+                    MaxNumberOfMessages=min(_SQS_BATCH_MAX, remaining),
+                    WaitTimeSeconds=1,
+                )
+                messages = resp.get("Messages", [])
+                if not messages:
+                    return
+                batch = [self._message_to_job(msg, status=JobStatus.dead) for msg in messages]
+                with lock:
+                    jobs.extend(batch[: max_results - len(jobs)])
+
+        n_workers = max(1, min(workers, -(-max_results // _SQS_BATCH_MAX)))
+        with ThreadPoolExecutor(max_workers=n_workers) as pool:
+            futures = [pool.submit(drain) for _ in range(n_workers)]
+            for future in futures:
+                future.result()
         return jobs
@@ -1,13 +1,20 @@
-"""Strawberry GraphQL server exposing the Neo4j graph for Mnemon consumption."""
+"""Strawberry GraphQL server exposing the Neo4j graph for Mnemon consumption.
+
+Resolvers are async and hand each blocking Neo4jGraph call to a worker thread,
+so concurrent requests overlap their Neo4j round-trips instead of queueing on
+the event loop.
+"""
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 logger = logging.getLogger(__name__)
 
 import strawberry
+from strawberry.dataloader import DataLoader
 
 if TYPE_CHECKING:
     from strawberry.types import Info
@@ -15,18 +22,26 @@ if TYPE_CHECKING:
     from .neo4j_graph import Neo4jGraph
 
 
+@strawberry.type
+class Edge:
+    source: str
+    target: str
+    relation: str
+
+
 @strawberry.type
 class Component:
     id: str
     type: str
     label: str
 
-
-@strawberry.type
-class Edge:
-    source: str
-    target: str
-    relation: str
+    @strawberry.field
+    async def edges(self, info: Info) -> list[Edge]:
+        """Outgoing edges, prefetched by Query.components when it can."""
+        prefetched = info.context["prefetched_edges"].get(self.id)
+        if prefetched is not None:
+            return prefetched
+        return await info.context["edges_loader"].load(self.id)
 
 
 @strawberry.type
@@ -36,76 +51,112 @@ class BlastRadiusResult:
     relationship: str
 
 
+# Every Cypher statement the resolvers send, fixed at import time so each one
+# maps to a single plan-cache entry on the server
+_QUERIES: dict[str, str] = {
+    "components_by_ids": "MATCH (n:Component) WHERE n.id IN $ids RETURN n",
+    "components_by_type": "MATCH (n:Component {type: $type}) RETURN n",
+    "components_all": "MATCH (n:Component) RETURN n",
+    "edges_by_sources": (
+        "MATCH (a:Component)-[r:RELATES]->(b:Component) WHERE a.id IN $ids "
+        "RETURN a.id AS src, b.id AS tgt, r.relation AS rel"
+    ),
+    "edges_all": (
+        "MATCH (a:Component)-[r:RELATES]->(b:Component) "
+        "RETURN a.id AS src, b.id AS tgt, r.relation AS rel"
+    ),
+}
+
+
 def _graph(info: Info) -> Neo4jGraph:
     return info.context["graph"]
 
 
+def _selects(info: Info, name: str) -> bool:
+    """Whether the current field's selection set directly includes *name*."""
+    return any(
+        getattr(sel, "name", None) == name
+        for field in info.selected_fields
+        for sel in field.selections
+    )
+
+
+def _component(n: Any) -> Component:
+    return Component(id=n["id"], type=n.get("type", ""), label=n.get("label", ""))
+
+
+async def _load_components(graph: Neo4jGraph, ids: list[str]) -> list[Component | None]:
+    """DataLoader batch fn: one Cypher query for every component id in the batch."""
+    rows = await asyncio.to_thread(
+        graph.query,
+        _QUERIES["components_by_ids"],
+        parameters={"ids": ids},
+    )
+    by_id = {r["n"]["id"]: _component(r["n"]) for r in rows}
+    return [by_id.get(i) for i in ids]
+
+
+async def _load_edges_by_source(graph: Neo4jGraph, sources: list[str]) -> list[list[Edge]]:
+    """DataLoader batch fn: outgoing edges for every source id in the batch."""
+    rows = await asyncio.to_thread(
+        graph.query,
+        _QUERIES["edges_by_sources"],
+        parameters={"ids": sources},
+    )
+    by_source: dict[str, list[Edge]] = {s: [] for s in sources}
+    for r in rows:
+        by_source[r["src"]].append(Edge(source=r["src"], target=r["tgt"], relation=r["rel"]))
+    return [by_source[s] for s in sources]
+
+
 @strawberry.type
 class Query:
     @strawberry.field
-    def component(self, info: Info, id: str) -> Component | None:
-        rows = _graph(info).query(
-            "MATCH (n:Component {id: $id}) RETURN n LIMIT 1",
-            parameters={"id": id},
-        )
-        if not rows:
-            return None
-        n = rows[0]["n"]
-        return Component(id=n["id"], type=n.get("type", ""), label=n.get("label", ""))
+    async def component(self, info: Info, id: str) -> Component | None:
+        return await info.context["component_loader"].load(id)
 
     @strawberry.field
-    def components(self, info: Info, type: str | None = None) -> list[Component]:
+    async def components(self, info: Info, type: str | None = None) -> list[Component]:
+        if _selects(info, "edges"):
+            rows = await asyncio.to_thread(_graph(info).components_with_edges, type)
+            prefetched = info.context["prefetched_edges"]
+            for r in rows:
+                src = r["n"]["id"]
+                prefetched[src] = [
+                    Edge(source=src, target=e["target"], relation=e["relation"])
+                    for e in r["edges"]
+                ]
+            return [_component(r["n"]) for r in rows]
         if type:
-            rows = _graph(info).query(
-                "MATCH (n:Component {type: $type}) RETURN n",
+            rows = await asyncio.to_thread(
+                _graph(info).query,
+                _QUERIES["components_by_type"],
                 parameters={"type": type},
             )
         else:
-            rows = _graph(info).query("MATCH (n:Component) RETURN n")
-        return [
-            Component(id=r["n"]["id"], type=r["n"].get("type", ""), label=r["n"].get("label", ""))
-            for r in rows
-        ]
+            rows = await asyncio.to_thread(_graph(info).query, _QUERIES["components_all"])
+        return [_component(r["n"]) for r in rows]
 
     @strawberry.field
-    def edges(self, info: Info, source: str | None = None) -> list[Edge]:
+    async def edges(self, info: Info, source: str | None = None) -> list[Edge]:
         if source:
-            rows = _graph(info).query(
-                "MATCH (a:Component {id: $source})-[r:RELATES]->(b:Component) "
-                "RETURN a.id AS src, b.id AS tgt, r.relation AS rel",
-                parameters={"source": source},
-            )
-        else:
-            rows = _graph(info).query(
-                "MATCH (a:Component)-[r:RELATES]->(b:Component) "
-                "RETURN a.id AS src, b.id AS tgt, r.relation AS rel"
-            )
+            return await info.context["edges_loader"].load(source)
+        rows = await asyncio.to_thread(_graph(info).query, _QUERIES["edges_all"])
         return [Edge(source=r["src"], target=r["tgt"], relation=r["rel"]) for r in rows]
 
     @strawberry.field
-    def dependency_tree(self, info: Info, root_id: str, depth: int = 2) -> list[Component]:
-        from chronicler_core.interfaces.graph import GraphNode
-
-        nodes: list[GraphNode] = _graph(info).neighbors(root_id, depth=depth)
+    async def dependency_tree(self, info: Info, root_id: str, depth: int = 2) -> list[Component]:
+        nodes = await asyncio.to_thread(_graph(info).neighbors, root_id, depth=depth)
         return [Component(id=n.id, type=n.type, label=n.label) for n in nodes]
 
     @strawberry.field
-    def blast_radius(self, info: Info, component_id: str, depth: int = 2) -> list[BlastRadiusResult]:
-        clamped = min(max(depth, 1), 10)
-        rows = _graph(info).query(
-            f"MATCH path = (n:Component {{id: $id}})-[*1..{clamped}]-(m:Component) "
-            "WHERE n <> m "
-            "WITH m, min(length(path)) AS hop "
-            "RETURN m, hop ORDER BY hop",
-            parameters={"id": component_id},
-        )
+    async def blast_radius(
+        self, info: Info, component_id: str, depth: int = 2
+    ) -> list[BlastRadiusResult]:
+        rows = await asyncio.to_thread(_graph(info).blast_radius, component_id, depth)
         return [
             BlastRadiusResult(
-                component=Component(
-                    id=r["m"]["id"],
-                    type=r["m"].get("type", ""),
-                    label=r["m"].get("label", ""),
-                ),
+                component=_component(r["m"]),
                 depth=r["hop"],
                 relationship="affects",
             )
@@ -116,19 +167,50 @@ class Query:
 class GraphQLServer:
     """Thin wrapper that wires a strawberry schema to the Neo4jGraph instance."""
 
-    def __init__(self, graph: Neo4jGraph, host: str = "127.0.0.1", port: int = 4000):
+    def __init__(
+        self,
+        graph: Neo4jGraph,
+        host: str = "127.0.0.1",
+        port: int = 4000,
+        warmup_connections: int = 8,
+    ):
         self._graph = graph
         self._host = host
         self._port = port
+        self._warmup_connections = warmup_connections
         self._schema = strawberry.Schema(query=Query)
 
+    def context(self) -> dict[str, Any]:
+        """Build the resolver context for one GraphQL request.
+
+        DataLoaders cache per key, so a fresh pair is created per request;
+        sharing them across requests would serve stale graph data.
+        """
+        graph = self._graph
+        return {
+            "graph": graph,
+            # component id -> edges fetched alongside it by Query.components
+            "prefetched_edges": {},
+            "component_loader": DataLoader(load_fn=lambda ids: _load_components(graph, ids)),
+            "edges_loader": DataLoader(load_fn=lambda ids: _load_edges_by_source(graph, ids)),
+        }
+
     def start(self) -> None:
         """Start the GraphQL server (blocking)."""
         from strawberry.asgi import GraphQL
         import uvicorn
 
-        app = GraphQL(self._schema, context_getter=lambda: {"graph": self._graph})
-        uvicorn.run(app, host=self._host, port=self._port)
+        # Connect and pre-plan before serving so the first request doesn't pay
+        if self._warmup_connections > 0:
+            self._graph.warm_up(self._warmup_connections, _QUERIES.values())
+
+        server = self
+
+        class _App(GraphQL):
+            async def get_context(self, request, response) -> dict[str, Any]:
+                return server.context()
+
+        uvicorn.run(_App(self._schema), host=self._host, port=self._port)
 
     @property
     def schema(self) -> strawberry.Schema:
@@ -3,6 +3,13 @@
 from __future__ import annotations
 
 import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -11,22 +18,205 @@ from chronicler_core.interfaces.graph import GraphEdge, GraphNode
 from chronicler_core.interfaces.storage import StoragePlugin
 
 
+# (graph, session) bound by Neo4jGraph.session(); neo4j sessions are not
+# thread-safe, so this is per-context rather than shared on the instance
+_bound_session: ContextVar[tuple[Any, Any] | None] = ContextVar("_bound_session", default=None)
+
+
+_MAX_DEPTH = 10
+
+# Variable-length bounds can't be Cypher parameters; one fixed string per depth
+# keeps runtime values out of the query text and the plan cache small.
+_NEIGHBOR_QUERIES: dict[int, str] = {
+    d: f"MATCH (n:Component {{id: $id}})-[*1..{d}]-(m:Component) RETURN DISTINCT m"
+    for d in range(1, _MAX_DEPTH + 1)
+}
+
+
+# Blast radius via APOC's BFS spanning tree: each node is reached once, at its
+# shortest hop distance, and depth is an ordinary parameter.
+_BLAST_RADIUS_APOC = (
+    "MATCH (n:Component {id: $id}) "
+    "CALL apoc.path.spanningTree(n, {maxLevel: $depth, bfs: true}) YIELD path "
+    "WITH last(nodes(path)) AS m, length(path) AS hop "
+    "WHERE hop > 0 AND m:Component "
+    "RETURN m, hop ORDER BY hop"
+)
+
+# Fallback without APOC: variable-length expansion, deduplicated by min hop
+_BLAST_RADIUS_QUERIES: dict[int, str] = {
+    d: (
+        f"MATCH path = (n:Component {{id: $id}})-[*1..{d}]-(m:Component) "
+        "WHERE n <> m "
+        "WITH m, min(length(path)) AS hop "
+        "RETURN m, hop ORDER BY hop"
+    )
+    for d in range(1, _MAX_DEPTH + 1)
+}
+
+_PROCEDURE_NOT_FOUND = "Neo.ClientError.Procedure.ProcedureNotFound"
+
+_SCHEMA = (
+    "CREATE CONSTRAINT component_id IF NOT EXISTS "
+    "FOR (c:Component) REQUIRE c.id IS UNIQUE",
+    "CREATE INDEX component_type IF NOT EXISTS FOR (c:Component) ON (c.type)",
+)
+
+
+def _freeze(value: Any) -> Any:
+    """Turn query parameters into a hashable cache key component."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _sync_tx(tx: Any, nodes: list[dict], edges: list[dict]) -> None:
+    tx.run(
+        "UNWIND $nodes AS n "
+        "MERGE (x:Component {id: n.id}) SET x.type = n.type, x.label = n.label",
+        nodes=nodes,
+    )
+    tx.run(
+        "UNWIND $edges AS e "
+        "MATCH (a:Component {id: e.source}), (b:Component {id: e.target}) "
+        "MERGE (a)-[:RELATES {relation: e.relation}]->(b)",
+        edges=edges,
+    )
+
+
 class Neo4jGraph:
     """Neo4j-backed knowledge graph.
 
     Lazy-imports the ``neo4j`` driver so the module can be imported even when
     the driver is not installed (optional dependency).
+
+    The driver keeps a connection pool (``max_connection_pool_size``,
+    ``connection_acquisition_timeout``). Wrap a run of calls in
+    ``with graph.session():`` to share one session between them instead of
+    opening one per call.
+
+    ``query`` results are kept in a small LRU cache with a TTL, keyed by the
+    Cypher text and its parameters. The graph is read-mostly, and the cache is
+    cleared by every write made through this class. Writes issued through
+    ``query`` itself should be followed by ``clear_cache()``.
+    Pass ``query_cache_size=0`` to disable caching.
     """
 
-    def __init__(self, uri: str, auth: tuple[str, str], database: str = "neo4j"):
+    def __init__(
+        self,
+        uri: str,
+        auth: tuple[str, str],
+        database: str = "neo4j",
+        query_cache_size: int = 1024,
+        query_cache_ttl: float = 60.0,
+        max_connection_pool_size: int = 50,
+        connection_acquisition_timeout: float = 10.0,
+        ensure_schema: bool = True,
+    ):
         import neo4j
 
-        self._driver = neo4j.GraphDatabase.driver(uri, auth=auth)
+        self._driver = neo4j.GraphDatabase.driver(
+            uri,
+            auth=auth,
+            max_connection_pool_size=max_connection_pool_size,
+            connection_acquisition_timeout=connection_acquisition_timeout,
+        )
         self._database = database
+        self._cache_size = query_cache_size
+        self._cache_ttl = query_cache_ttl
+        # (expression, frozen params) -> (expires_at, rows)
+        self._cache: OrderedDict[tuple, tuple[float, list[dict]]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_generation = 0  # bumped on clear so in-flight reads don't repopulate
+        self._hits = 0
+        self._misses = 0
+        self._has_apoc: bool | None = None  # probed on first blast_radius call
+        if ensure_schema:
+            self._ensure_schema()
 
     def close(self) -> None:
         self._driver.close()
 
+    def _ensure_schema(self) -> None:
+        """Index Component lookups so id/type matches aren't label scans.
+
+        Best effort: a read-only user or unreachable server shouldn't stop
+        the graph from being constructed.
+        """
+        try:
+            with self._driver.session(database=self._database) as session:
+                for statement in _SCHEMA:
+                    session.run(statement)
+        except Exception as e:
+            logger.warning("Neo4j schema setup failed: %s", e)
+
+    def warm_up(self, connections: int = 8, statements: Iterable[str] = ()) -> None:
+        """Open *connections* pooled connections and pre-plan *statements*.
+
+        Each worker holds a transaction open until all have connected, so the
+        pool really ends up with that many live Bolt connections. Statements
+        are sent with EXPLAIN, which plans and caches them without running
+        them. Failures are logged; the first real request just pays instead.
+        """
+        connections = max(1, connections)
+        barrier = threading.Barrier(connections)
+        statements = list(statements)
+
+        def connect(i: int) -> None:
+            try:
+                with self._driver.session(database=self._database) as session:
+                    with session.begin_transaction() as tx:
+                        tx.run("RETURN 1").consume()
+                        if i == 0:
+                            for statement in statements:
+                                tx.run("EXPLAIN " + statement).consume()
+                        barrier.wait(timeout=10)
+            except threading.BrokenBarrierError:
+                pass  # another worker failed; it reports the error
+            except Exception:
+                barrier.abort()  # release the workers already waiting
+                raise
+
+        try:
+            with ThreadPoolExecutor(max_workers=connections) as pool:
+                list(pool.map(connect, range(connections)))
+        except Exception as e:
+            logger.warning("Neo4j warm-up failed: %s", e)
+
+    @contextmanager
+    def session(self) -> Iterator[Any]:
+        """Bind one session for every call made in this context."""
+        bound = _bound_session.get()
+        if bound is not None and bound[0] is self:
+            yield bound[1]
+            return
+        with self._driver.session(database=self._database) as session:
+            token = _bound_session.set((self, session))
+            try:
+                yield session
+            finally:
+                _bound_session.reset(token)
+
+    def _session(self):
+        """The bound session if there is one, else a fresh per-call session."""
+        bound = _bound_session.get()
+        if bound is not None and bound[0] is self:
+            return nullcontext(bound[1])
+        return self._driver.session(database=self._database)
+
+    def clear_cache(self) -> None:
+        """Drop all cached query results."""
+        with self._cache_lock:
+            self._cache.clear()
+            self._cache_generation += 1
+
+    def cache_stats(self) -> dict[str, int]:
+        """Query cache hit/miss counters and current size."""
+        with self._cache_lock:
+            return {"hits": self._hits, "misses": self._misses, "size": len(self._cache)}
+
     # -- GraphPlugin protocol --------------------------------------------------
 
     def add_node(self, node: GraphNode) -> None:
@@ -34,7 +224,8 @@ class Neo4jGraph:
             "MERGE (n:Component {id: $id}) "
             "SET n.type = $type, n.label = $label, n += $metadata"
         )
-        with self._driver.session(database=self._database) as session:
+        self.clear_cache()
+        with self._session() as session:
             session.run(
                 query,
                 id=node.id,
@@ -49,7 +240,8 @@ class Neo4jGraph:
             MERGE (a)-[r:RELATES {relation: $relation}]->(b)
             SET r += $metadata
         """
-        with self._driver.session(database=self._database) as session:
+        self.clear_cache()
+        with self._session() as session:
             session.run(
                 query,
                 source=edge.source,
@@ -61,30 +253,92 @@ class Neo4jGraph:
     def neighbors(self, node_id: str, depth: int = 1) -> list[GraphNode]:
         if not isinstance(depth, int) or depth < 1:
             raise ValueError(f"depth must be a positive integer, got {depth!r}")
-        depth = min(depth, 10)
-        query = (
-            f"MATCH (n:Component {{id: $id}})-[*1..{depth}]-(m:Component) "
-            "RETURN DISTINCT m"
-        )
-        with self._driver.session(database=self._database) as session:
+        query = _NEIGHBOR_QUERIES[min(depth, _MAX_DEPTH)]
+        with self._session() as session:
             result = session.run(query, id=node_id)
-            return [
-                GraphNode(
-                    id=r["m"]["id"],
-                    type=r["m"].get("type", ""),
-                    label=r["m"].get("label", ""),
-                    metadata={
-                        k: v
-                        for k, v in r["m"].items()
-                        if k not in ("id", "type", "label")
-                    },
+            nodes = []
+            for r in result:
+                # One copy of the node's properties; what's left after the
+                # known keys are popped is the metadata
+                props = dict(r["m"])
+                nodes.append(
+                    GraphNode(
+                        id=props.pop("id"),
+                        type=props.pop("type", ""),
+                        label=props.pop("label", ""),
+                        metadata=props,
+                    )
                 )
-                for r in result
-            ]
+            return nodes
+
+    def blast_radius(self, node_id: str, depth: int = 2) -> list[dict]:
+        """Components within *depth* hops (clamped to 1..10) as ``{m, hop}`` rows.
+
+        Uses APOC's BFS traversal when the server has it, and falls back to
+        variable-length path matching when the procedure is missing.
+        """
+        depth = min(max(depth, 1), _MAX_DEPTH)
+        if self._has_apoc is not False:
+            try:
+                rows = self.query(_BLAST_RADIUS_APOC, parameters={"id": node_id, "depth": depth})
+            except Exception as e:
+                if getattr(e, "code", None) != _PROCEDURE_NOT_FOUND:
+                    raise
+                logger.info("APOC not available; blast_radius uses path expansion")
+                self._has_apoc = False
+            else:
+                self._has_apoc = True
+                return rows
+        return self.query(_BLAST_RADIUS_QUERIES[depth], parameters={"id": node_id})
+
+    def components_with_edges(self, type: str | None = None) -> list[dict]:
+        """Components and their outgoing edges in one query.
+
+        Each row has ``n`` (the node) and ``edges``, a list of
+        ``{"target", "relation"}`` maps, so a listing that also needs edges
+        costs one round-trip instead of one per component.
+        """
+        match = "MATCH (n:Component {type: $type}) " if type else "MATCH (n:Component) "
+        return self.query(
+            match + "RETURN n, [(n)-[r:RELATES]->(m:Component) "
+            "| {target: m.id, relation: r.relation}] AS edges",
+            parameters={"type": type} if type else None,
+        )
 
     def query(self, expression: str, parameters: dict[str, Any] | None = None) -> list[dict]:
-        with self._driver.session(database=self._database) as session:
-            result = session.run(expression, parameters=parameters or {})
+        parameters = parameters or {}
+        if self._cache_size <= 0:
+            return self._run_query(expression, parameters)
+
+        try:
+            key = (expression, _freeze(parameters))
+            hash(key)
+        except TypeError:  # unhashable parameter value; skip the cache
+            return self._run_query(expression, parameters)
+
+        now = time.monotonic()
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None and entry[0] > now:
+                self._cache.move_to_end(key)
+                self._hits += 1
+                return list(entry[1])
+            self._misses += 1
+            generation = self._cache_generation
+
+        rows = self._run_query(expression, parameters)
+        with self._cache_lock:
+            if generation != self._cache_generation:
+                return list(rows)
+            self._cache[key] = (now + self._cache_ttl, rows)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return list(rows)
+
+    def _run_query(self, expression: str, parameters: dict[str, Any]) -> list[dict]:
+        with self._session() as session:
+            result = session.run(expression, parameters=parameters)
             return [dict(record) for record in result]
 
     # -- Mnemon sync -----------------------------------------------------------
@@ -95,14 +349,15 @@ class Neo4jGraph:
         if not state or "cards" not in state:
             return
 
+        # Two UNWIND writes in one transaction instead of three per card
+        nodes: dict[str, dict[str, str]] = {}
+        edges: list[dict[str, str]] = []
         for card in state["cards"]:
-            subj = GraphNode(id=card["subject"], type="entity", label=card["subject"])
-            obj = GraphNode(id=card["object"], type="entity", label=card["object"])
-            edge = GraphEdge(
-                source=card["subject"],
-                target=card["object"],
-                relation=card["predicate"],
-            )
-            self.add_node(subj)
-            self.add_node(obj)
-            self.add_edge(edge)
+            subj, obj = card["subject"], card["object"]
+            nodes[subj] = {"id": subj, "type": "entity", "label": subj}
+            nodes[obj] = {"id": obj, "type": "entity", "label": obj}
+            edges.append({"source": subj, "target": obj, "relation": card["predicate"]})
+
+        self.clear_cache()
+        with self._session() as session:
+            session.execute_write(_sync_tx, list(nodes.values()), edges)
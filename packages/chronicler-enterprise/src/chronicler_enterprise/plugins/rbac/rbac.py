@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+from collections import OrderedDict
 
 from chronicler_core.interfaces.rbac import Permission, RBACPlugin
 
@@ -18,6 +20,16 @@ _ACTION_LEVELS: dict[str, int] = {
 }
 
 
+@functools.lru_cache(maxsize=4096)
+def _perm(resource: str, action: str) -> Permission:
+    """Shared, condition-free Permission per (resource, action).
+
+    Permission is frozen, so the convenience helpers can reuse one instance
+    instead of validating a new model on every call.
+    """
+    return Permission(resource=resource, action=action)
+
+
 class ChroniclerRBAC:
     """In-memory RBAC backend with role hierarchy and scope filtering."""
 
@@ -37,10 +49,14 @@ class ChroniclerRBAC:
         "secret": 3,       # admin+
     }
 
+    _CHECK_CACHE_SIZE = 4096
+
     def __init__(self) -> None:
-        self._permissions: dict[str, list[Permission]] = {}
+        self._permissions: dict[str, set[Permission]] = {}
         self._roles: dict[str, str] = {}
         self._scopes: dict[str, str] = {}  # resource -> scope name
+        # (user_id, permission) -> check() result, LRU; cleared on any mutation
+        self._check_cache: OrderedDict[tuple[str, Permission], bool] = OrderedDict()
 
     # -- Protocol methods ------------------------------------------------------
 
@@ -48,10 +64,22 @@ class ChroniclerRBAC:
         """Check if user has the given permission.
 
         Order: direct grants first, then role-based, then scope filtering.
+        Results are memoized until the next grant/revoke/assign_role/set_scope.
         """
+        key = (user_id, permission)
+        cached = self._check_cache.get(key)
+        if cached is not None:
+            self._check_cache.move_to_end(key)
+            return cached
+        result = self._check(user_id, permission)
+        self._check_cache[key] = result
+        if len(self._check_cache) > self._CHECK_CACHE_SIZE:
+            self._check_cache.popitem(last=False)
+        return result
+
+    def _check(self, user_id: str, permission: Permission) -> bool:
         # Direct grant check
-        user_perms = self._permissions.get(user_id, [])
-        if permission in user_perms:
+        if permission in self._permissions.get(user_id, ()):
             return True
 
         # Role-based check
@@ -78,19 +106,19 @@ class ChroniclerRBAC:
 
     def grant(self, user_id: str, permission: Permission) -> None:
         """Grant a permission directly to a user."""
-        self._permissions.setdefault(user_id, [])
-        if permission not in self._permissions[user_id]:
-            self._permissions[user_id].append(permission)
+        self._permissions.setdefault(user_id, set()).add(permission)
+        self._check_cache.clear()
 
     def revoke(self, user_id: str, permission: Permission) -> None:
         """Revoke a previously granted permission."""
-        if user_id not in self._permissions:
-            return
-        self._permissions[user_id] = [p for p in self._permissions[user_id] if p != permission]
+        perms = self._permissions.get(user_id)
+        if perms is not None:
+            perms.discard(permission)
+            self._check_cache.clear()
 
     def list_permissions(self, user_id: str) -> list[Permission]:
         """Return all directly-granted permissions for a user."""
-        return list(self._permissions.get(user_id, []))
+        return list(self._permissions.get(user_id, ()))
 
     # -- Enterprise extensions -------------------------------------------------
 
@@ -99,23 +127,38 @@ class ChroniclerRBAC:
         if role not in self.ROLE_HIERARCHY:
             raise ValueError(f"Unknown role: {role!r} (valid: {list(self.ROLE_HIERARCHY)})")
         self._roles[user_id] = role
+        self._check_cache.clear()
 
     def set_scope(self, resource: str, scope: str) -> None:
         """Set the visibility scope for a resource."""
         if scope not in self.SCOPES:
             raise ValueError(f"Unknown scope: {scope!r} (valid: {sorted(self.SCOPES)})")
         self._scopes[resource] = scope
+        self._check_cache.clear()
 
     def can_read(self, user_id: str, doc: str) -> bool:
         """Convenience: check read permission for a document."""
-        return self.check(user_id, Permission(resource=doc, action="read"))
+        return self.check(user_id, _perm(doc, "read"))
 
     def can_write(self, user_id: str, doc: str) -> bool:
         """Convenience: check write permission for a document."""
-        return self.check(user_id, Permission(resource=doc, action="write"))
+        return self.check(user_id, _perm(doc, "write"))
 
     def visible_docs(self, user_id: str) -> list[str]:
-        """Return list of resources this user can read, based on scopes and role."""
-        read_perm = lambda res: Permission(resource=res, action="read")
-        return [res for res in self._scopes if self.check(user_id, read_perm(res))]
+        """Return list of resources this user can read, based on scopes and role.
+
+        Same rules as ``check(user_id, read)`` per resource, with the role
+        lookup done once instead of per resource.
+        """
+        role = self._roles.get(user_id)
+        level = self.ROLE_HIERARCHY.get(role, 0) if role is not None else 0
+        role_reads = level >= _ACTION_LEVELS["read"]
+        granted = self._permissions.get(user_id)
+        scope_access = self._SCOPE_ACCESS
+        return [
+            res
+            for res, scope in self._scopes.items()
+            if (role_reads and level >= scope_access.get(scope, 0))
+            or (granted and _perm(res, "read") in granted)
+        ]
 
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
-from chronicler_lite.queue.sqlite_queue import SQLiteQueue
-
 __all__ = ["MemVidStorage", "SQLiteQueue"]
 
 
+# Both are lazy so the hook entry points under chronicler_lite.hooks start
+# without importing chronicler_core (and pydantic) on their bail-out paths.
 def __getattr__(name: str):
+    if name == "SQLiteQueue":
+        from chronicler_lite.queue.sqlite_queue import SQLiteQueue
+
+        return SQLiteQueue
     if name == "MemVidStorage":
         from chronicler_lite.storage.memvid_storage import MemVidStorage
 
@@ -4,28 +4,47 @@ Reads the TOOL_INPUT_FILE JSON to extract the written file path,
 then appends it to .chronicler/.stale-candidates for later batch
 staleness checking.
 
-Target: <100ms — no heavy imports.
+Target: <100ms — stdlib only, and json is imported only once the input
+is known to carry a file_path.
 """
 
 from __future__ import annotations
 
-import json
 import logging
+import os
+import re
 import sys
-from pathlib import Path
 
 logger = logging.getLogger("chronicler.hooks")
 
+# directory -> the .chronicler/ dir found above it, filled for every directory
+# visited on a successful walk so later writes in the same tree skip the walk
+_root_cache: dict[str, str] = {}
+
+# chronicler's own output: a .chronicler/ path segment anywhere in the path
+_IGNORE = re.compile(r"(?:^|/)\.chronicler/")
+
 
 def main(tool_input_file: str) -> None:
     try:
-        input_path = Path(tool_input_file)
-        if not input_path.is_file():
+        if not os.path.isfile(tool_input_file):
+            return
+
+        try:
+            with open(tool_input_file, "rb") as f:
+                raw = f.read()
+        except OSError as e:
+            logger.warning("chronicler hook: skipping — %s", e)
             return
+        # Cheap byte check before paying for the json import and parse
+        if b'"file_path"' not in raw:
+            return
+
+        import json
 
         try:
-            data = json.loads(input_path.read_text())
-        except (json.JSONDecodeError, OSError) as e:
+            data = json.loads(raw)
+        except json.JSONDecodeError as e:
             logger.warning("chronicler hook: skipping — %s", e)
             return
         file_path = data.get("file_path")
@@ -33,11 +52,11 @@ def main(tool_input_file: str) -> None:
             return
 
         # Don't track changes to chronicler's own doc output
-        if "/.chronicler/" in file_path or file_path.startswith(".chronicler/"):
+        if _IGNORE.search(file_path):
             return
 
         # Resolve and validate path BEFORE any filesystem operations
-        written_path = Path(file_path).resolve()
+        written_path = os.path.realpath(file_path)
 
         # Find project root by walking up from the written file
         candidates_file = _find_candidates_file(written_path)
@@ -45,30 +64,45 @@ def main(tool_input_file: str) -> None:
             return
 
         # Guard: ensure the written file is under the project root
-        project_root = candidates_file.parent.parent  # .chronicler's parent
-        if not written_path.is_relative_to(project_root):
+        project_root = os.path.dirname(os.path.dirname(candidates_file))  # .chronicler's parent
+        if os.path.commonpath([project_root, written_path]) != project_root:
             return  # path outside project, ignore
 
-        candidates_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(candidates_file, "a") as f:
-            f.write(file_path + "\n")
+        # .chronicler/ was just found on disk, so only the file may need creating.
+        # One O_APPEND write keeps concurrent hook lines whole.
+        fd = os.open(candidates_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, (file_path + "\n").encode())
+        finally:
+            os.close(fd)
     except Exception as e:
         logger.warning("chronicler post_write hook failed: %s", e)
         sys.exit(0)
 
 
-def _find_candidates_file(written: Path) -> Path | None:
-    """Walk up from the written file looking for a .chronicler/ directory."""
-    search = written.resolve().parent
+def _find_candidates_file(written: str) -> str | None:
+    """Walk up from the (resolved) written file looking for a .chronicler/ directory."""
+    search = os.path.dirname(written)
+    visited: list[str] = []
     for _ in range(20):  # cap depth to avoid infinite loop
-        chronicler_dir = search / ".chronicler"
-        if chronicler_dir.is_dir():
-            return chronicler_dir / ".stale-candidates"
-        parent = search.parent
-        if parent == search:
+        cached = _root_cache.get(search)
+        if cached is not None and os.path.isdir(cached):
+            chronicler_dir = cached
+            break
+        visited.append(search)
+        candidate = os.path.join(search, ".chronicler")
+        if os.path.isdir(candidate):
+            chronicler_dir = candidate
             break
+        parent = os.path.dirname(search)
+        if parent == search:
+            return None
         search = parent
-    return None
+    else:
+        return None
+    for d in visited:
+        _root_cache[d] = chronicler_dir
+    return os.path.join(chronicler_dir, ".stale-candidates")
 
 
 if __name__ == "__main__":
@@ -3,17 +3,28 @@
 Only activates for .tech.md files. Checks the merkle tree to see if
 the source file that generated this doc has changed since last scan.
 If stale, prints a warning so the developer knows the doc may be outdated.
+
+The verdict is cached in ``.chronicler/doc-index.json`` alongside the
+source file's mtime and size, so repeat Reads of an unchanged doc cost a small
+JSON read and two ``stat()`` calls instead of a merkle-tree parse and a
+rehash.
 """
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
+import os
 import sys
 from pathlib import Path
 
 logger = logging.getLogger("chronicler.hooks")
 
+# Per-doc cache of (source path, source stat, verdict) keyed by the .tech.md
+# path, valid while merkle-tree.json is unchanged
+DOC_INDEX_FILE = "doc-index.json"
+
 
 def main(tool_input_file: str) -> None:
     try:
@@ -44,31 +55,33 @@ def main(tool_input_file: str) -> None:
         if not tree_file.is_file():
             return
 
-        from chronicler_core.merkle.tree import MerkleTree, compute_file_hash
-
-        tree = MerkleTree.load(tree_file)
-        tree.root_path = str(project_root)
-
-        # Find the merkle node whose doc_path matches this .tech.md
         rel_doc = str(target.relative_to(project_root))
-        source_node = None
-        for node in tree.nodes.values():
-            if node.doc_path == rel_doc:
-                source_node = node
-                break
-
-        if source_node is None or source_node.source_hash is None:
-            return
-
-        source_file = project_root / source_node.path
-        if not source_file.is_file():
-            return
-
-        current_hash = compute_file_hash(source_file)
-        if current_hash != source_node.source_hash:
+        index_file = tree_file.with_name(DOC_INDEX_FILE)
+        index = _load_doc_index(index_file)
+        tree_mtime = tree_file.stat().st_mtime_ns
+
+        entry = index.get(rel_doc)
+        if entry is None or entry.get("tree_mtime_ns") != tree_mtime:
+            entry = _lookup_source(tree_file, project_root, rel_doc)
+            entry["tree_mtime_ns"] = tree_mtime
+        elif entry.get("source") is not None:
+            source_file = project_root / entry["source"]
+            if not source_file.is_file():
+                return
+            st = source_file.stat()
+            if (st.st_mtime_ns, st.st_size) != (entry["mtime_ns"], entry["size"]):
+                # Source touched since the last check: rehash against the tree
+                entry = _lookup_source(tree_file, project_root, rel_doc)
+                entry["tree_mtime_ns"] = tree_mtime
+
+        if index.get(rel_doc) != entry:
+            index[rel_doc] = entry
+            _save_doc_index(index_file, index)
+
+        if entry.get("stale"):
             print(
                 f"Chronicler: WARNING — {rel_doc} is stale. "
-                f"Source file {source_node.path} has changed since last doc generation. "
+                f"Source file {entry['source']} has changed since last doc generation. "
                 f"Run /chronicler regenerate to update."
             )
     except Exception as e:
@@ -76,17 +89,70 @@ def main(tool_input_file: str) -> None:
         sys.exit(0)
 
 
+def _lookup_source(tree_file: Path, project_root: Path, rel_doc: str) -> dict:
+    """Load the merkle tree and hash the source behind *rel_doc*.
+
+    Returns a doc-index entry: the source path plus the stat fingerprint
+    and verdict the next Read can reuse without parsing the tree again.
+    """
+    from chronicler_core.merkle.tree import MerkleTree, compute_file_hash
+
+    tree = MerkleTree.load(tree_file)
+    source_node = tree.by_doc_path.get(rel_doc)
+    if source_node is None or source_node.source_hash is None:
+        return {"source": None}
+
+    source_file = project_root / source_node.path
+    if not source_file.is_file():
+        return {"source": None}
+
+    st = source_file.stat()
+    return {
+        "source": source_node.path,
+        "mtime_ns": st.st_mtime_ns,
+        "size": st.st_size,
+        "stale": compute_file_hash(source_file, tree.algorithm) != source_node.source_hash,
+    }
+
+
+def _load_doc_index(index_file: Path) -> dict:
+    try:
+        index = json.loads(index_file.read_text())
+    except (OSError, ValueError):
+        return {}
+    return index if isinstance(index, dict) else {}
+
+
+def _save_doc_index(index_file: Path, index: dict) -> None:
+    """Write atomically so a concurrent hook never reads a partial file."""
+    tmp = index_file.with_name(f"{index_file.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(json.dumps(index))
+        os.replace(tmp, index_file)
+    except OSError as e:
+        logger.debug("chronicler hook: could not write %s — %s", index_file, e)
+        tmp.unlink(missing_ok=True)
+
+
 def _find_project_root(start: Path) -> Path | None:
     """Walk up from start looking for chronicler.yaml."""
-    search = start.parent if start.is_file() else start
-    for _ in range(20):
-        if (search / "chronicler.yaml").is_file():
-            return search
-        parent = search.parent
-        if parent == search:
-            break
-        search = parent
-    return None
+    return _root_for_dir(start.parent if start.is_file() else start)
+
+
+@functools.lru_cache(maxsize=256)
+def _root_for_dir(directory: Path) -> Path | None:
+    """Nearest ancestor of *directory* (inclusive) holding chronicler.yaml.
+
+    Cached per directory, so docs that share a parent (or any ancestor
+    already visited) resolve without re-walking. Call cache_clear() if a
+    long-lived process needs to see a newly created chronicler.yaml.
+    """
+    if (directory / "chronicler.yaml").is_file():
+        return directory
+    parent = directory.parent
+    if parent == directory:
+        return None
+    return _root_for_dir(parent)
 
 
 if __name__ == "__main__":
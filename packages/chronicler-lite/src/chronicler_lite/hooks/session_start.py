@@ -3,35 +3,65 @@
 Prints a one-line summary of documentation freshness so the developer
 knows immediately if any docs need attention.
 
+The counts are cached in ``.chronicler/status.json`` together with the
+mtimes of the files that change when docs can go stale (merkle-tree.json,
+the post-write hook's .stale-candidates, and .git/index). While those are
+untouched, startup is one small JSON read instead of a full staleness scan.
+
 Target: <200ms for typical projects.
 """
 
 from __future__ import annotations
 
+import json
 import logging
+import os
 import sys
+from pathlib import Path
 
 logger = logging.getLogger("chronicler.hooks")
 
+STATUS_FILE = "status.json"
+_STATUS_VERSION = 1
+
+# Relative to the project root; any change to these invalidates status.json
+_STATUS_DEPS = (
+    ".chronicler/merkle-tree.json",
+    ".chronicler/.stale-candidates",
+    ".git/index",
+)
+
 
 def main(project_path: str | None = None) -> None:
     try:
-        import os
-        from pathlib import Path
-
         project = Path(project_path or os.getcwd()).resolve()
 
         # Quick bail if no chronicler setup in this project
         if not (project / ".chronicler").is_dir():
             return
 
-        from chronicler_core.freshness import check_staleness
+        status_file = project / ".chronicler" / STATUS_FILE
+        deps = _dep_mtimes(project)
+        status = _load_status(status_file, deps)
+        if status is None:
+            from chronicler_core.freshness import check_staleness
 
-        report = check_staleness(project)
+            report = check_staleness(project)
+            status = {
+                "version": _STATUS_VERSION,
+                "deps": deps,
+                "n_stale": len(report.stale),
+                "n_uncovered": len(report.uncovered),
+                "n_orphaned": len(report.orphaned),
+                "total_docs": report.total_docs,
+            }
+            # Without a saved tree the check rebuilds it each time; nothing to key on
+            if deps[0] is not None:
+                _save_status(status_file, status)
 
-        n_stale = len(report.stale)
-        n_uncovered = len(report.uncovered)
-        n_orphaned = len(report.orphaned)
+        n_stale = status["n_stale"]
+        n_uncovered = status["n_uncovered"]
+        n_orphaned = status["n_orphaned"]
 
         if n_stale or n_uncovered or n_orphaned:
             parts = []
@@ -43,12 +73,46 @@ def main(project_path: str | None = None) -> None:
                 parts.append(f"{n_orphaned} orphaned docs")
             print(f"Chronicler: {', '.join(parts)}")
         else:
-            print(f"Chronicler: all docs fresh ({report.total_docs} tracked)")
+            print(f"Chronicler: all docs fresh ({status['total_docs']} tracked)")
     except Exception as e:
         logger.warning("chronicler session_start hook failed: %s", e)
         sys.exit(0)
 
 
+def _dep_mtimes(project: Path) -> list[int | None]:
+    mtimes: list[int | None] = []
+    for rel in _STATUS_DEPS:
+        try:
+            mtimes.append((project / rel).stat().st_mtime_ns)
+        except OSError:
+            mtimes.append(None)
+    return mtimes
+
+
+def _load_status(status_file: Path, deps: list[int | None]) -> dict | None:
+    """Return the cached summary if it was computed against *deps*."""
+    try:
+        status = json.loads(status_file.read_text())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(status, dict) or status.get("version") != _STATUS_VERSION:
+        return None
+    if deps[0] is None or status.get("deps") != deps:
+        return None
+    return status
+
+
+def _save_status(status_file: Path, status: dict) -> None:
+    """Write atomically so a concurrent session never reads a partial file."""
+    tmp = status_file.with_name(f"{status_file.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(json.dumps(status))
+        os.replace(tmp, status_file)
+    except OSError as e:
+        logger.debug("chronicler hook: could not write %s — %s", status_file, e)
+        tmp.unlink(missing_ok=True)
+
+
 if __name__ == "__main__":
     path = sys.argv[1] if len(sys.argv) > 1 else None
     main(path)
@@ -7,6 +7,11 @@ from pathlib import Path
 
 import yaml
 
+try:
+    from yaml import CSafeDumper as _SafeDumper, CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _SafeDumper, SafeLoader as _SafeLoader
+
 
 def _set_nested(data: dict, dotted_key: str, value: str) -> None:
     """Set a value in a nested dict using dot notation (e.g., 'llm.provider')."""
@@ -30,6 +35,10 @@ def _set_nested(data: dict, dotted_key: str, value: str) -> None:
             current[final_key] = value
 
 
+def _dump(data: dict) -> str:
+    return yaml.dump(data, Dumper=_SafeDumper, default_flow_style=False, sort_keys=False)
+
+
 def main(args: list[str] | None = None) -> None:
     if args is None:
         args = sys.argv[1:]
@@ -39,11 +48,11 @@ def main(args: list[str] | None = None) -> None:
         print("No chronicler.yaml found. Run `/chronicler init` first.")
         sys.exit(1)
 
-    data = yaml.safe_load(config_path.read_text()) or {}
+    data = yaml.load(config_path.read_text(), Loader=_SafeLoader) or {}
 
     if not args:
         # No args: just print the current config
-        print(yaml.dump(data, default_flow_style=False, sort_keys=False))
+        print(_dump(data))
         return
 
     # Parse key=value pairs
@@ -55,9 +64,10 @@ def main(args: list[str] | None = None) -> None:
         _set_nested(data, key.strip(), value.strip())
         print(f"  Set {key.strip()} = {value.strip()}")
 
-    config_path.write_text(yaml.dump(data, default_flow_style=False, sort_keys=False))
+    text = _dump(data)
+    config_path.write_text(text)
     print(f"\nUpdated chronicler.yaml:")
-    print(yaml.dump(data, default_flow_style=False, sort_keys=False))
+    print(text)
 
 
 if __name__ == "__main__":
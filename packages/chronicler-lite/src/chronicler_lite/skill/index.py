@@ -2,107 +2,140 @@
 
 from __future__ import annotations
 
+import io
+import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
+_PURPOSE_HEADING_RE = re.compile(r"## Purpose\s*$")
+
+# One INDEX.md table row from a parse_tech_md_metadata entry
+_format_row = "| `{short_path}` | {layer} | {purpose_short} |\n".format_map
+
 
 def parse_tech_md_metadata(path: Path) -> dict | None:
     """Extract component_id, layer, and Purpose text from a single .tech.md file.
 
+    Reads line by line and stops after the first Purpose paragraph, so large
+    tables or code further down the file are never loaded.
+
     Returns None if the file can't be parsed.
     """
     if not path.is_file():
         return None
-    content = path.read_text(encoding="utf-8")
-    if not content.startswith("---"):
-        return None
-    end = content.find("---", 3)
-    if end == -1:
-        return None
-    try:
-        fm = yaml.safe_load(content[3:end])
-    except yaml.YAMLError:
-        return None
-    if not isinstance(fm, dict):
-        return None
+    with path.open("rb") as raw:
+        # Byte check first: files without frontmatter are never decoded
+        if raw.read(3) != b"---":
+            return None
+        raw.seek(0)
+        f = io.TextIOWrapper(raw, encoding="utf-8")
+        first = f.readline()
+
+        # Frontmatter runs from after the opening "---" to the next "---"
+        fm_lines: list[str] = []
+        line, start = first, 3
+        while True:
+            end = line.find("---", start)
+            if end != -1:
+                fm_lines.append(line[start:end])
+                break
+            fm_lines.append(line[start:])
+            line, start = f.readline(), 0
+            if not line:
+                return None
+        try:
+            fm = yaml.load("".join(fm_lines), Loader=_SafeLoader)
+        except yaml.YAMLError:
+            return None
+        if not isinstance(fm, dict):
+            return None
+
+        # Purpose section: first paragraph after "## Purpose"
+        purpose_lines: list[str] = []
+        for line in f:
+            if _PURPOSE_HEADING_RE.match(line):
+                for line in f:
+                    if not purpose_lines:
+                        if line.strip():
+                            purpose_lines.append(line.rstrip("\n"))
+                    elif line == "\n" or line.startswith("##"):
+                        break
+                    else:
+                        purpose_lines.append(line.rstrip("\n"))
+                break
+
+    # Collapse to single line
+    purpose = " ".join("\n".join(purpose_lines).strip().split("\n"))
 
     component_id = fm.get("component_id", "")
-    layer = fm.get("layer", "unknown")
-
-    # Extract Purpose section (first paragraph after "## Purpose")
-    purpose = ""
-    purpose_match = re.search(r"^## Purpose\s*\n(.+?)(?:\n\n|\n##|\Z)", content, re.MULTILINE | re.DOTALL)
-    if purpose_match:
-        purpose = purpose_match.group(1).strip()
-        # Collapse to single line
-        purpose = " ".join(purpose.split("\n"))
+    # An empty "component_id:" loads as None; such entries are skipped later
+    package, subsystem, short_path = _locate_component(
+        component_id if isinstance(component_id, str) else ""
+    )
 
     return {
         "component_id": component_id,
-        "layer": layer,
+        "layer": fm.get("layer", "unknown"),
         "purpose": purpose,
+        # Truncated for INDEX.md table readability
+        "purpose_short": purpose if len(purpose) <= 120 else purpose[:117] + "...",
         "tech_md_filename": path.name,
+        "package": package,
+        "subsystem": subsystem,
+        "short_path": short_path,
     }
 
 
+def _locate_component(component_id: str) -> tuple[str, str, str]:
+    """Split a component_id once into (package, subsystem, short display path).
+
+    e.g. packages/chronicler-core/src/chronicler_core/drafter/drafter.py
+      → ("chronicler-core", "drafter", "chronicler_core/drafter/drafter.py")
+    Root files (no packages/ prefix) map to ("root", "(root)", component_id).
+    """
+    parts = component_id.split("/")
+    if len(parts) < 4 or parts[0] != "packages":
+        return "root", "(root)", component_id
+    package = parts[1]
+    try:
+        src_idx = parts.index("src")
+    except ValueError:
+        return package, "(root)", component_id
+    # parts after src/<pkg_name>/ but before filename
+    sub_parts = parts[src_idx + 2 : -1]
+    subsystem = sub_parts[0] if sub_parts else "(root)"
+    short_path = "/".join(parts[src_idx + 1 :]) if src_idx + 1 < len(parts) else component_id
+    return package, subsystem, short_path
+
+
 def group_by_package(entries: list[dict]) -> dict[str, dict[str, list[dict]]]:
     """Group entries by package name and subsystem.
 
     Returns {package_name: {subsystem: [entries]}}.
-    Root files (no packages/ prefix) go under "root".
+    Root files (no packages/ prefix) go under "root". Entries from
+    parse_tech_md_metadata carry their package/subsystem already.
     """
     grouped: dict[str, dict[str, list[dict]]] = {}
 
     for entry in entries:
-        cid = entry["component_id"]
-        parts = cid.split("/")
-
-        # Detect package: packages/<name>/src/<pkg_name>/...
-        if len(parts) >= 4 and parts[0] == "packages":
-            package = parts[1]
-            # Find subsystem: everything between the Python package root and the filename
-            # e.g. packages/chronicler-core/src/chronicler_core/drafter/drafter.py
-            # → package="chronicler-core", subsystem="drafter"
-            # Find the src/<pkg>/ prefix end
-            src_idx = None
-            for i, p in enumerate(parts):
-                if p == "src":
-                    src_idx = i
-                    break
-            if src_idx is not None and src_idx + 2 < len(parts):
-                # parts after src/<pkg_name>/ but before filename
-                sub_parts = parts[src_idx + 2 : -1]
-                subsystem = sub_parts[0] if sub_parts else "(root)"
-            else:
-                subsystem = "(root)"
+        if "package" in entry:
+            package, subsystem = entry["package"], entry["subsystem"]
         else:
-            package = "root"
-            subsystem = "(root)"
-
+            package, subsystem, _ = _locate_component(entry["component_id"])
         grouped.setdefault(package, {}).setdefault(subsystem, []).append(entry)
 
     return grouped
 
 
-def _short_component_path(component_id: str) -> str:
-    """Shorten component_id for display.
-
-    Strips the packages/<name>/src/<pkg_name>/ prefix for readability.
-    e.g. packages/chronicler-core/src/chronicler_core/drafter/drafter.py
-      → chronicler_core/drafter/drafter.py
-    """
-    parts = component_id.split("/")
-    if len(parts) >= 4 and parts[0] == "packages":
-        # Find src/ and skip to the package root after it
-        for i, p in enumerate(parts):
-            if p == "src" and i + 1 < len(parts):
-                return "/".join(parts[i + 1 :])
-    return component_id
-
-
 def _subsystem_display_name(subsystem: str) -> str:
     """Format subsystem name for section headers."""
     if subsystem == "(root)":
@@ -116,23 +149,29 @@ def build_index(project_path: Path) -> Path:
     if not chronicler_dir.is_dir():
         chronicler_dir.mkdir(parents=True, exist_ok=True)
 
-    # Collect metadata from all .tech.md files
-    entries = []
-    for md in sorted(chronicler_dir.glob("*.tech.md")):
-        meta = parse_tech_md_metadata(md)
-        if meta and meta["component_id"]:
-            entries.append(meta)
+    # Collect metadata from all .tech.md files. Parsing is mostly file I/O,
+    # so fan it out over threads; map() keeps the sorted order.
+    paths = sorted(chronicler_dir.glob("*.tech.md"))
+    if len(paths) > 1:
+        workers = min(len(paths), 32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            metas = list(pool.map(parse_tech_md_metadata, paths))
+    else:
+        metas = [parse_tech_md_metadata(md) for md in paths]
+    entries = [meta for meta in metas if meta and meta["component_id"]]
 
     grouped = group_by_package(entries)
 
     # Build markdown
-    lines = [
-        "# Chronicler Technical Index",
-        "",
-        "> Read this file first when exploring the codebase. For details on any component, read its `.tech.md` file.",
-        "> Naming convention: `path/to/file.py` → `.chronicler/path--to--file.py.tech.md`",
-        "",
-    ]
+    buf = io.StringIO()
+    w = buf.write
+    w(
+        "# Chronicler Technical Index\n"
+        "\n"
+        "> Read this file first when exploring the codebase. For details on any component, read its `.tech.md` file.\n"
+        "> Naming convention: `path/to/file.py` → `.chronicler/path--to--file.py.tech.md`\n"
+        "\n"
+    )
 
     # Package display order: "root" first, then alphabetical
     pkg_order = sorted(grouped.keys(), key=lambda k: ("" if k == "root" else k))
@@ -149,30 +188,21 @@ def build_index(project_path: Path) -> Path:
     for pkg in pkg_order:
         subsystems = grouped[pkg]
         label = pkg_labels.get(pkg, pkg)
-        lines.append(f"## {label}")
-        lines.append("")
+        w(f"## {label}\n\n")
 
         sub_order = sorted(subsystems.keys(), key=lambda k: ("" if k == "(root)" else k))
 
         for sub in sub_order:
             sub_entries = subsystems[sub]
             if len(subsystems) > 1 or sub != "(root)":
-                lines.append(f"### {_subsystem_display_name(sub)}")
-            lines.append("| Component | Layer | Purpose |")
-            lines.append("|-----------|-------|---------|")
-
-            for entry in sub_entries:
-                short = _short_component_path(entry["component_id"])
-                purpose = entry["purpose"]
-                # Truncate long purposes for table readability
-                if len(purpose) > 120:
-                    purpose = purpose[:117] + "..."
-                lines.append(f"| `{short}` | {entry['layer']} | {purpose} |")
+                w(f"### {_subsystem_display_name(sub)}\n")
+            w("| Component | Layer | Purpose |\n|-----------|-------|---------|\n")
 
-            lines.append("")
+            w("".join(map(_format_row, sub_entries)))
+            w("\n")
 
     index_path = chronicler_dir / "INDEX.md"
-    index_path.write_text("\n".join(lines), encoding="utf-8")
+    index_path.write_text(buf.getvalue(), encoding="utf-8")
     print(f"  INDEX.md generated: {len(entries)} components indexed")
     return index_path
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import re
 import sys
 from pathlib import Path
@@ -27,9 +28,18 @@ PROJECT_MARKERS: dict[str, str] = {
 
 
 def detect_project_type(project_path: Path) -> str | None:
-    """Scan for known marker files and return the project type."""
+    """Scan for known marker files and return the project type.
+
+    One directory read instead of a stat per marker; markers are still
+    checked in PROJECT_MARKERS order so the result is deterministic.
+    """
+    try:
+        with os.scandir(project_path) as it:
+            found = {entry.name for entry in it}
+    except OSError:
+        return None
     for marker, lang in PROJECT_MARKERS.items():
-        if (project_path / marker).exists():
+        if marker in found:
             return lang
     return None
 
@@ -45,12 +55,25 @@ def generate_config(project_path: Path) -> Path:
     return config_path
 
 
-def build_merkle(project_path: Path) -> MerkleTree:
-    """Build and save the merkle tree for drift tracking."""
-    tree = MerkleTree.build(project_path.resolve())
+def build_merkle(project_path: Path, algorithm: str = "sha256") -> MerkleTree:
+    """Build and save the merkle tree for drift tracking.
+
+    Files unchanged (same mtime and size) since a previous tree was saved
+    reuse their recorded hash instead of being read again.
+    """
     out_dir = project_path / ".chronicler"
-    out_dir.mkdir(parents=True, exist_ok=True)
     tree_path = out_dir / "merkle-tree.json"
+    stat_cache = None
+    if tree_path.is_file():
+        try:
+            previous = MerkleTree.load(tree_path)
+        except (OSError, ValueError, KeyError):
+            previous = None
+        if previous is not None and previous.algorithm == algorithm:
+            stat_cache = previous.stat_cache()
+
+    tree = MerkleTree.build(project_path.resolve(), algorithm=algorithm, stat_cache=stat_cache)
+    out_dir.mkdir(parents=True, exist_ok=True)
     tree.save(tree_path)
     node_count = sum(1 for n in tree.nodes.values() if n.source_hash is not None)
     print(f"  Merkle tree built: {node_count} files indexed")
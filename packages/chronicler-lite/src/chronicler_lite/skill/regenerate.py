@@ -33,21 +33,24 @@ def main(file_path: str | None = None) -> None:
         print("All documentation is fresh. Nothing to regenerate.")
         return
 
+    out: list[str] = []
     if result.regenerated:
-        print(f"Regenerated ({len(result.regenerated)}):")
+        out.append(f"Regenerated ({len(result.regenerated)}):")
         for path in result.regenerated:
-            print(f"  {path}")
+            out.append(f"  {path}")
 
     if result.skipped:
-        print(f"\nStale but skipped ({len(result.skipped)}) — no drafter configured:")
+        out.append(f"\nStale but skipped ({len(result.skipped)}) — no drafter configured:")
         for path in result.skipped:
-            print(f"  {path}")
-        print(f"\nConfigure an LLM provider in chronicler.yaml to enable auto-regeneration.")
+            out.append(f"  {path}")
+        out.append(f"\nConfigure an LLM provider in chronicler.yaml to enable auto-regeneration.")
 
     if result.failed:
-        print(f"\nFailed ({len(result.failed)}):")
+        out.append(f"\nFailed ({len(result.failed)}):")
         for path, reason in result.failed:
-            print(f"  {path}: {reason}")
+            out.append(f"  {path}: {reason}")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
     # Rebuild INDEX.md if any files were regenerated
     if result.regenerated:
@@ -22,27 +22,32 @@ def main(project_path: str | None = None) -> None:
 
     fresh_count = report.total_files - len(report.stale) - len(report.uncovered)
 
-    print(f"Chronicler Status: {root.name}\n")
-    print(f"  {'Category':<14} {'Count':>6}")
-    print(f"  {'-' * 14} {'-' * 6}")
-    print(f"  {'Fresh':<14} {fresh_count:>6}")
-    print(f"  {'Stale':<14} {len(report.stale):>6}")
-    print(f"  {'Uncovered':<14} {len(report.uncovered):>6}")
-    print(f"  {'Orphaned':<14} {len(report.orphaned):>6}")
-    print(f"  {'-' * 14} {'-' * 6}")
-    print(f"  {'Total files':<14} {report.total_files:>6}")
-    print(f"  {'Total docs':<14} {report.total_docs:>6}")
+    # Collected and written once instead of a print (and stdout lock) per line
+    out = [
+        f"Chronicler Status: {root.name}\n",
+        f"  {'Category':<14} {'Count':>6}",
+        f"  {'-' * 14} {'-' * 6}",
+        f"  {'Fresh':<14} {fresh_count:>6}",
+        f"  {'Stale':<14} {len(report.stale):>6}",
+        f"  {'Uncovered':<14} {len(report.uncovered):>6}",
+        f"  {'Orphaned':<14} {len(report.orphaned):>6}",
+        f"  {'-' * 14} {'-' * 6}",
+        f"  {'Total files':<14} {report.total_files:>6}",
+        f"  {'Total docs':<14} {report.total_docs:>6}",
+    ]
 
     if report.stale:
-        print(f"\nStale files:")
+        out.append(f"\nStale files:")
         for entry in report.stale:
             doc_label = entry.doc_path or "(no doc)"
-            print(f"  {entry.source_path}  ->  {doc_label}")
+            out.append(f"  {entry.source_path}  ->  {doc_label}")
 
     if report.orphaned:
-        print(f"\nOrphaned docs (no matching source):")
+        out.append(f"\nOrphaned docs (no matching source):")
         for path in report.orphaned:
-            print(f"  {path}")
+            out.append(f"  {path}")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == "__main__":
@@ -8,7 +8,13 @@ from pathlib import Path
 import yaml
 from memvid_sdk import Memvid
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # libyaml not available
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 from chronicler_core.interfaces.storage import SearchResult
+from chronicler_core.output.frontmatter import split_frontmatter
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +24,8 @@ class MemVidStorage:
 
     Opens an existing .mv2 file or creates one from scratch.
     All writes are committed immediately so callers don't need to
-    think about flush semantics.
+    think about flush semantics; rebuild() stages every document and
+    commits once at the end.
     """
 
     def __init__(
@@ -39,12 +46,7 @@ class MemVidStorage:
 
     def store(self, doc_id: str, content: str, metadata: dict) -> None:
         """Write a document into the .mv2 file."""
-        self._mem.put(
-            text=content,
-            title=doc_id,
-            label="tech.md",
-            metadata=metadata,
-        )
+        self._put(doc_id, content, metadata)
         self._mem.commit()
 
     def search(
@@ -85,16 +87,7 @@ class MemVidStorage:
 
         Each edge dict should have at least 'entity', 'slot', and 'value' keys.
         """
-        cards = [
-            {
-                "entity": edge.get("entity", doc_id),
-                "slot": edge["slot"],
-                "value": edge["value"],
-            }
-            for edge in edges
-        ]
-        if cards:
-            self._mem.add_memory_cards(cards)
+        if self._add_cards(doc_id, edges):
             self._mem.commit()
 
     def rebuild(self, tech_md_dir: str) -> None:
@@ -104,17 +97,50 @@ class MemVidStorage:
         and enriches with any edges found in the frontmatter.
         """
         md_dir = Path(tech_md_dir)
-        for md_path in sorted(md_dir.glob("*.tech.md")):
-            raw = md_path.read_text(encoding="utf-8")
-            frontmatter, body = _split_frontmatter(raw)
-            doc_id = md_path.stem  # "foo.tech" from "foo.tech.md"
-            metadata = frontmatter if frontmatter else {}
-
-            self.store(doc_id, body, metadata)
+        pending = False
+        try:
+            for md_path in sorted(md_dir.glob("*.tech.md")):
+                raw = md_path.read_text(encoding="utf-8")
+                frontmatter, body = _split_frontmatter(raw)
+                doc_id = md_path.stem  # "foo.tech" from "foo.tech.md"
+                metadata = frontmatter if frontmatter else {}
+
+                self._put(doc_id, body, metadata)
+                pending = True
+
+                edges = metadata.get("edges", [])
+                if edges:
+                    self._add_cards(doc_id, edges)
+        finally:
+            # One flush for the whole rebuild; still keep what was written on error
+            if pending:
+                self._mem.commit()
+
+    # -- Internals -------------------------------------------------------------
+
+    def _put(self, doc_id: str, content: str, metadata: dict) -> None:
+        """Stage a document without committing."""
+        self._mem.put(
+            text=content,
+            title=doc_id,
+            label="tech.md",
+            metadata=metadata,
+        )
 
-            edges = metadata.get("edges", [])
-            if edges:
-                self.enrich_from_frontmatter(doc_id, edges)
+    def _add_cards(self, doc_id: str, edges: list[dict]) -> bool:
+        """Stage memory cards for *edges* without committing. True if any were added."""
+        cards = [
+            {
+                "entity": edge.get("entity", doc_id),
+                "slot": edge["slot"],
+                "value": edge["value"],
+            }
+            for edge in edges
+        ]
+        if not cards:
+            return False
+        self._mem.add_memory_cards(cards)
+        return True
 
 
 def _split_frontmatter(text: str) -> tuple[dict, str]:
@@ -123,15 +149,12 @@ def _split_frontmatter(text: str) -> tuple[dict, str]:
     Expects optional YAML frontmatter between '---' fences at the top.
     Returns ({}, full_text) when no frontmatter is found.
     """
-    if not text.startswith("---"):
-        return {}, text
-
-    parts = text.split("---", 2)
-    if len(parts) < 3:
+    fm_text, body = split_frontmatter(text)
+    if fm_text is None:
         return {}, text
 
     try:
-        fm = yaml.safe_load(parts[1])
+        fm = yaml.load(fm_text, Loader=_SafeLoader)
     except yaml.YAMLError as e:
         logger.warning("Failed to parse YAML frontmatter: %s", e)
         return {}, text
@@ -139,4 +162,4 @@ def _split_frontmatter(text: str) -> tuple[dict, str]:
     if not isinstance(fm, dict):
         return {}, text
 
-    return fm, parts[2].lstrip("\n")
+    return fm, body.lstrip("\n")
@@ -1,6 +1,23 @@
 """Obsidian vault sync daemon for Chronicler."""
 
-from .sync import ObsidianSync
-from .models import SyncReport, SyncError
+from __future__ import annotations
 
 __all__ = ["ObsidianSync", "SyncReport", "SyncError"]
+
+# Resolved on first access so `chronicler obsidian map` doesn't import the
+# sync daemon (and its HTTP stack) just to reach map_generator.
+_class_map = {
+    "ObsidianSync": ".sync",
+    "SyncReport": ".models",
+    "SyncError": ".models",
+}
+
+
+def __getattr__(name: str):
+    import importlib
+
+    if name in _class_map:
+        mod = importlib.import_module(_class_map[name], __name__)
+        return getattr(mod, name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
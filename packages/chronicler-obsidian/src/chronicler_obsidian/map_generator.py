@@ -6,50 +6,95 @@ can draw connections between components without duplicating .tech.md content.
 
 from __future__ import annotations
 
+import functools
+import io
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # libyaml not available
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
 
-def parse_tech_md_edges(tech_md_path: Path) -> list[dict]:
-    """Parse YAML frontmatter from a .tech.md file and return its edges list.
+from chronicler_core.output.frontmatter import split_frontmatter
 
-    Each edge is expected to have at least a 'target' key, and optionally 'type'.
-    """
-    if not tech_md_path.is_file():
-        return []
-    content = tech_md_path.read_text(encoding="utf-8")
-    if not content.startswith("---"):
-        return []
-    end = content.find("---", 3)
-    if end == -1:
-        return []
+
+@functools.lru_cache(maxsize=4096)
+def _cached_frontmatter(path: str, mtime_ns: int, size: int) -> dict | None:
+    """Parse the frontmatter of *path*; the stat fields only key the cache."""
+    with open(path, encoding="utf-8") as f:
+        content = f.read()
+    fm_text, _body = split_frontmatter(content)
+    if fm_text is None:
+        return None
     try:
-        fm = yaml.safe_load(content[3:end])
+        fm = yaml.load(fm_text, Loader=_SafeLoader)
     except yaml.YAMLError:
-        return []
-    if not isinstance(fm, dict):
+        return None
+    return fm if isinstance(fm, dict) else None
+
+
+def _load_frontmatter(tech_md_path: Path) -> dict | None:
+    """Return the parsed frontmatter dict, or None if absent or invalid.
+
+    Results are cached on (path, mtime_ns, size), so asking for the edges and
+    the component_id of the same unchanged file reads and parses it once.
+    Callers must not mutate the returned dict.
+    """
+    st = tech_md_path.stat()
+    return _cached_frontmatter(str(tech_md_path), st.st_mtime_ns, st.st_size)
+
+_MAP_HEADER = """\
+---
+title: "{project_name} Component Map"
+tags: [chronicler-map]
+cssclass: chronicler-map
+---
+
+"""
+
+
+def _edges_of(fm: dict | None) -> list[dict]:
+    if fm is None:
         return []
     edges = fm.get("edges", [])
     if not isinstance(edges, list):
         return []
-    return edges
+    return list(edges)
+
+
+def _component_id_of(fm: dict | None, tech_md_path: Path) -> str:
+    if fm is not None and "component_id" in fm:
+        return fm["component_id"]
+    return tech_md_path.stem.replace(".tech", "")
+
+
+def parse_tech_md_edges(tech_md_path: Path) -> list[dict]:
+    """Parse YAML frontmatter from a .tech.md file and return its edges list.
+
+    Each edge is expected to have at least a 'target' key, and optionally 'type'.
+    """
+    if not tech_md_path.is_file():
+        return []
+    return _edges_of(_load_frontmatter(tech_md_path))
 
 
 def parse_component_id(tech_md_path: Path) -> str:
     """Extract component_id from frontmatter, falling back to filename stem."""
-    content = tech_md_path.read_text(encoding="utf-8")
-    component_id = tech_md_path.stem.replace(".tech", "")
-    if content.startswith("---"):
-        end = content.find("---", 3)
-        if end != -1:
-            try:
-                fm = yaml.safe_load(content[3:end])
-                if isinstance(fm, dict) and "component_id" in fm:
-                    component_id = fm["component_id"]
-            except yaml.YAMLError:
-                pass
-    return component_id
+    return _component_id_of(_load_frontmatter(tech_md_path), tech_md_path)
+
+
+def _parse_frontmatter_once(tech_md_path: Path) -> tuple[str, list[dict]]:
+    """Return (component_id, edges) from one stat and at most one read+parse."""
+    st = tech_md_path.stat()
+    fm = None
+    if stat.S_ISREG(st.st_mode):
+        fm = _cached_frontmatter(str(tech_md_path), st.st_mtime_ns, st.st_size)
+    return _component_id_of(fm, tech_md_path), _edges_of(fm)
 
 
 def build_edge_graph(chronicler_dir: Path) -> dict[str, list[dict]]:
@@ -57,9 +102,15 @@ def build_edge_graph(chronicler_dir: Path) -> dict[str, list[dict]]:
     graph: dict[str, list[dict]] = {}
     if not chronicler_dir.is_dir():
         return graph
-    for md in sorted(chronicler_dir.glob("*.tech.md")):
-        edges = parse_tech_md_edges(md)
-        component_id = parse_component_id(md)
+    paths = sorted(chronicler_dir.glob("*.tech.md"))
+    if len(paths) > 1:
+        workers = min(len(paths), 32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            parsed = list(pool.map(_parse_frontmatter_once, paths))
+    else:
+        parsed = [_parse_frontmatter_once(md) for md in paths]
+    # pool.map keeps input order, so later duplicates still win as before
+    for component_id, edges in parsed:
         graph[component_id] = edges
     return graph
 
@@ -69,6 +120,8 @@ class MapGenerator:
 
     def __init__(self, chronicler_dir: Path) -> None:
         self.chronicler_dir = chronicler_dir
+        # Only the title varies, and only with chronicler_dir; render it once
+        self._header = _MAP_HEADER.format(project_name=self._derive_project_name())
 
     def _derive_project_name(self) -> str:
         """Get the project name from the parent directory."""
@@ -80,36 +133,34 @@ class MapGenerator:
     def generate(self) -> str:
         """Build _map.md content from .tech.md edges."""
         graph = build_edge_graph(self.chronicler_dir)
-        project_name = self._derive_project_name()
 
-        lines = [
-            "---",
-            f'title: "{project_name} Component Map"',
-            "tags: [chronicler-map]",
-            "cssclass: chronicler-map",
-            "---",
-            "",
-        ]
+        buf = io.StringIO()
+        w = buf.write
+        w(self._header)
 
         if not graph:
-            lines.append("No components found.")
-            return "\n".join(lines) + "\n"
+            w("No components found.\n")
+            return buf.getvalue()
 
+        first = True
         for component_id, edges in graph.items():
-            lines.append(f"## {component_id}")
+            if not first:
+                w("\n")
+            first = False
+            w(f"## {component_id}\n")
 
             if not edges:
-                lines.append("- (no edges)")
-            else:
-                for edge in edges:
-                    target = edge.get("target", "unknown")
-                    edge_type = edge.get("type", "")
-                    suffix = f" ({edge_type})" if edge_type else ""
-                    lines.append(f"- [[{target}]]{suffix}")
-
-            lines.append("")
-
-        return "\n".join(lines)
+                w("- (no edges)\n")
+                continue
+            for edge in edges:
+                target = edge.get("target", "unknown")
+                edge_type = edge.get("type", "")
+                if edge_type:
+                    w(f"- [[{target}]] ({edge_type})\n")
+                else:
+                    w(f"- [[{target}]]\n")
+
+        return buf.getvalue()
 
     def write(self) -> Path:
         """Write _map.md to the .chronicler/ directory. Returns the path."""
@@ -1,21 +1,102 @@
 """ObsidianSync daemon — exports .tech.md files to an Obsidian vault."""
 
 import hashlib
+import json
 import os
 import signal
 import time
 import logging
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from urllib.parse import quote
 
 import yaml
-import requests
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # libyaml not available
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
 
 from chronicler_core.config import ObsidianConfig
+from chronicler_core.output.frontmatter import split_frontmatter
 from chronicler_obsidian.models import SyncReport, SyncError
 
 logger = logging.getLogger(__name__)
 
+# Sidecar in source_dir that carries the content hashes across runs.
+STATE_FILE = "obsidian-sync.json"
+_STATE_VERSION = 2
+
+# A file modified this close to the scan could change again within the same
+# mtime tick; its stat is not trusted and it gets rehashed next time.
+_RACY_WINDOW_NS = 2_000_000_000
+
+# Concurrent PUTs (and pooled connections) for sync_rest.
+_REST_WORKERS = 16
+
+
+def _requests():
+    """Import requests on first use; it dominates this module's import time."""
+    mod = globals().get("requests")
+    if mod is None:
+        import requests as mod
+
+        globals()["requests"] = mod
+    return mod
+
+
+def __getattr__(name: str):
+    # Keeps ``chronicler_obsidian.sync.requests`` reachable (and patchable)
+    if name == "requests":
+        return _requests()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _file_sha256(path: Path) -> str:
+    """SHA-256 of the raw file bytes, streamed without decoding."""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def _iter_tech_md(root: Path) -> Iterator[tuple[str, os.DirEntry]]:
+    """Yield ``(relative_path, entry)`` for every .tech.md file under *root*.
+
+    Walks with :func:`os.scandir` so the directory listing tells files from
+    directories, and the entry's cached stat is reused by the caller.
+    """
+
+    def walk(path: str, prefix: str) -> Iterator[tuple[str, os.DirEntry]]:
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except PermissionError:
+            return
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from walk(entry.path, prefix + entry.name + os.sep)
+            elif entry.name.endswith(".tech.md") and entry.is_file():
+                yield prefix + entry.name, entry
+
+    return walk(str(root), "")
+
+
+def _fingerprint(
+    cache: dict[str, list], rel: str, path: Path, st: os.stat_result, racy_after: int
+) -> tuple[list, bool]:
+    """Return ([size, mtime_ns, sha256], unchanged) for *path* against *cache*.
+
+    A matching (size, mtime_ns) skips hashing entirely; otherwise the file is
+    hashed and compared, so a touch without edits still counts as unchanged.
+    """
+    cached = cache.get(rel)
+    if cached is not None and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+        return cached, True
+    digest = _file_sha256(path)
+    mtime_ns = st.st_mtime_ns if st.st_mtime_ns < racy_after else None
+    entry = [st.st_size, mtime_ns, digest]
+    return entry, cached is not None and cached[2] == digest
+
 
 class ObsidianSync:
     def __init__(self, source_dir: str, vault_path: str, config: ObsidianConfig, pipeline):
@@ -30,7 +111,16 @@ class ObsidianSync:
         self.vault_path = Path(vault_path)
         self.config = config
         self.pipeline = pipeline
-        self._content_hashes: dict[str, str] = {}
+        # Resolved once; per-file traversal checks compare against it
+        self._vault_root = self.vault_path.resolve()
+        self._vault_root_str = str(self._vault_root)
+        self._vault_prefix = os.path.join(self._vault_root_str, "")
+        self._state_file = self.source_dir / STATE_FILE
+        state = self._load_state()
+        # rel -> [size, mtime_ns, sha256]
+        self._content_hashes: dict[str, list] = state.get("hashes", {})
+        # Per REST endpoint, so a file export never masks a pending upload
+        self._rest_hashes: dict[str, dict[str, list]] = state.get("rest", {})
 
     # -- Public API ----------------------------------------------------------
 
@@ -38,34 +128,22 @@ class ObsidianSync:
         """One-shot sync: scan .tech.md files, transform, write to vault."""
         start = time.monotonic()
         report = SyncReport()
+        racy_after = time.time_ns() - _RACY_WINDOW_NS
+        checked_dirs: dict[str, bool] = {}
 
-        for source_path in self.source_dir.rglob("*.tech.md"):
-            rel = str(source_path.relative_to(self.source_dir))
+        for rel, dir_entry in _iter_tech_md(self.source_dir):
+            source_path = Path(dir_entry.path)
             try:
-                content = source_path.read_text()
-                content_hash = hashlib.sha256(content.encode()).hexdigest()
-
-                if self._content_hashes.get(rel) == content_hash:
+                if not self._export_file(rel, source_path, dir_entry.stat(), racy_after, checked_dirs):
                     report.skipped += 1
                     continue
-
-                metadata, _body = self._parse_frontmatter(content)
-                transformed = self.pipeline.apply(content, metadata)
-
-                vault_file = self.vault_path / rel.replace(".tech.md", ".md")
-                if not vault_file.resolve().is_relative_to(self.vault_path.resolve()):
-                    report.errors.append(SyncError(file=rel, error="Path traversal detected"))
-                    continue
-                vault_file.parent.mkdir(parents=True, exist_ok=True)
-                vault_file.write_text(transformed)
-
-                self._content_hashes[rel] = content_hash
                 report.synced += 1
                 logger.info(f"Synced: {rel}")
             except Exception as exc:
                 report.errors.append(SyncError(file=rel, error=str(exc)))
                 logger.error(f"Error syncing {rel}: {exc}")
 
+        self._save_hashes()
         report.duration = time.monotonic() - start
         return report
 
@@ -123,11 +201,14 @@ class ObsidianSync:
         finally:
             observer.stop()
             observer.join()
+            self._save_hashes()
             logger.info("Watcher stopped.")
 
     def sync_rest(self, api_url: str | None = None, token: str | None = None) -> SyncReport:
         """Sync transformed files to Obsidian via the Local REST API plugin."""
         import urllib3
+
+        requests = _requests()
         urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
         url = (api_url or self.config.rest_api.url).rstrip("/")
@@ -144,73 +225,179 @@ class ObsidianSync:
 
         start = time.monotonic()
         report = SyncReport()
+        sent = self._rest_hashes.setdefault(url, {})
+        racy_after = time.time_ns() - _RACY_WINDOW_NS
 
-        for source_path in self.source_dir.rglob("*.tech.md"):
-            rel = str(source_path.relative_to(self.source_dir))
+        # Render changed files first, then upload them concurrently
+        work: list[tuple[str, list, str, bytes]] = []
+        for rel, dir_entry in _iter_tech_md(self.source_dir):
+            source_path = Path(dir_entry.path)
             try:
-                content = source_path.read_text()
-                content_hash = hashlib.sha256(content.encode()).hexdigest()
+                entry, unchanged = _fingerprint(
+                    sent, rel, source_path, dir_entry.stat(), racy_after
+                )
 
-                if self._content_hashes.get(rel) == content_hash:
+                if unchanged:
+                    sent[rel] = entry
                     report.skipped += 1
                     continue
 
+                content = source_path.read_text(encoding="utf-8")
                 metadata, _body = self._parse_frontmatter(content)
                 transformed = self.pipeline.apply(content, metadata)
-
-                vault_rel = rel.replace(".tech.md", ".md")
-                safe_vault_rel = quote(vault_rel, safe="/")
-                resp = requests.put(
-                    f"{url}/vault/{safe_vault_rel}",
-                    headers=headers,
-                    data=transformed.encode("utf-8"),
-                    verify=False,
-                )
-                resp.raise_for_status()
-
-                self._content_hashes[rel] = content_hash
-                report.synced += 1
-                logger.info(f"PUT {vault_rel} -> {resp.status_code}")
+                work.append((rel, entry, rel.replace(".tech.md", ".md"), transformed.encode("utf-8")))
             except Exception as exc:
                 report.errors.append(SyncError(file=rel, error=str(exc)))
                 logger.error(f"REST sync error for {rel}: {exc}")
 
+        if work:
+            workers = min(_REST_WORKERS, len(work))
+            with requests.Session() as session:
+                # One keep-alive pool shared by all workers
+                adapter = requests.adapters.HTTPAdapter(pool_maxsize=workers)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+
+                def put(item: tuple[str, list, str, bytes]):
+                    _rel, _entry, vault_rel, data = item
+                    try:
+                        resp = session.put(
+                            f"{url}/vault/{quote(vault_rel, safe='/')}",
+                            headers=headers,
+                            data=data,
+                            verify=False,
+                        )
+                        resp.raise_for_status()
+                        return resp, None
+                    except Exception as exc:
+                        return None, exc
+
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    results = list(pool.map(put, work))
+
+            for (rel, entry, vault_rel, _data), (resp, exc) in zip(work, results):
+                if exc is not None:
+                    report.errors.append(SyncError(file=rel, error=str(exc)))
+                    logger.error(f"REST sync error for {rel}: {exc}")
+                    continue
+                sent[rel] = entry
+                report.synced += 1
+                logger.info(f"PUT {vault_rel} -> {resp.status_code}")
+
+        self._save_hashes()
         report.duration = time.monotonic() - start
         return report
 
     # -- Internals -----------------------------------------------------------
 
     def _sync_single_file(self, source_path: Path) -> bool:
-        """Transform and write a single .tech.md file. Returns True on success."""
+        """Transform and write a single .tech.md file. Returns True on success.
+
+        Editor autosaves that leave the content unchanged are a no-op.
+        """
         try:
-            content = source_path.read_text()
-            metadata, _body = self._parse_frontmatter(content)
-            transformed = self.pipeline.apply(content, metadata)
-
-            rel = source_path.relative_to(self.source_dir)
-            vault_file = self.vault_path / str(rel).replace(".tech.md", ".md")
-            if not vault_file.resolve().is_relative_to(self.vault_path.resolve()):
-                logger.error(f"Path traversal detected: {rel}")
-                return False
-            vault_file.parent.mkdir(parents=True, exist_ok=True)
-            vault_file.write_text(transformed)
-
-            self._content_hashes[str(rel)] = hashlib.sha256(content.encode()).hexdigest()
-            logger.info(f"Synced: {rel}")
+            rel = str(source_path.relative_to(self.source_dir))
+            racy_after = time.time_ns() - _RACY_WINDOW_NS
+            if self._export_file(rel, source_path, source_path.stat(), racy_after, {}):
+                logger.info(f"Synced: {rel}")
             return True
         except Exception as exc:
             logger.error(f"Error syncing {source_path}: {exc}")
             return False
 
+    def _export_file(
+        self,
+        rel: str,
+        source_path: Path,
+        st: os.stat_result,
+        racy_after: int,
+        checked_dirs: dict[str, bool],
+    ) -> bool:
+        """Render *source_path* into the vault unless it is unchanged.
+
+        Returns True if the vault file was written, False if skipped. Raises
+        ValueError when the target would land outside the vault.
+        """
+        entry, unchanged = _fingerprint(self._content_hashes, rel, source_path, st, racy_after)
+        vault_file = self.vault_path / rel.replace(".tech.md", ".md")
+
+        # Hashes may come from an earlier run; re-export if the vault copy is gone
+        if unchanged and vault_file.exists():
+            self._content_hashes[rel] = entry
+            return False
+
+        content = source_path.read_text(encoding="utf-8")
+        metadata, _body = self._parse_frontmatter(content)
+        transformed = self.pipeline.apply(content, metadata)
+
+        if not self._inside_vault(vault_file, checked_dirs):
+            raise ValueError("Path traversal detected")
+        vault_file.parent.mkdir(parents=True, exist_ok=True)
+        vault_file.write_text(transformed)
+
+        self._content_hashes[rel] = entry
+        return True
+
+    def _inside_vault(self, vault_file: Path, checked_dirs: dict[str, bool]) -> bool:
+        """Whether writing *vault_file* stays inside the vault once symlinks resolve.
+
+        Each target directory is resolved once per run (cached in
+        *checked_dirs*); the file itself only needs resolving when it is a
+        symlink, which a single lstat tells us.
+        """
+        parent = os.path.dirname(vault_file)
+        inside = checked_dirs.get(parent)
+        if inside is None:
+            inside = checked_dirs[parent] = self._is_under_root(os.path.realpath(parent))
+        if inside and os.path.islink(vault_file):
+            inside = self._is_under_root(os.path.realpath(vault_file))
+        return inside
+
+    def _is_under_root(self, real: str) -> bool:
+        return real == self._vault_root_str or real.startswith(self._vault_prefix)
+
+    def _state_key(self) -> dict:
+        """What the saved hashes were rendered against; a mismatch discards them."""
+        transforms = getattr(self.pipeline, "transforms", None) or []
+        return {
+            "version": _STATE_VERSION,
+            "vault": self._vault_root_str,
+            "transforms": [type(t).__name__ for t in transforms],
+        }
+
+    def _load_state(self) -> dict:
+        try:
+            state = json.loads(self._state_file.read_text())
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(state, dict) or state.get("key") != self._state_key():
+            return {}
+        if not isinstance(state.get("hashes"), dict) or not isinstance(state.get("rest"), dict):
+            return {}
+        return state
+
+    def _save_hashes(self) -> None:
+        """Write atomically so a concurrent run never reads a partial file."""
+        if not self.source_dir.is_dir():
+            return
+        tmp = self._state_file.with_name(f"{STATE_FILE}.{os.getpid()}.tmp")
+        try:
+            tmp.write_text(json.dumps({
+                "key": self._state_key(),
+                "hashes": self._content_hashes,
+                "rest": self._rest_hashes,
+            }))
+            os.replace(tmp, self._state_file)
+        except OSError as exc:
+            logger.warning(f"Could not save sync state to {self._state_file}: {exc}")
+            tmp.unlink(missing_ok=True)
+
     @staticmethod
     def _parse_frontmatter(content: str) -> tuple[dict, str]:
         """Extract YAML frontmatter and body from markdown content."""
-        if not content.startswith("---"):
-            return {}, content
-        end = content.find("---", 3)
-        if end == -1:
+        fm_text, body = split_frontmatter(content)
+        if fm_text is None:
             return {}, content
-        fm_text = content[3:end].strip()
-        body = content[end + 3:].lstrip("\n")
-        metadata = yaml.safe_load(fm_text) or {}
+        body = body.lstrip("\n")
+        metadata = yaml.load(fm_text, Loader=_SafeLoader) or {}
         return metadata, body
@@ -1,7 +1,5 @@
 """Appends Dataview inline fields from .tech.md YAML metadata."""
 
-import re
-
 from .pipeline import Transform
 
 # Edge types that mean "this component depends on target"
@@ -9,6 +7,8 @@ _DEPENDS_TYPES = {"reads", "writes", "calls"}
 # Edge types that mean "target depends on this component"
 _CALLED_BY_TYPES = {"called_by", "consumed_by"}
 
+_DEP_HEADING = "## Dependencies"
+
 
 class DataviewInjector(Transform):
     def apply(self, content: str, metadata: dict) -> str:
@@ -39,17 +39,48 @@ def _build_dataview_lines(edges: list[dict]) -> list[str]:
     return lines
 
 
+def _find_dependencies_heading(content: str) -> int:
+    """Return the offset just past an existing ``## Dependencies`` heading, or -1.
+
+    Same match as ``re.search(r"^## Dependencies\\s*$", content, re.MULTILINE)``:
+    the heading must start a line, and trailing whitespace (blank lines too)
+    is consumed up to the last line break before the next text.
+    """
+    n = len(content)
+    if content.startswith(_DEP_HEADING):
+        p = 0
+    else:
+        p = _line_start(content, "\n" + _DEP_HEADING, 0)
+    while p != -1:
+        q = p + len(_DEP_HEADING)
+        k = q
+        while k < n and content[k].isspace():
+            k += 1
+        if k == n:
+            return n
+        end = content.rfind("\n", q, k)
+        if end != -1:
+            return end
+        # Heading text continues on the same line; keep looking
+        p = _line_start(content, "\n" + _DEP_HEADING, p)
+    return -1
+
+
+def _line_start(content: str, needle: str, start: int) -> int:
+    """Offset just past the newline of the next *needle* ("\n..."), or -1."""
+    idx = content.find(needle, start)
+    return -1 if idx == -1 else idx + 1
+
+
 def _inject_dependencies_section(content: str, block: str) -> str:
     # If ## Dependencies already exists, inject after the heading
-    dep_match = re.search(r"^(## Dependencies\s*)$", content, re.MULTILINE)
-    if dep_match:
-        insert_pos = dep_match.end()
+    insert_pos = _find_dependencies_heading(content)
+    if insert_pos != -1:
         return content[:insert_pos] + "\n\n" + block + "\n" + content[insert_pos:]
 
     # Otherwise insert a new section before the first ## heading
-    first_h2 = re.search(r"^## ", content, re.MULTILINE)
-    if first_h2:
-        pos = first_h2.start()
+    pos = 0 if content.startswith("## ") else _line_start(content, "\n## ", 0)
+    if pos != -1:
         section = f"## Dependencies\n\n{block}\n\n"
         return content[:pos] + section + content[pos:]
 
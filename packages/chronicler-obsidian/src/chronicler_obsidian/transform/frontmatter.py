@@ -1,13 +1,21 @@
 """Injects YAML frontmatter with tags, aliases, and cssclasses for Obsidian."""
 
+import json
 import re
 
 import yaml
+from yaml.nodes import ScalarNode
+from yaml.resolver import Resolver
 
 from .pipeline import Transform
 
 _FRONTMATTER_RE = re.compile(r"^---\n(.*?)\n---", re.DOTALL)
 
+# Strings matching this (and resolving to str, see _scalar) can go out unquoted.
+_PLAIN_RE = re.compile(r"[\w./](?:[\w./ @()+-]*[\w./@()+-])?")
+_RESOLVER = Resolver()
+_STR_TAG = "tag:yaml.org,2002:str"
+
 
 def _humanize_id(component_id: str) -> str:
     """auth-service -> Auth Service"""
@@ -20,7 +28,10 @@ class FrontmatterFlattener(Transform):
             return content
 
         fm = _build_frontmatter(metadata)
-        dumped = yaml.dump(fm, default_flow_style=False, sort_keys=False, allow_unicode=True).rstrip()
+        dumped = _emit_frontmatter(fm)
+        if dumped is None:
+            dumped = yaml.dump(fm, default_flow_style=False, sort_keys=False, allow_unicode=True)
+        dumped = dumped.rstrip()
 
         new_block = f"---\n{dumped}\n---"
 
@@ -74,3 +85,52 @@ def _build_frontmatter(meta: dict) -> dict:
 
     fm["cssclass"] = "chronicler-doc"
     return fm
+
+
+def _scalar(value) -> str | None:
+    """Render a scalar the way yaml.dump would read back, or None if unsupported."""
+    if isinstance(value, str):
+        if _PLAIN_RE.fullmatch(value) and _RESOLVER.resolve(ScalarNode, value, (True, False)) == _STR_TAG:
+            return value
+        if not value.isprintable():
+            return None
+        # A JSON string is a valid YAML double-quoted scalar
+        return json.dumps(value)
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if value is None:
+        return "null"
+    if isinstance(value, int):
+        return str(value)
+    return None
+
+
+def _emit_frontmatter(fm: dict) -> str | None:
+    """Emit the flattened frontmatter without going through yaml.dump.
+
+    Handles the shape _build_frontmatter produces: string keys mapping to
+    scalars or lists of scalars. Returns None for anything else (nested
+    governance values, floats, ...) so the caller can fall back to yaml.dump.
+    """
+    lines: list[str] = []
+    for key, value in fm.items():
+        if not isinstance(key, str) or _scalar(key) != key:
+            return None
+        if isinstance(value, list):
+            if not value:
+                lines.append(f"{key}: []")
+                continue
+            lines.append(f"{key}:")
+            for item in value:
+                rendered = _scalar(item)
+                if rendered is None:
+                    return None
+                lines.append(f"- {rendered}")
+            continue
+        rendered = _scalar(value)
+        if rendered is None:
+            return None
+        lines.append(f"{key}: {rendered}")
+    return "\n".join(lines) + "\n"
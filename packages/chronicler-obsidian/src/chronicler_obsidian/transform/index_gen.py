@@ -1,65 +1,92 @@
 """Generates MOC (Map of Content) index notes for vault navigation."""
 
+import io
+from collections import defaultdict
+from operator import attrgetter
+from typing import NamedTuple
+
 from .pipeline import Transform
 
+# Static parts of _index.md; only the per-layer listing between them varies.
+_HEADER = """\
+---
+title: "Chronicler Documentation Index"
+tags: [chronicler-index]
+---
+
+# Project Documentation
+
+## By Layer
+"""
+
+_FOOTER = """\
+## Dataview: All Services
+
+```dataview
+TABLE version, owner_team, security_level
+FROM #tech-doc
+SORT layer, component_id
+```
+
+## Dataview: Dependency Graph
+
+```dataview
+TABLE dependencies AS "Depends On", called_by AS "Called By"
+FROM #tech-doc
+WHERE length(dependencies) > 0
+SORT component_id
+```
+"""
+
+_by_component_id = attrgetter("component_id")
+
+
+class _Comp(NamedTuple):
+    component_id: str
+    version: str
+    owner_team: str
+
 
 class IndexGenerator(Transform):
     def __init__(self):
-        self.components: dict[str, list[dict]] = {}
+        self.components: dict[str, list[_Comp]] = defaultdict(list)
+        # generate() may run repeatedly during incremental exports; only
+        # layers that gained components since the last call are re-sorted.
+        self._layer_dirty: set[str] = set()
+        self._sorted_cache: dict[str, list[_Comp]] = {}
+        self._sorted_layers: list[str] = []
 
     def apply(self, content: str, metadata: dict) -> str:
         # Collect metadata per layer, don't modify content
         layer = metadata.get("layer", "unknown")
-        comp_id = metadata.get("component_id", "unknown")
-        if layer not in self.components:
-            self.components[layer] = []
-        self.components[layer].append({
-            "component_id": comp_id,
-            "version": metadata.get("version", ""),
-            "owner_team": metadata.get("owner_team", ""),
-        })
+        self.components[layer].append(_Comp(
+            metadata.get("component_id", "unknown"),
+            metadata.get("version", ""),
+            metadata.get("owner_team", ""),
+        ))
+        self._layer_dirty.add(layer)
         return content
 
+    def _sorted_components(self) -> list[tuple[str, list[_Comp]]]:
+        if self._layer_dirty:
+            if not self._layer_dirty.issubset(self._sorted_cache):
+                self._sorted_layers = sorted(self.components)
+            for layer in self._layer_dirty:
+                self._sorted_cache[layer] = sorted(self.components[layer], key=_by_component_id)
+            self._layer_dirty.clear()
+        cache = self._sorted_cache
+        return [(layer, cache[layer]) for layer in self._sorted_layers]
+
     def generate(self) -> str:
         """Generate _index.md content with Dataview queries."""
-        parts: list[str] = []
-
-        # Frontmatter
-        parts.append("---")
-        parts.append('title: "Chronicler Documentation Index"')
-        parts.append("tags: [chronicler-index]")
-        parts.append("---")
-        parts.append("")
-        parts.append("# Project Documentation")
-        parts.append("")
-
-        # Grouped by layer
-        parts.append("## By Layer")
-        for layer in sorted(self.components):
-            parts.append(f"### {layer.title()}")
-            for comp in sorted(self.components[layer], key=lambda c: c["component_id"]):
-                parts.append(f"- [[{comp['component_id']}]]")
-            parts.append("")
-
-        # Dataview: All Services
-        parts.append("## Dataview: All Services")
-        parts.append("")
-        parts.append("```dataview")
-        parts.append("TABLE version, owner_team, security_level")
-        parts.append("FROM #tech-doc")
-        parts.append("SORT layer, component_id")
-        parts.append("```")
-        parts.append("")
-
-        # Dataview: Dependency Graph
-        parts.append("## Dataview: Dependency Graph")
-        parts.append("")
-        parts.append("```dataview")
-        parts.append('TABLE dependencies AS "Depends On", called_by AS "Called By"')
-        parts.append("FROM #tech-doc")
-        parts.append("WHERE length(dependencies) > 0")
-        parts.append("SORT component_id")
-        parts.append("```")
-        parts.append("")
-
-        return "\n".join(parts)
+        buf = io.StringIO()
+        w = buf.write
+        w(_HEADER)
+        # One "### Layer" block per layer, each followed by a blank line
+        for layer, comps in self._sorted_components():
+            w(f"### {layer.title()}\n")
+            for comp in comps:
+                w(f"- [[{comp.component_id}]]\n")
+            w("\n")
+        w(_FOOTER)
+        return buf.getvalue()
@@ -6,11 +6,17 @@ from .pipeline import Transform
 
 # Matches agent://component_id or agent://component_id/path segments
 _AGENT_URI_RE = re.compile(r"agent://([a-zA-Z0-9_-]+)(?:/([a-zA-Z0-9_./-]+))?")
+_AGENT_URI_SUB = _AGENT_URI_RE.sub
+
+_TECH_MD_SUFFIX = ".tech.md"
 
 
 class LinkRewriter(Transform):
     def apply(self, content: str, metadata: dict) -> str:
-        return _AGENT_URI_RE.sub(_rewrite_match, content)
+        # The pattern needs the literal prefix; skip the regex scan without it
+        if "agent://" not in content:
+            return content
+        return _AGENT_URI_SUB(_rewrite_match, content)
 
 
 def _rewrite_match(m: re.Match) -> str:
@@ -19,7 +25,7 @@ def _rewrite_match(m: re.Match) -> str:
 
     if path:
         # Strip .tech.md extension if present
-        name = re.sub(r"\.tech\.md$", "", path)
+        name = path[:-len(_TECH_MD_SUFFIX)] if path.endswith(_TECH_MD_SUFFIX) else path
         # Same-repo style: component - name
         link_text = f"{component} - {name}"
         return f"[[{link_text}]]"
@@ -1,6 +1,7 @@
 """TransformPipeline — runs ordered transforms on .tech.md content before writing to vault."""
 
 from abc import ABC, abstractmethod
+from typing import Callable
 
 
 class Transform(ABC):
@@ -13,8 +14,13 @@ class Transform(ABC):
 class TransformPipeline:
     def __init__(self, transforms: list[Transform]):
         self.transforms = transforms
+        # Bound once here; the pipeline runs once per exported document.
+        # The transform list is fixed at construction.
+        self._apply_fns: tuple[Callable[[str, dict], str], ...] = tuple(
+            t.apply for t in transforms
+        )
 
     def apply(self, content: str, metadata: dict) -> str:
-        for t in self.transforms:
-            content = t.apply(content, metadata)
+        for fn in self._apply_fns:
+            content = fn(content, metadata)
         return content
@@ -3,6 +3,10 @@
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
+# The sample_* data fixtures are session-scoped and shared by every test:
+# copy them (model_copy) before changing anything. The mock providers stay
+# function-scoped since MagicMock records calls.
+
 # Skip enterprise test files — chronicler-enterprise is not ready yet.
 # collect_ignore runs before import, so no ModuleNotFoundError.
 collect_ignore = [
@@ -19,7 +23,7 @@ from chronicler_core.llm.base import LLMProvider
 from chronicler_core.llm.models import LLMConfig as LLMRuntimeConfig, LLMResponse, TokenUsage
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_repo_metadata():
     return RepoMetadata(
         component_id="acme/widget-api",
@@ -34,10 +38,10 @@ def sample_repo_metadata():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_file_tree():
     """Mix of files and dirs, including several key files."""
-    return [
+    return (
         FileNode(path="src", name="src", type="dir"),
         FileNode(path="src/main.py", name="main.py", type="file", size=800, sha="abc1"),
         FileNode(path="package.json", name="package.json", type="file", size=450, sha="abc2"),
@@ -53,10 +57,10 @@ def sample_file_tree():
         FileNode(path="docs", name="docs", type="dir"),
         FileNode(path="docs/guide.md", name="guide.md", type="file", size=5000, sha="abc6"),
         FileNode(path="pyproject.toml", name="pyproject.toml", type="file", size=350, sha="abc7"),
-    ]
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_crawl_result(sample_repo_metadata, sample_file_tree):
     return CrawlResult(
         metadata=sample_repo_metadata,
@@ -99,7 +103,7 @@ def mock_llm_provider():
     return provider
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_config():
     return ChroniclerConfig()
 
@@ -2,16 +2,17 @@
 
 Cloud SDK packages (boto3, google-cloud-pubsub, azure-servicebus) are not
 installed in the test environment. We inject mock modules into sys.modules
-before importing the implementation so the top-level imports succeed.
+so the SDK imports inside each queue constructor succeed.
 """
 
 from __future__ import annotations
 
+import gc
 import json
 import sys
 import uuid
 from datetime import UTC, datetime
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -71,6 +72,126 @@ _mock_azure_sb.ServiceBusClient = MagicMock()
 from chronicler_enterprise.plugins.cloud_queue.sqs import SQSQueue
 from chronicler_enterprise.plugins.cloud_queue.pubsub import PubSubQueue
 from chronicler_enterprise.plugins.cloud_queue.servicebus import ServiceBusQueue
+from chronicler_enterprise.plugins.cloud_queue import _serialization
+from chronicler_enterprise.plugins.cloud_queue._ack_cache import AckCache
+from chronicler_enterprise.plugins.cloud_queue._serialization import attrs_to_job, job_to_attrs
+
+
+# ---------------------------------------------------------------------------
+# Lazy SDK imports
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    ("module", "sdk"),
+    [
+        ("sqs", "boto3"),
+        ("pubsub", "google.cloud.pubsub_v1"),
+        ("servicebus", "azure.servicebus"),
+    ],
+)
+def test_module_import_does_not_load_sdk(module, sdk, monkeypatch):
+    """Importing a queue module must work with the SDK unavailable."""
+    import importlib
+
+    mod = importlib.import_module(f"chronicler_enterprise.plugins.cloud_queue.{module}")
+    monkeypatch.setitem(sys.modules, sdk, None)  # any import of it now raises
+    importlib.reload(mod)
+
+
+# ---------------------------------------------------------------------------
+# Ack cache
+# ---------------------------------------------------------------------------
+
+
+class TestAckCache:
+    def test_evicts_oldest_when_full(self):
+        cache = AckCache(maxsize=2)
+        cache["a"], cache["b"], cache["c"] = "1", "2", "3"
+        assert "a" not in cache
+        assert cache.pop("c") == "3"
+        assert len(cache) == 1
+
+    def test_entries_expire_after_ttl(self, monkeypatch):
+        import chronicler_enterprise.plugins.cloud_queue._ack_cache as mod
+
+        now = [100.0]
+        monkeypatch.setattr(mod.time, "monotonic", lambda: now[0])
+        cache = AckCache(ttl=30)
+        cache["a"] = "receipt"
+        now[0] += 31
+        assert cache.pop("a", None) is None
+        assert len(cache) == 0
+
+    def test_pop_missing_without_default_raises(self):
+        with pytest.raises(KeyError):
+            AckCache().pop("nope")
+
+
+# ---------------------------------------------------------------------------
+# Shared serialization
+# ---------------------------------------------------------------------------
+
+
+class TestSerialization:
+    def test_roundtrip_preserves_timestamps(self):
+        job = _make_job(attempts=2, error="boom")
+        attrs = job_to_attrs(job)
+        assert attrs["created_at"].isdigit()
+        got = attrs_to_job(attrs, job.payload)
+        assert got.created_at == job.created_at
+        assert got.updated_at == job.updated_at
+        assert got.attempts == 2
+        assert got.error == "boom"
+
+    def test_overrides_status_and_updated_at(self):
+        job = _make_job()
+        later = datetime(2030, 1, 1, tzinfo=UTC)
+        got = attrs_to_job(
+            job_to_attrs(job), job.payload, status=JobStatus.processing, updated_at=later
+        )
+        assert got.status == JobStatus.processing
+        assert got.updated_at == later
+        assert got.created_at == job.created_at
+
+    @pytest.mark.parametrize(
+        ("field", "value"), [("job_id", "  "), ("attempts", "-1"), ("status", "bogus")]
+    )
+    def test_rejects_malformed_attrs(self, field, value):
+        attrs = job_to_attrs(_make_job())
+        attrs[field] = value
+        with pytest.raises(ValueError):
+            attrs_to_job(attrs, {})
+
+    def test_job_to_attrs_reuses_cache_until_job_changes(self):
+        job = _make_job()
+        with patch(
+            "chronicler_enterprise.plugins.cloud_queue._serialization._format_ts",
+            wraps=_serialization._format_ts,
+        ) as fmt:
+            first = job_to_attrs(job)
+            first["status"] = "tampered"
+            second = job_to_attrs(job)
+            assert fmt.call_count == 2
+            assert second["status"] == "pending"
+            job.attempts = 1
+            assert job_to_attrs(job)["attempts"] == "1"
+            assert fmt.call_count == 4
+
+    def test_job_to_attrs_cache_entry_dropped_with_job(self):
+        job = _make_job()
+        job_to_attrs(job)
+        key = id(job)
+        assert key in _serialization._ATTRS_CACHE
+        del job
+        gc.collect()
+        assert key not in _serialization._ATTRS_CACHE
+
+    def test_parses_legacy_isoformat_timestamps(self):
+        job = _make_job()
+        attrs = job_to_attrs(job)
+        attrs["created_at"] = job.created_at.isoformat()
+        assert attrs_to_job(attrs, job.payload).created_at == job.created_at
 
 
 # ---------------------------------------------------------------------------
@@ -114,6 +235,25 @@ class TestSQSQueue:
         assert attrs["job_id"]["StringValue"] == "job-3"
         assert attrs["status"]["StringValue"] == "pending"
 
+    def test_enqueue_many_chunks_into_batches_of_ten(self, sqs):
+        jobs = [_make_job(id=f"batch-{i}") for i in range(12)]
+        sqs._mock_client.send_message_batch.side_effect = lambda **kw: {
+            "Successful": [{"Id": e["Id"]} for e in kw["Entries"]],
+        }
+        result = sqs.enqueue_many(jobs)
+        assert result == [j.id for j in jobs]
+        calls = sqs._mock_client.send_message_batch.call_args_list
+        assert [len(c[1]["Entries"]) for c in calls] == [10, 2]
+        assert json.loads(calls[1][1]["Entries"][0]["MessageBody"]) == {"repo": "acme/app"}
+
+    def test_enqueue_many_skips_failed_entries(self, sqs):
+        jobs = [_make_job(id="ok"), _make_job(id="bad")]
+        sqs._mock_client.send_message_batch.return_value = {
+            "Successful": [{"Id": "0"}],
+            "Failed": [{"Id": "1", "Code": "InternalError"}],
+        }
+        assert sqs.enqueue_many(jobs) == ["ok"]
+
     def test_dequeue_returns_none_when_empty(self, sqs):
         sqs._mock_client.receive_message.return_value = {"Messages": []}
         assert sqs.dequeue() is None
@@ -175,41 +315,63 @@ class TestSQSQueue:
         q = SQSQueue(queue_url="https://sqs.example.com/q")
         assert q.dead_letters() == []
 
-    def test_dead_letters_reads_dlq(self, sqs):
-        job = _make_job(id="dead-1")
-        sqs._mock_client.receive_message.side_effect = [
-            {
-                "Messages": [
-                    {
-                        "Body": json.dumps(job.payload),
-                        "ReceiptHandle": "r-dlq",
-                        "MessageAttributes": {
-                            "job_id": {"DataType": "String", "StringValue": "dead-1"},
-                            "status": {"DataType": "String", "StringValue": "failed"},
-                            "created_at": {
-                                "DataType": "String",
-                                "StringValue": job.created_at.isoformat(),
-                            },
-                            "updated_at": {
-                                "DataType": "String",
-                                "StringValue": job.updated_at.isoformat(),
-                            },
-                            "attempts": {"DataType": "Number", "StringValue": "3"},
-                            "error": {
-                                "DataType": "String",
-                                "StringValue": "max retries",
-                            },
-                        },
-                    }
-                ]
+    @staticmethod
+    def _dlq_message(job_id: str) -> dict:
+        job = _make_job(id=job_id)
+        return {
+            "Body": json.dumps(job.payload),
+            "ReceiptHandle": f"r-{job_id}",
+            "MessageAttributes": {
+                "job_id": {"DataType": "String", "StringValue": job_id},
+                "status": {"DataType": "String", "StringValue": "failed"},
+                "created_at": {
+                    "DataType": "String",
+                    "StringValue": job.created_at.isoformat(),
+                },
+                "updated_at": {
+                    "DataType": "String",
+                    "StringValue": job.updated_at.isoformat(),
+                },
+                "attempts": {"DataType": "Number", "StringValue": "3"},
+                "error": {"DataType": "String", "StringValue": "max retries"},
             },
-            {"Messages": []},
-        ]
+        }
+
+    @staticmethod
+    def _serve_batches(batches: list[list[dict]]):
+        """receive_message side_effect: hand out *batches* once, then empty responses."""
+        import threading
+
+        lock = threading.Lock()
+        pending = list(batches)
+
+        def _receive(**kwargs):
+            with lock:
+                return {"Messages": pending.pop(0) if pending else []}
+
+        return _receive
+
+    def test_dead_letters_reads_dlq(self, sqs):
+        sqs._mock_client.receive_message.side_effect = self._serve_batches(
+            [[self._dlq_message("dead-1")]]
+        )
         dead = sqs.dead_letters()
         assert len(dead) == 1
         assert dead[0].id == "dead-1"
         assert dead[0].status == JobStatus.dead
 
+    def test_dead_letters_drains_concurrently_up_to_max(self, sqs):
+        batches = [
+            [self._dlq_message(f"dead-{b}-{i}") for i in range(10)] for b in range(5)
+        ]
+        sqs._mock_client.receive_message.side_effect = self._serve_batches(batches)
+        dead = sqs.dead_letters(max_results=35, workers=4)
+        assert len(dead) == 35
+        assert len({j.id for j in dead}) == 35
+        for call in sqs._mock_client.receive_message.call_args_list:
+            assert call[1]["QueueUrl"] == sqs._dlq_url
+            assert call[1]["MaxNumberOfMessages"] <= 10
+
 
 # ---------------------------------------------------------------------------
 # Pub/Sub
@@ -250,6 +412,64 @@ class TestPubSubQueue:
         body = json.loads(call_args[1]["data"].decode("utf-8"))
         assert body == {"x": 1}
 
+    def test_enqueue_many_waits_on_all_futures(self, pubsub):
+        futures = [MagicMock(), MagicMock()]
+        pubsub._mock_publisher.publish.side_effect = futures
+        jobs = [_make_job(id="ps-b1"), _make_job(id="ps-b2")]
+        assert pubsub.enqueue_many(jobs) == ["ps-b1", "ps-b2"]
+        assert pubsub._mock_publisher.publish.call_count == 2
+        for f in futures:
+            f.result.assert_called_once()
+
+    def test_enqueue_defers_waiting_until_flush(self, pubsub):
+        future = MagicMock()
+        pubsub._mock_publisher.publish.return_value = future
+        pubsub.enqueue(_make_job(id="ps-d1"))
+        future.result.assert_not_called()
+        pubsub.close()
+        future.result.assert_called_once()
+
+    def test_enqueue_flushes_every_hundred(self, pubsub):
+        futures = [MagicMock() for _ in range(100)]
+        pubsub._mock_publisher.publish.side_effect = futures
+        for i in range(100):
+            pubsub.enqueue(_make_job(id=f"ps-f{i}"))
+        assert all(f.result.called for f in futures)
+        assert not pubsub._pending
+
+    def test_flush_surfaces_publish_errors(self, pubsub):
+        future = MagicMock()
+        future.result.side_effect = RuntimeError("publish failed")
+        pubsub._mock_publisher.publish.return_value = future
+        pubsub.enqueue(_make_job())
+        with pytest.raises(RuntimeError):
+            pubsub.flush()
+
+    def test_dequeue_many_pulls_multiple(self, pubsub):
+        job = _make_job()
+        received = []
+        for i in range(3):
+            m = MagicMock()
+            m.ack_id = f"ack-{i}"
+            m.message.data = json.dumps(job.payload).encode("utf-8")
+            m.message.attributes = {
+                "job_id": f"ps-m{i}",
+                "status": "pending",
+                "created_at": job.created_at.isoformat(),
+                "updated_at": job.updated_at.isoformat(),
+                "attempts": "0",
+                "error": "",
+            }
+            received.append(m)
+        resp = MagicMock()
+        resp.received_messages = received
+        pubsub._mock_subscriber.pull.return_value = resp
+
+        got = pubsub.dequeue_many(3)
+        assert [j.id for j in got] == ["ps-m0", "ps-m1", "ps-m2"]
+        assert pubsub._ack_ids["ps-m2"] == "ack-2"
+        assert pubsub._mock_subscriber.pull.call_args[1]["max_messages"] == 3
+
     def test_dequeue_returns_none_when_empty(self, pubsub):
         resp = MagicMock()
         resp.received_messages = []
@@ -344,6 +564,22 @@ class TestServiceBusQueue:
         sent_msg = call_args[0][0]
         assert sent_msg.application_properties["job_id"] == "sb-2"
 
+    def test_enqueue_many_uses_message_batch(self, sb):
+        batch = MagicMock()
+        sb._mock_sender.create_message_batch.return_value = batch
+        jobs = [_make_job(id="sb-b1"), _make_job(id="sb-b2")]
+        assert sb.enqueue_many(jobs) == ["sb-b1", "sb-b2"]
+        assert batch.add_message.call_count == 2
+        sb._mock_sender.send_messages.assert_called_once_with(batch)
+
+    def test_enqueue_many_flushes_full_batch(self, sb):
+        full, fresh = MagicMock(), MagicMock()
+        full.add_message.side_effect = [None, ValueError("batch full")]
+        sb._mock_sender.create_message_batch.side_effect = [full, fresh]
+        sb.enqueue_many([_make_job(id="sb-f1"), _make_job(id="sb-f2")])
+        sent = [c[0][0] for c in sb._mock_sender.send_messages.call_args_list]
+        assert sent == [full, fresh]
+
     def test_dequeue_returns_none_when_empty(self, sb):
         sb._mock_receiver.receive_messages.return_value = []
         assert sb.dequeue() is None
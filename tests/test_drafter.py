@@ -56,8 +56,10 @@ class TestContextBuilder:
         assert "main.py" in ctx.file_tree
 
     def test_empty_languages(self, sample_crawl_result):
-        sample_crawl_result.metadata.languages = {}
-        ctx = ContextBuilder.from_crawl_result(sample_crawl_result)
+        result = sample_crawl_result.model_copy(
+            update={"metadata": sample_crawl_result.metadata.model_copy(update={"languages": {}})}
+        )
+        ctx = ContextBuilder.from_crawl_result(result)
         assert ctx.languages == ""
 
     def test_no_key_files(self, sample_repo_metadata, sample_file_tree):
@@ -82,6 +82,29 @@ class TestCheckStaleness:
         entry = next(e for e in report.stale if e.source_path == "src/main.py")
         assert entry.current_hash != entry.recorded_hash
 
+    def test_unchanged_stat_skips_rehash(self, tmp_path: Path):
+        """Files whose mtime/size match the tree's record are not rehashed."""
+        import os
+        from unittest.mock import patch
+
+        from chronicler_core.freshness import checker
+
+        root = _make_project(tmp_path)
+        old = time.time() - 60
+        for p in root.rglob("*.py"):
+            os.utime(p, (old, old))
+        _build_and_save_tree(root)
+
+        # Same size, new mtime: must be rehashed and caught
+        (root / "src" / "util.py").write_text("def helper(): PASS")
+        with patch.object(checker, "compute_file_hash", wraps=checker.compute_file_hash) as hasher:
+            report = check_staleness(root)
+
+        hashed = {c.args[0].name for c in hasher.call_args_list}
+        assert "main.py" not in hashed
+        assert "util.py" in hashed
+        assert [e.source_path for e in report.stale] == ["src/util.py"]
+
     def test_detects_uncovered_files(self, tmp_path: Path):
         """Source files with no paired .tech.md are listed as uncovered."""
         root = _make_project(tmp_path)
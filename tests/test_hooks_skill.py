@@ -16,6 +16,8 @@ from __future__ import annotations
 
 import json
 import os
+import subprocess
+import sys
 import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -123,6 +125,43 @@ class TestSessionStartHook:
         assert "uncovered" not in out
         assert "orphaned" not in out
 
+    def test_status_sidecar_reused(self, project, capsys):
+        """A second session start reads status.json instead of rescanning."""
+        (project / ".chronicler" / "merkle-tree.json").write_text("{}")
+        report = _make_staleness_report(stale=[_make_stale_entry("x.py")])
+
+        from chronicler_lite.hooks.session_start import main
+        with patch("chronicler_core.freshness.check_staleness", return_value=report) as check:
+            main(str(project))
+            main(str(project))
+        assert check.call_count == 1
+        assert capsys.readouterr().out.count("Chronicler: 1 stale") == 2
+
+        status = json.loads((project / ".chronicler" / "status.json").read_text())
+        assert status["n_stale"] == 1
+
+    def test_status_sidecar_invalidated_by_write(self, project, capsys):
+        """A post-write candidate append forces a fresh check."""
+        (project / ".chronicler" / "merkle-tree.json").write_text("{}")
+
+        from chronicler_lite.hooks.session_start import main
+        with patch("chronicler_core.freshness.check_staleness", return_value=_make_staleness_report()):
+            main(str(project))
+
+        candidates = project / ".chronicler" / ".stale-candidates"
+        candidates.write_text("src/a.py\n")
+        report = _make_staleness_report(stale=[_make_stale_entry("src/a.py")])
+        with patch("chronicler_core.freshness.check_staleness", return_value=report) as check:
+            main(str(project))
+        check.assert_called_once()
+        assert "1 stale" in capsys.readouterr().out
+
+    def test_no_sidecar_without_merkle_tree(self, project, capsys):
+        with patch("chronicler_core.freshness.check_staleness", return_value=_make_staleness_report()):
+            from chronicler_lite.hooks.session_start import main
+            main(str(project))
+        assert not (project / ".chronicler" / "status.json").exists()
+
 
 class TestPostWriteHook:
     """post_write.py — records written paths to .stale-candidates."""
@@ -164,6 +203,19 @@ class TestPostWriteHook:
         candidates = project / ".chronicler" / ".stale-candidates"
         assert not candidates.exists()
 
+    def test_tracks_lookalike_directory(self, project, tool_input_file):
+        """Only an exact .chronicler/ segment is ignored, not e.g. my.chronicler/."""
+        src = project / "my.chronicler" / "notes.py"
+        src.parent.mkdir()
+        src.write_text("x = 1")
+        tool_input_file.write_text(json.dumps({"file_path": str(src)}))
+
+        from chronicler_lite.hooks.post_write import main
+        main(str(tool_input_file))
+
+        candidates = project / ".chronicler" / ".stale-candidates"
+        assert candidates.read_text().split() == [str(src)]
+
     def test_missing_file_path_key(self, project, tool_input_file):
         """If the JSON has no file_path key, do nothing."""
         tool_input_file.write_text(json.dumps({"content": "hello"}))
@@ -194,6 +246,24 @@ class TestPostWriteHook:
         assert len(lines) == 3
 
 
+    def test_project_root_cached_across_writes(self, project, tool_input_file):
+        """A second write in the same tree reuses the cached .chronicler/ lookup."""
+        from chronicler_lite.hooks import post_write
+
+        src = project / "pkg" / "deep" / "mod.py"
+        src.parent.mkdir(parents=True)
+        src.write_text("x = 1")
+        tool_input_file.write_text(json.dumps({"file_path": str(src)}))
+        post_write.main(str(tool_input_file))
+
+        with patch("chronicler_lite.hooks.post_write.os.path.isdir", wraps=os.path.isdir) as isdir:
+            post_write.main(str(tool_input_file))
+        assert isdir.call_count == 1  # only re-validates the cached root
+
+        lines = (project / ".chronicler" / ".stale-candidates").read_text().split()
+        assert lines == [str(src), str(src)]
+
+
 class TestPreReadTechmdHook:
     """pre_read_techmd.py — stale doc warning."""
 
@@ -288,6 +358,107 @@ class TestPreReadTechmdHook:
 
         assert capsys.readouterr().out == ""
 
+    def _save_tree(self, project, source_hash):
+        from chronicler_core.merkle.models import MerkleNode
+        from chronicler_core.merkle.tree import MerkleTree
+        from datetime import datetime, timezone
+
+        MerkleTree(
+            root_hash="fake",
+            nodes={
+                "main.py": MerkleNode(
+                    path="main.py",
+                    hash=source_hash,
+                    source_hash=source_hash,
+                    doc_path=".chronicler/main.tech.md",
+                ),
+            },
+            last_scan=datetime.now(timezone.utc),
+        ).save(project / ".chronicler" / "merkle-tree.json")
+
+    def test_repeat_read_skips_tree_and_hash(self, project, tool_input_file, capsys):
+        """A second Read of an unchanged doc is answered from doc-index.json."""
+        from chronicler_core.merkle.tree import compute_file_hash
+
+        source = project / "main.py"
+        source.write_text("print('hello')")
+        doc = project / ".chronicler" / "main.tech.md"
+        doc.write_text("# doc")
+        self._save_tree(project, compute_file_hash(source))
+        tool_input_file.write_text(json.dumps({"file_path": str(doc)}))
+
+        from chronicler_lite.hooks.pre_read_techmd import main
+        main(str(tool_input_file))
+
+        index = json.loads((project / ".chronicler" / "doc-index.json").read_text())
+        assert index[".chronicler/main.tech.md"]["source"] == "main.py"
+        assert index[".chronicler/main.tech.md"]["stale"] is False
+
+        with patch("chronicler_core.merkle.tree.MerkleTree.load") as load, \
+                patch("chronicler_core.merkle.tree.compute_file_hash") as hash_:
+            main(str(tool_input_file))
+        load.assert_not_called()
+        hash_.assert_not_called()
+        assert capsys.readouterr().out == ""
+
+    def test_edited_source_is_rechecked(self, project, tool_input_file, capsys):
+        """Changing the source's size or mtime invalidates the cached verdict."""
+        from chronicler_core.merkle.tree import compute_file_hash
+
+        source = project / "main.py"
+        source.write_text("print('hello')")
+        doc = project / ".chronicler" / "main.tech.md"
+        doc.write_text("# doc")
+        self._save_tree(project, compute_file_hash(source))
+        tool_input_file.write_text(json.dumps({"file_path": str(doc)}))
+
+        from chronicler_lite.hooks.pre_read_techmd import main
+        main(str(tool_input_file))
+        assert capsys.readouterr().out == ""
+
+        source.write_text("print('hello, world')")
+        main(str(tool_input_file))
+        assert "stale" in capsys.readouterr().out.lower()
+
+    def test_rebuilt_tree_invalidates_index(self, project, tool_input_file, capsys):
+        """Rewriting merkle-tree.json drops cached verdicts for every doc."""
+        from chronicler_core.merkle.tree import compute_file_hash
+
+        source = project / "main.py"
+        source.write_text("print('hello')")
+        doc = project / ".chronicler" / "main.tech.md"
+        doc.write_text("# doc")
+        self._save_tree(project, "000000000000")
+        tool_input_file.write_text(json.dumps({"file_path": str(doc)}))
+
+        from chronicler_lite.hooks.pre_read_techmd import main
+        main(str(tool_input_file))
+        assert "stale" in capsys.readouterr().out.lower()
+
+        tree_file = project / ".chronicler" / "merkle-tree.json"
+        old_mtime = tree_file.stat().st_mtime_ns
+        self._save_tree(project, compute_file_hash(source))
+        os.utime(tree_file, ns=(old_mtime + 1_000_000, old_mtime + 1_000_000))
+        main(str(tool_input_file))
+        assert capsys.readouterr().out == ""
+
+    def test_project_root_lookup_is_cached(self, project):
+        """Sibling docs reuse the cached walk of their shared ancestors."""
+        from chronicler_lite.hooks import pre_read_techmd
+
+        a = project / "pkg" / "a" / "x.tech.md"
+        b = project / "pkg" / "b" / "y.tech.md"
+        for doc in (a, b):
+            doc.parent.mkdir(parents=True)
+            doc.write_text("# doc")
+
+        pre_read_techmd._root_for_dir.cache_clear()
+        assert pre_read_techmd._find_project_root(a) == project
+        misses = pre_read_techmd._root_for_dir.cache_info().misses
+        assert pre_read_techmd._find_project_root(b) == project
+        # only pkg/b itself is new; pkg and the project root are cache hits
+        assert pre_read_techmd._root_for_dir.cache_info().misses == misses + 1
+
     def test_no_merkle_tree_is_silent(self, project, tool_input_file, capsys):
         """If there's no merkle-tree.json, exit silently."""
         doc = project / ".chronicler" / "main.tech.md"
@@ -349,14 +520,14 @@ class TestHookErrorPaths:
         src.write_text("x = 1")
         tool_input_file.write_text(json.dumps({"file_path": str(src)}))
 
-        # Patch open() to raise OSError when writing to .stale-candidates
-        original_open = open
+        # Patch os.open() to raise OSError when writing to .stale-candidates
+        original_open = os.open
         def failing_open(path, *args, **kwargs):
             if ".stale-candidates" in str(path):
                 raise OSError("disk full")
             return original_open(path, *args, **kwargs)
 
-        with patch("builtins.open", failing_open):
+        with patch("chronicler_lite.hooks.post_write.os.open", failing_open):
             with pytest.raises(SystemExit) as exc_info:
                 main(str(tool_input_file))
             assert exc_info.value.code == 0
@@ -435,14 +606,14 @@ class TestHookErrorPaths:
         src.write_text("x = 1")
         tool_input_file.write_text(json.dumps({"file_path": str(src)}))
 
-        original_open = open
+        original_open = os.open
         def failing_open(path, *args, **kwargs):
             if ".stale-candidates" in str(path):
                 raise RuntimeError("test error")
             return original_open(path, *args, **kwargs)
 
         with caplog.at_level(logging.WARNING):
-            with patch("builtins.open", failing_open):
+            with patch("chronicler_lite.hooks.post_write.os.open", failing_open):
                 try:
                     post_write_main(str(tool_input_file))
                 except SystemExit:
@@ -485,6 +656,17 @@ class TestHookPerformance:
         elapsed = time.perf_counter() - start
         assert elapsed < 0.2, f"pre_read_techmd non-techmd bail took {elapsed:.3f}s"
 
+    @pytest.mark.parametrize("hook", ["pre_read_techmd", "session_start", "post_write"])
+    def test_hook_import_is_stdlib_only(self, hook):
+        """Importing a hook module must not drag in chronicler_core or pydantic."""
+        code = (
+            f"import sys, chronicler_lite.hooks.{hook}; "
+            "heavy = {'chronicler_core', 'pydantic', 'yaml'} & {m.split('.')[0] for m in sys.modules}; "
+            "sys.exit(sorted(heavy) or 0)"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
+
 
 # ===========================================================================
 # SKILL TESTS
@@ -510,6 +692,18 @@ class TestSkillInit:
         from chronicler_lite.skill.init import detect_project_type
         assert detect_project_type(tmp_path) is None
 
+    def test_detect_prefers_marker_order(self, tmp_path):
+        """With several markers present, the first in PROJECT_MARKERS wins."""
+        (tmp_path / "go.mod").write_text("module x\n")
+        (tmp_path / "package.json").write_text("{}")
+
+        from chronicler_lite.skill.init import detect_project_type
+        assert detect_project_type(tmp_path) == "node"
+
+    def test_detect_missing_dir(self, tmp_path):
+        from chronicler_lite.skill.init import detect_project_type
+        assert detect_project_type(tmp_path / "missing") is None
+
     def test_generate_config_creates_yaml(self, tmp_path, capsys):
         from chronicler_lite.skill.init import generate_config
         path = generate_config(tmp_path)
@@ -528,6 +722,23 @@ class TestSkillInit:
         assert existing.read_text() == "custom: true\n"
         assert "already exists" in capsys.readouterr().out
 
+    def test_build_merkle_reuses_previous_tree(self, tmp_path, capsys):
+        """A re-init only rehashes files changed since the saved tree."""
+        src = tmp_path / "app.py"
+        src.write_text("print('hello')")
+        old = time.time() - 60
+        os.utime(src, (old, old))
+
+        from chronicler_core.merkle import builder
+        from chronicler_lite.skill.init import build_merkle
+        first = build_merkle(tmp_path)
+
+        with patch.object(builder, "compute_file_hash", wraps=builder.compute_file_hash) as hasher:
+            second = build_merkle(tmp_path)
+        # only the just-written merkle-tree.json (too new to trust) is rehashed
+        assert [c.args[0].name for c in hasher.call_args_list] == ["merkle-tree.json"]
+        assert second.nodes["app.py"].source_hash == first.nodes["app.py"].source_hash
+
     def test_full_init_flow(self, tmp_path, capsys):
         """End-to-end init: creates config and merkle tree."""
         (tmp_path / "app.py").write_text("print('hello')")
@@ -578,6 +789,38 @@ class TestSkillStatus:
         # No "Stale files:" section when nothing stale
         assert "Stale files:" not in out
 
+    def test_status_exact_layout(self, capsys):
+        report = _make_staleness_report(
+            stale=[_make_stale_entry("a.py", doc_path=None)],
+            orphaned=["old.tech.md"],
+            total_files=3,
+            total_docs=2,
+        )
+
+        from chronicler_lite.skill import status
+        with patch.object(status, "check_staleness", return_value=report):
+            status.main("/fake")
+
+        assert capsys.readouterr().out == (
+            "Chronicler Status: fake\n"
+            "\n"
+            "  Category        Count\n"
+            "  -------------- ------\n"
+            "  Fresh               2\n"
+            "  Stale               1\n"
+            "  Uncovered           0\n"
+            "  Orphaned            1\n"
+            "  -------------- ------\n"
+            "  Total files         3\n"
+            "  Total docs          2\n"
+            "\n"
+            "Stale files:\n"
+            "  a.py  ->  (no doc)\n"
+            "\n"
+            "Orphaned docs (no matching source):\n"
+            "  old.tech.md\n"
+        )
+
 
 class TestSkillRegenerate:
     """skill/regenerate.py — force regeneration."""
@@ -709,3 +952,88 @@ class TestSkillConfigure:
 
         data = yaml.safe_load((tmp_path / "chronicler.yaml").read_text())
         assert data["new"]["deep"]["key"] == "hello"
+
+
+class TestSkillIndex:
+    """skill/index.py — .tech.md metadata parsing and INDEX.md generation."""
+
+    def test_parse_metadata_and_purpose(self, tmp_path):
+        md = tmp_path / "a.tech.md"
+        md.write_text(
+            "---\ncomponent_id: src/a.py\nlayer: core\n---\n\n# A\n\n"
+            "## Purpose\n\nDoes the thing\nacross lines.\n\n## Details\nignored\n"
+        )
+
+        from chronicler_lite.skill.index import parse_tech_md_metadata
+        meta = parse_tech_md_metadata(md)
+        assert meta["component_id"] == "src/a.py"
+        assert meta["layer"] == "core"
+        assert meta["purpose"] == "Does the thing across lines."
+        assert meta["tech_md_filename"] == "a.tech.md"
+
+    def test_parse_precomputes_location(self, tmp_path):
+        md = tmp_path / "a.tech.md"
+        md.write_text(
+            "---\ncomponent_id: packages/chronicler-core/src/chronicler_core/drafter/drafter.py\n---\n"
+        )
+
+        from chronicler_lite.skill.index import group_by_package, parse_tech_md_metadata
+        meta = parse_tech_md_metadata(md)
+        assert meta["package"] == "chronicler-core"
+        assert meta["subsystem"] == "drafter"
+        assert meta["short_path"] == "chronicler_core/drafter/drafter.py"
+        assert group_by_package([meta]) == {"chronicler-core": {"drafter": [meta]}}
+
+    def test_group_by_package_bare_entries(self):
+        """Entries without precomputed fields are still grouped from component_id."""
+        from chronicler_lite.skill.index import group_by_package
+        entries = [
+            {"component_id": "packages/lite/src/lite/hooks/a.py"},
+            {"component_id": "packages/lite/src/lite/b.py"},
+            {"component_id": "setup.py"},
+        ]
+        assert group_by_package(entries) == {
+            "lite": {"hooks": [entries[0]], "(root)": [entries[1]]},
+            "root": {"(root)": [entries[2]]},
+        }
+
+    def test_parse_purpose_ends_at_next_heading(self, tmp_path):
+        md = tmp_path / "a.tech.md"
+        md.write_text("---\ncomponent_id: src/a.py\n---\n## Purpose\nShort.\n## Body\nmore\n")
+
+        from chronicler_lite.skill.index import parse_tech_md_metadata
+        meta = parse_tech_md_metadata(md)
+        assert meta["purpose"] == "Short."
+        assert meta["layer"] == "unknown"
+
+    def test_parse_unterminated_frontmatter(self, tmp_path):
+        md = tmp_path / "a.tech.md"
+        md.write_text("---\ncomponent_id: src/a.py\n## Purpose\nx\n")
+
+        from chronicler_lite.skill.index import parse_tech_md_metadata
+        assert parse_tech_md_metadata(md) is None
+
+    def test_build_index_keeps_sorted_order(self, tmp_path, capsys):
+        """Parallel parsing still lists components in filename order."""
+        chronicler_dir = tmp_path / ".chronicler"
+        chronicler_dir.mkdir()
+        for name in ["c", "a", "b", "skip"]:
+            cid = "" if name == "skip" else f"src/{name}.py"
+            (chronicler_dir / f"{name}.tech.md").write_text(
+                f"---\ncomponent_id: {cid}\nlayer: core\n---\n## Purpose\n{name} purpose\n"
+            )
+
+        from chronicler_lite.skill.index import build_index
+        content = build_index(tmp_path).read_text()
+
+        rows = [line for line in content.splitlines() if line.startswith("| `")]
+        assert [r.split("`")[1] for r in rows] == ["src/a.py", "src/b.py", "src/c.py"]
+        assert "3 components indexed" in capsys.readouterr().out
+
+    def test_parse_without_frontmatter_skips_decode(self, tmp_path):
+        """Files not starting with --- are rejected from a byte peek, even if not UTF-8."""
+        md = tmp_path / "a.tech.md"
+        md.write_bytes(b"# Notes\n" + b"\xff" * 64)
+
+        from chronicler_lite.skill.index import parse_tech_md_metadata
+        assert parse_tech_md_metadata(md) is None
@@ -107,6 +107,12 @@ class TestPermissionModel:
         with pytest.raises(Exception):
             perm.action = "write"
 
+    def test_hashable_with_conditions(self):
+        a = Permission(resource="doc", action="read", conditions={"branch": ["main"]})
+        b = Permission(resource="doc", action="read", conditions={"branch": ["main"]})
+        assert hash(a) == hash(b)
+        assert len({a, b, Permission(resource="doc", action="read")}) == 2
+
 
 class TestSearchResultModel:
     def test_round_trip(self):
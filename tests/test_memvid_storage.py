@@ -263,7 +263,8 @@ class TestRebuild:
 
         # Both files should have been stored (alphabetical order: api, auth)
         assert mem_instance.put.call_count == 2
-        assert mem_instance.commit.call_count >= 2
+        # Staged writes are flushed with a single commit at the end
+        mem_instance.commit.assert_called_once()
 
         # The auth file should also trigger enrich_from_frontmatter
         mem_instance.add_memory_cards.assert_called_once_with([
@@ -271,6 +272,26 @@ class TestRebuild:
         ])
 
 
+    def test_commits_staged_writes_on_error(self, tmp_path: Path, mem_instance: MagicMock):
+        _mock_memvid_cls.create.return_value = mem_instance
+        md_dir = tmp_path / "docs"
+        md_dir.mkdir()
+        (md_dir / "a.tech.md").write_text("A docs.", encoding="utf-8")
+        (md_dir / "b.tech.md").write_text("B docs.", encoding="utf-8")
+        mem_instance.put.side_effect = [None, RuntimeError("disk full")]
+
+        storage = MemVidStorage(path=str(tmp_path / "s.mv2"))
+        with pytest.raises(RuntimeError):
+            storage.rebuild(str(md_dir))
+        mem_instance.commit.assert_called_once()
+
+    def test_empty_dir_does_not_commit(self, tmp_path: Path, mem_instance: MagicMock):
+        _mock_memvid_cls.create.return_value = mem_instance
+        storage = MemVidStorage(path=str(tmp_path / "s.mv2"))
+        storage.rebuild(str(tmp_path))
+        mem_instance.commit.assert_not_called()
+
+
 # ---------------------------------------------------------------------------
 # _split_frontmatter() helper
 # ---------------------------------------------------------------------------
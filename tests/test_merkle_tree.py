@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 
 import pytest
@@ -312,3 +313,193 @@ def test_update_node_missing_raises(tmp_path: Path):
     tree = MerkleTree.build(root)
     with pytest.raises(KeyError):
         tree.update_node("nonexistent.py", source_hash="aabbccddeeff")
+
+
+# ── by_doc_path ──────────────────────────────────────────────────────
+
+
+def test_by_doc_path(tmp_path: Path):
+    """by_doc_path maps a .tech.md path back to its source node."""
+    root = _make_project(tmp_path)
+    doc_dir = root / ".chronicler"
+    doc_dir.mkdir()
+    (doc_dir / "src-main.tech.md").write_text("# Main docs")
+
+    tree = MerkleTree.build(root, doc_dir=".chronicler")
+    doc_path = tree.nodes["src/main.py"].doc_path
+    assert tree.by_doc_path[doc_path].path == "src/main.py"
+    assert len(tree.by_doc_path) == 1
+
+
+def test_by_doc_path_reset_by_update_node(tmp_path: Path):
+    """update_node drops the cached index so lookups see the new node."""
+    root = _make_project(tmp_path)
+    doc_dir = root / ".chronicler"
+    doc_dir.mkdir()
+    (doc_dir / "src-main.tech.md").write_text("# Main docs")
+
+    tree = MerkleTree.build(root, doc_dir=".chronicler")
+    doc_path = tree.nodes["src/main.py"].doc_path
+    assert tree.by_doc_path[doc_path].source_hash != "aabbccddeeff"
+    tree.update_node("src/main.py", source_hash="aabbccddeeff")
+    assert tree.by_doc_path[doc_path].source_hash == "aabbccddeeff"
+
+
+# ── Hash algorithm ───────────────────────────────────────────────────
+
+
+def test_compute_file_hash_empty_file(tmp_path: Path):
+    """Empty files (which cannot be mmapped) hash like empty content."""
+    f = tmp_path / "empty.txt"
+    f.write_bytes(b"")
+    assert compute_file_hash(f) == compute_hash(b"")
+
+
+def test_compute_hash_unknown_algorithm():
+    with pytest.raises(ValueError, match="md5"):
+        compute_hash(b"x", algorithm="md5")
+
+
+def test_blake3_without_package_raises(monkeypatch):
+    """Selecting blake3 without the optional package fails loudly."""
+    from chronicler_core.merkle import tree as tree_mod
+
+    monkeypatch.setattr(tree_mod, "blake3", None)
+    with pytest.raises(ImportError, match="blake3"):
+        compute_hash(b"x", algorithm="blake3")
+
+
+def test_algorithm_roundtrips(tmp_path: Path, monkeypatch):
+    """The tree records its algorithm and drift checks reuse it."""
+    import hashlib
+
+    from chronicler_core.merkle import tree as tree_mod
+
+    class _FakeBlake3:
+        def blake3(self):
+            return hashlib.sha3_256()
+
+    monkeypatch.setattr(tree_mod, "blake3", _FakeBlake3())
+    root = _make_project(tmp_path)
+    tree = MerkleTree.build(root, algorithm="blake3")
+    assert tree.nodes["src/main.py"].source_hash == hashlib.sha3_256(b"print('hi')").hexdigest()[:12]
+
+    loaded = MerkleTree.from_json(tree.to_json())
+    assert loaded.algorithm == "blake3"
+    assert loaded.check_drift() == []
+
+
+# ── Stat cache ───────────────────────────────────────────────────────
+
+
+def _age_files(root: Path, seconds: int = 60) -> None:
+    """Backdate every file so its stat is outside the racy window."""
+    import time
+
+    old = time.time() - seconds
+    for p in root.rglob("*"):
+        if p.is_file():
+            os.utime(p, (old, old))
+
+
+def test_build_records_stat_for_settled_files(tmp_path: Path):
+    root = _make_project(tmp_path)
+    _age_files(root)
+    tree = MerkleTree.build(root)
+    node = tree.nodes["src/main.py"]
+    st = (root / "src" / "main.py").stat()
+    assert (node.mtime_ns, node.size) == (st.st_mtime_ns, st.st_size)
+    assert tree.nodes["src"].mtime_ns is None
+    assert "src" not in tree.stat_cache()
+    assert tree.stat_cache()["src/main.py"] == (st.st_mtime_ns, st.st_size, node.source_hash)
+
+
+def test_build_skips_stat_for_racy_files(tmp_path: Path):
+    """Files modified moments ago are hashed but not trusted next time."""
+    root = _make_project(tmp_path)
+    tree = MerkleTree.build(root)
+    assert tree.nodes["src/main.py"].mtime_ns is None
+    assert tree.stat_cache() == {}
+
+
+def test_build_reuses_cached_hashes(tmp_path: Path):
+    from unittest.mock import patch
+
+    from chronicler_core.merkle import builder
+
+    root = _make_project(tmp_path)
+    _age_files(root)
+    first = MerkleTree.build(root)
+
+    util = root / "src" / "util.py"
+    util.write_text("def helper(): return 1")
+    old = util.stat().st_mtime - 30
+    os.utime(util, (old, old))
+    with patch.object(builder, "compute_file_hash", wraps=compute_file_hash) as hasher:
+        second = MerkleTree.build(root, stat_cache=first.stat_cache())
+
+    assert [c.args[0].name for c in hasher.call_args_list] == ["util.py"]
+    assert second.nodes["src/main.py"].source_hash == first.nodes["src/main.py"].source_hash
+    assert second.nodes["src/util.py"].source_hash != first.nodes["src/util.py"].source_hash
+    assert second.root_hash != first.root_hash
+
+
+def test_stat_cache_roundtrips_through_json(tmp_path: Path):
+    root = _make_project(tmp_path)
+    _age_files(root)
+    tree = MerkleTree.build(root)
+    assert MerkleTree.from_json(tree.to_json()).stat_cache() == tree.stat_cache()
+
+
+# ── Directory walk ───────────────────────────────────────────────────
+
+
+def test_iter_files_matches_rglob_order(tmp_path: Path):
+    """_iter_files yields what sorted(rglob) + ignore filtering used to."""
+    from chronicler_core.merkle.tree import DEFAULT_IGNORE, _iter_files, _matches_any
+
+    for rel in ["a/x.py", "a.py", "a-b/y.py", "node_modules/z.js", "b/.git/c", "b/c.py"]:
+        p = tmp_path / rel
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text("x")
+    (tmp_path / "link.py").symlink_to(tmp_path / "a.py")
+    (tmp_path / "linkdir").symlink_to(tmp_path / "a")
+
+    expected = [
+        str(p.relative_to(tmp_path))
+        for p in sorted(tmp_path.rglob("*"))
+        if not _matches_any(p.relative_to(tmp_path), DEFAULT_IGNORE) and p.is_file()
+    ]
+    assert [rel for rel, _ in _iter_files(tmp_path, DEFAULT_IGNORE)] == expected
+    assert expected == ["a/x.py", "a-b/y.py", "a.py", "b/c.py", "link.py"]
+
+
+def test_parallel_hashing_matches_serial(tmp_path: Path, monkeypatch):
+    """Thread-pool hashing gives the same tree as hashing one by one."""
+    from chronicler_core.merkle import builder
+
+    for i in range(20):
+        (tmp_path / f"f{i:02d}.py").write_text(f"x = {i}\n" * (i * 500))
+
+    monkeypatch.setattr(builder, "_PARALLEL_MIN_FILES", 10_000)
+    serial = MerkleTree.build(tmp_path)
+    monkeypatch.setattr(builder, "_PARALLEL_MIN_FILES", 2)
+    parallel = MerkleTree.build(tmp_path)
+
+    assert parallel.root_hash == serial.root_hash
+    assert list(parallel.nodes) == list(serial.nodes)
+    assert all(parallel.nodes[p].hash == n.hash for p, n in serial.nodes.items())
+
+
+def test_compute_file_hash_mmap_and_read_agree(tmp_path: Path, monkeypatch):
+    """Large (mmapped) and small (read) paths produce the same digest."""
+    from chronicler_core.merkle import tree as tree_mod
+
+    f = tmp_path / "data.bin"
+    f.write_bytes(os.urandom(4096))
+    expected = compute_hash(f.read_bytes())
+
+    monkeypatch.setattr(tree_mod, "_MMAP_MIN_SIZE", 1)
+    assert compute_file_hash(f) == expected
+    monkeypatch.setattr(tree_mod, "_MMAP_MIN_SIZE", 1 << 30)
+    assert compute_file_hash(f) == expected
@@ -42,6 +42,7 @@ def graph(mock_neo4j):
     from chronicler_enterprise.plugins.mnemon.neo4j_graph import Neo4jGraph
 
     g = Neo4jGraph(uri="bolt://localhost:7687", auth=("neo4j", "test"))
+    g._driver.reset_mock()  # drop the schema setup calls made by __init__
     return g
 
 
@@ -83,6 +84,15 @@ def test_neighbors_returns_graph_nodes(graph):
     assert nodes[0].id == "x1"
 
 
+def test_neighbors_splits_metadata_from_known_keys(graph):
+    session = graph._driver.session.return_value.__enter__.return_value
+    session.run.return_value = [{"m": {"id": "x1", "label": "X", "owner": "team-a"}}]
+
+    node = graph.neighbors("root")[0]
+    assert (node.id, node.type, node.label) == ("x1", "", "X")
+    assert node.metadata == {"owner": "team-a"}
+
+
 def test_neighbors_respects_depth(graph):
     session = graph._driver.session.return_value.__enter__.return_value
     session.run.return_value = []
@@ -92,6 +102,16 @@ def test_neighbors_respects_depth(graph):
     assert "[*1..2]" in cypher
 
 
+def test_neighbors_clamps_depth_to_precomputed_query(graph):
+    from chronicler_enterprise.plugins.mnemon.neo4j_graph import _NEIGHBOR_QUERIES
+
+    session = graph._driver.session.return_value.__enter__.return_value
+    session.run.return_value = []
+
+    graph.neighbors("root", depth=50)
+    assert session.run.call_args[0][0] is _NEIGHBOR_QUERIES[10]
+
+
 def test_query_passthrough(graph):
     session = graph._driver.session.return_value.__enter__.return_value
     fake_record = MagicMock()
@@ -106,42 +126,101 @@ def test_query_passthrough(graph):
 
 
 def test_sync_from_memvid_creates_nodes_and_edges(graph):
+    from chronicler_enterprise.plugins.mnemon.neo4j_graph import _sync_tx
+
     storage = MagicMock()
     storage.state.return_value = {
         "cards": [
             {"subject": "AuthService", "predicate": "calls", "object": "UserDB"},
+            {"subject": "AuthService", "predicate": "reads", "object": "Cache"},
         ],
     }
 
-    with patch.object(graph, "add_node") as mock_add_node, \
-         patch.object(graph, "add_edge") as mock_add_edge:
-        graph.sync_from_memvid(storage)
+    graph.sync_from_memvid(storage)
+
+    session = graph._driver.session.return_value.__enter__.return_value
+    session.execute_write.assert_called_once()
+    fn, nodes, edges = session.execute_write.call_args[0]
+    assert fn is _sync_tx
+    # Nodes are deduplicated by id
+    assert [n["id"] for n in nodes] == ["AuthService", "UserDB", "Cache"]
+    assert all(n["type"] == "entity" for n in nodes)
+    assert edges[0] == {"source": "AuthService", "target": "UserDB", "relation": "calls"}
+    assert len(edges) == 2
+
 
-    assert mock_add_node.call_count == 2
-    assert mock_add_edge.call_count == 1
+def test_sync_tx_runs_two_unwind_statements():
+    from chronicler_enterprise.plugins.mnemon.neo4j_graph import _sync_tx
 
-    # Check the subject node
-    subj_node = mock_add_node.call_args_list[0][0][0]
-    assert subj_node.id == "AuthService"
-    assert subj_node.type == "entity"
+    tx = MagicMock()
+    _sync_tx(tx, [{"id": "a"}], [{"source": "a", "target": "a", "relation": "self"}])
 
-    # Check the edge
-    edge = mock_add_edge.call_args_list[0][0][0]
-    assert edge.source == "AuthService"
-    assert edge.target == "UserDB"
-    assert edge.relation == "calls"
+    assert tx.run.call_count == 2
+    assert all("UNWIND" in c[0][0] for c in tx.run.call_args_list)
 
 
 def test_sync_from_memvid_empty_state(graph):
     storage = MagicMock()
     storage.state.return_value = {}
 
-    with patch.object(graph, "add_node") as mock_add_node, \
-         patch.object(graph, "add_edge") as mock_add_edge:
-        graph.sync_from_memvid(storage)
+    graph.sync_from_memvid(storage)
+
+    graph._driver.session.assert_not_called()
+
+
+def test_driver_configured_with_pool_settings(mock_neo4j):
+    from chronicler_enterprise.plugins.mnemon.neo4j_graph import Neo4jGraph
+
+    Neo4jGraph(uri="bolt://localhost:7687", auth=("neo4j", "test"), max_connection_pool_size=8)
+    kwargs = mock_neo4j.GraphDatabase.driver.call_args.kwargs
+    assert kwargs["max_connection_pool_size"] == 8
+    assert kwargs["connection_acquisition_timeout"] == 10.0
+
+
+def test_bound_session_shared_across_calls(graph):
+    with graph.session() as bound:
+        graph.add_node(GraphNode(id="a", type="t", label="A"))
+        graph.add_node(GraphNode(id="b", type="t", label="B"))
+
+    assert graph._driver.session.call_count == 1
+    assert bound.run.call_count == 2
+
+    graph.add_node(GraphNode(id="c", type="t", label="C"))
+    assert graph._driver.session.call_count == 2
+
+
+def test_sync_from_memvid_uses_one_session(graph):
+    storage = MagicMock()
+    storage.state.return_value = {
+        "cards": [
+            {"subject": "A", "predicate": "calls", "object": "B"},
+            {"subject": "B", "predicate": "calls", "object": "C"},
+        ],
+    }
+
+    graph.sync_from_memvid(storage)
+
+    assert graph._driver.session.call_count == 1
+
 
-    mock_add_node.assert_not_called()
-    mock_add_edge.assert_not_called()
+def test_init_creates_component_constraint_and_index(mock_neo4j):
+    from chronicler_enterprise.plugins.mnemon.neo4j_graph import Neo4jGraph
+
+    g = Neo4jGraph(uri="bolt://localhost:7687", auth=("neo4j", "test"))
+    session = g._driver.session.return_value.__enter__.return_value
+    statements = [c[0][0] for c in session.run.call_args_list]
+    assert any("CONSTRAINT component_id" in s and "IS UNIQUE" in s for s in statements)
+    assert any("INDEX component_type" in s for s in statements)
+
+
+def test_init_survives_schema_failure(mock_neo4j, caplog):
+    from chronicler_enterprise.plugins.mnemon.neo4j_graph import Neo4jGraph
+
+    driver = mock_neo4j.GraphDatabase.driver.return_value
+    driver.session.return_value.__enter__.return_value.run.side_effect = RuntimeError("denied")
+
+    Neo4jGraph(uri="bolt://localhost:7687", auth=("neo4j", "test"))
+    assert "schema setup failed" in caplog.text
 
 
 def test_close_closes_driver(graph):
@@ -186,3 +265,200 @@ def test_graphql_component_field_exists(mock_neo4j):
 
     schema_str = str(server.schema)
     assert "component" in schema_str
+
+
+@pytest.mark.skipif(
+    not _has_strawberry(),
+    reason="strawberry-graphql not installed (enterprise[neo4j] extra)",
+)
+def test_component_loader_batches_ids_in_order():
+    import asyncio
+
+    from chronicler_enterprise.plugins.mnemon.graphql_server import _load_components
+
+    g = MagicMock()
+    g.query.return_value = [
+        {"n": {"id": "b", "type": "service", "label": "B"}},
+        {"n": {"id": "a", "type": "service", "label": "A"}},
+    ]
+
+    got = asyncio.run(_load_components(g, ["a", "missing", "b"]))
+
+    g.query.assert_called_once()
+    assert g.query.call_args.kwargs["parameters"] == {"ids": ["a", "missing", "b"]}
+    assert [c.id if c else None for c in got] == ["a", None, "b"]
+
+
+@pytest.mark.skipif(
+    not _has_strawberry(),
+    reason="strawberry-graphql not installed (enterprise[neo4j] extra)",
+)
+def test_edges_loader_groups_by_source():
+    import asyncio
+
+    from chronicler_enterprise.plugins.mnemon.graphql_server import _load_edges_by_source
+
+    g = MagicMock()
+    g.query.return_value = [
+        {"src": "a", "tgt": "b", "rel": "calls"},
+        {"src": "a", "tgt": "c", "rel": "reads"},
+    ]
+
+    got = asyncio.run(_load_edges_by_source(g, ["a", "z"]))
+
+    g.query.assert_called_once()
+    assert [e.target for e in got[0]] == ["b", "c"]
+    assert got[1] == []
+
+
+# ---------------------------------------------------------------------------
+# Query cache
+# ---------------------------------------------------------------------------
+
+
+def test_query_cache_hits_on_repeat(graph):
+    session = graph._driver.session.return_value.__enter__.return_value
+    session.run.return_value = [{"col": "val"}]
+
+    first = graph.query("MATCH (n) WHERE n.id IN $ids RETURN n", {"ids": ["a", "b"]})
+    second = graph.query("MATCH (n) WHERE n.id IN $ids RETURN n", {"ids": ["a", "b"]})
+
+    assert first == second == [{"col": "val"}]
+    assert session.run.call_count == 1
+    assert graph.cache_stats() == {"hits": 1, "misses": 1, "size": 1}
+
+
+def test_query_cache_keyed_by_parameters(graph):
+    session = graph._driver.session.return_value.__enter__.return_value
+    session.run.return_value = []
+
+    graph.query("MATCH (n {id: $id}) RETURN n", {"id": "a"})
+    graph.query("MATCH (n {id: $id}) RETURN n", {"id": "b"})
+
+    assert session.run.call_count == 2
+
+
+def test_writes_invalidate_query_cache(graph):
+    session = graph._driver.session.return_value.__enter__.return_value
+    session.run.return_value = []
+
+    graph.query("RETURN 1")
+    graph.add_node(GraphNode(id="n1", type="service", label="Auth"))
+    graph.query("RETURN 1")
+
+    assert graph.cache_stats()["misses"] == 2
+
+
+def test_query_cache_expires_after_ttl(mock_neo4j):
+    from chronicler_enterprise.plugins.mnemon.neo4j_graph import Neo4jGraph
+
+    g = Neo4jGraph(uri="bolt://localhost:7687", auth=("neo4j", "test"), query_cache_ttl=0, ensure_schema=False)
+    session = g._driver.session.return_value.__enter__.return_value
+    session.run.return_value = []
+
+    g.query("RETURN 1")
+    g.query("RETURN 1")
+
+    assert session.run.call_count == 2
+
+
+def test_query_cache_evicts_least_recently_used(mock_neo4j):
+    from chronicler_enterprise.plugins.mnemon.neo4j_graph import Neo4jGraph
+
+    g = Neo4jGraph(
+        uri="bolt://localhost:7687", auth=("neo4j", "test"), query_cache_size=2, ensure_schema=False
+    )
+    session = g._driver.session.return_value.__enter__.return_value
+    session.run.return_value = []
+
+    g.query("RETURN 1")
+    g.query("RETURN 2")
+    g.query("RETURN 1")
+    g.query("RETURN 3")  # evicts RETURN 2
+    g.query("RETURN 2")
+
+    assert session.run.call_count == 4
+
+
+def test_blast_radius_queries_cover_each_depth_with_bound_id():
+    from chronicler_enterprise.plugins.mnemon.neo4j_graph import _BLAST_RADIUS_QUERIES
+
+    assert sorted(_BLAST_RADIUS_QUERIES) == list(range(1, 11))
+    for depth, cypher in _BLAST_RADIUS_QUERIES.items():
+        assert f"[*1..{depth}]" in cypher
+        assert "{id: $id}" in cypher
+
+
+def test_blast_radius_prefers_apoc_bfs(graph):
+    session = graph._driver.session.return_value.__enter__.return_value
+    session.run.return_value = [{"m": {"id": "b"}, "hop": 1}]
+
+    rows = graph.blast_radius("a", depth=3)
+
+    cypher = session.run.call_args[0][0]
+    assert "apoc.path.spanningTree" in cypher
+    assert session.run.call_args.kwargs["parameters"] == {"id": "a", "depth": 3}
+    assert rows == [{"m": {"id": "b"}, "hop": 1}]
+
+
+def test_blast_radius_falls_back_without_apoc(graph):
+    from chronicler_enterprise.plugins.mnemon.neo4j_graph import _BLAST_RADIUS_QUERIES
+
+    missing = Exception("no procedure")
+    missing.code = "Neo.ClientError.Procedure.ProcedureNotFound"
+    session = graph._driver.session.return_value.__enter__.return_value
+    session.run.side_effect = [missing, [{"m": {"id": "b"}, "hop": 1}], []]
+
+    assert graph.blast_radius("a", depth=99) == [{"m": {"id": "b"}, "hop": 1}]
+    assert session.run.call_args[0][0] is _BLAST_RADIUS_QUERIES[10]
+
+    # The probe isn't repeated once APOC is known to be missing
+    graph.blast_radius("c", depth=1)
+    assert session.run.call_count == 3
+    assert session.run.call_args[0][0] is _BLAST_RADIUS_QUERIES[1]
+
+
+def test_blast_radius_propagates_other_errors(graph):
+    session = graph._driver.session.return_value.__enter__.return_value
+    session.run.side_effect = RuntimeError("connection reset")
+
+    with pytest.raises(RuntimeError):
+        graph.blast_radius("a")
+
+
+def test_components_with_edges_is_one_query(graph):
+    session = graph._driver.session.return_value.__enter__.return_value
+    session.run.return_value = [
+        {"n": {"id": "a"}, "edges": [{"target": "b", "relation": "calls"}]},
+    ]
+
+    rows = graph.components_with_edges(type="service")
+
+    session.run.assert_called_once()
+    cypher = session.run.call_args[0][0]
+    assert "RELATES" in cypher
+    assert session.run.call_args.kwargs["parameters"] == {"type": "service"}
+    assert rows[0]["edges"] == [{"target": "b", "relation": "calls"}]
+
+
+def test_warm_up_holds_connections_and_explains_statements(graph):
+    graph.warm_up(connections=3, statements=["MATCH (n) RETURN n"])
+
+    assert graph._driver.session.call_count == 3
+    session = graph._driver.session.return_value.__enter__.return_value
+    tx = session.begin_transaction.return_value.__enter__.return_value
+    sent = [c[0][0] for c in tx.run.call_args_list]
+    assert sent.count("RETURN 1") == 3
+    assert sent.count("EXPLAIN MATCH (n) RETURN n") == 1
+
+
+def test_warm_up_failure_is_logged_without_stalling(graph, caplog):
+    import time
+
+    ok = graph._driver.session.return_value
+    graph._driver.session.side_effect = [ok, RuntimeError("unreachable")]
+
+    start = time.perf_counter()
+    graph.warm_up(connections=2)
+    assert time.perf_counter() - start < 5
+    assert "warm-up failed" in caplog.text
@@ -1,5 +1,8 @@
 """Tests for chronicler-obsidian: transforms, sync, and CLI commands."""
 
+import subprocess
+import sys
+
 import yaml
 import pytest
 from pathlib import Path
@@ -152,6 +155,24 @@ class TestLinkRewriter:
         result = self.rewriter.apply(content, {})
         assert result == content
 
+    def test_no_agent_uris_skips_regex(self):
+        content = "Just plain text with agent:/ almost a link."
+        with patch("chronicler_obsidian.transform.link_rewriter._AGENT_URI_SUB") as sub:
+            assert self.rewriter.apply(content, {}) is content
+        sub.assert_not_called()
+
+    def test_bare_prefix_left_alone(self):
+        assert self.rewriter.apply("agent:// and agent://!", {}) == "agent:// and agent://!"
+
+    @pytest.mark.parametrize("path, expected", [
+        ("docs/api.tech.md", "[[svc - docs/api]]"),
+        ("api.md", "[[svc - api.md]]"),
+        ("a.tech.md.bak", "[[svc - a.tech.md.bak]]"),
+        ("a.tech.md.tech.md", "[[svc - a.tech.md]]"),
+    ])
+    def test_only_trailing_tech_md_suffix_stripped(self, path, expected):
+        assert self.rewriter.apply(f"agent://svc/{path}", {}) == expected
+
 
 # ===========================================================================
 # FrontmatterFlattener tests
@@ -235,6 +256,45 @@ class TestFrontmatterFlattener:
         # No dependencies key when no edges
         assert "dependencies" not in fm
 
+    def test_emitter_matches_yaml_dump_for_plain_values(self):
+        from chronicler_obsidian.transform.frontmatter import _build_frontmatter, _emit_frontmatter
+
+        meta = yaml.safe_load(SAMPLE_TECH_MD.split("---")[1])
+        fm = _build_frontmatter(meta)
+        expected = yaml.dump(fm, default_flow_style=False, sort_keys=False, allow_unicode=True)
+        assert _emit_frontmatter(fm) == expected
+
+    def test_emitter_quotes_values_yaml_would_retype(self):
+        from chronicler_obsidian.transform.frontmatter import _emit_frontmatter
+
+        fm = {
+            "version": "1.0",
+            "flag": "yes",
+            "date": "2024-01-01",
+            "note": "a: b # c",
+            "empty": "",
+            "quote": "'x'",
+            "unicode": "héllo wörld",
+            "reviewed": True,
+            "count": 3,
+            "owner": None,
+            "aliases": [],
+        }
+        assert yaml.safe_load(_emit_frontmatter(fm)) == fm
+
+    def test_emitter_defers_unknown_shapes_to_yaml(self):
+        from chronicler_obsidian.transform.frontmatter import _emit_frontmatter
+
+        assert _emit_frontmatter({"score": 0.5}) is None
+        assert _emit_frontmatter({"nested": {"a": 1}}) is None
+
+        content = "---\ncomponent_id: svc\n---\n\nBody."
+        meta = {"component_id": "svc", "governance": {"review": {"by": "alice"}}}
+        result = self.flattener.apply(content, meta)
+        end = result.find("---", 3)
+        fm = yaml.safe_load(result[3:end])
+        assert fm["review"] == {"by": "alice"}
+
 
 # ===========================================================================
 # DataviewInjector tests
@@ -288,6 +348,26 @@ class TestDataviewInjector:
         result = self.injector.apply("# Doc", meta)
         assert "via ORM" in result
 
+    @pytest.mark.parametrize("content", [
+        "## Dependencies",
+        "## Dependencies\n\n\nExisting",
+        "## Dependencies  \t\n## Other",
+        "# Doc\n## Dependencies of the system\n## Dependencies\nx",
+        "# Doc\n## Dependenciesx\n\ntext",
+        "text ## Dependencies\n## Other",
+        "\n## Overview\ntext",
+        "## Overview",
+        "# Doc only",
+        "",
+    ])
+    def test_heading_search_matches_regex(self, content):
+        import re
+
+        from chronicler_obsidian.transform.dataview import _find_dependencies_heading
+
+        m = re.search(r"^(## Dependencies\s*)$", content, re.MULTILINE)
+        assert _find_dependencies_heading(content) == (m.end() if m else -1)
+
 
 # ===========================================================================
 # IndexGenerator tests
@@ -304,6 +384,14 @@ class TestIndexGenerator:
         assert len(gen.components["api"]) == 1
         assert len(gen.components["logic"]) == 1
 
+    def test_records_component_fields(self):
+        gen = IndexGenerator()
+        gen.apply("c", {"component_id": "svc-a", "layer": "api", "version": "1.0", "owner_team": "core"})
+        gen.apply("c", {})
+        comp = gen.components["api"][0]
+        assert (comp.component_id, comp.version, comp.owner_team) == ("svc-a", "1.0", "core")
+        assert gen.components["unknown"][0] == ("unknown", "", "")
+
     def test_generate_produces_valid_frontmatter(self):
         gen = IndexGenerator()
         gen.apply("c", {"component_id": "svc-a", "layer": "api"})
@@ -344,6 +432,39 @@ class TestIndexGenerator:
         result = gen.apply(content, {"component_id": "svc", "layer": "api"})
         assert result == content
 
+    def test_generate_exact_layout(self):
+        gen = IndexGenerator()
+        gen.apply("c", {"component_id": "svc-b", "layer": "api"})
+        gen.apply("c", {"component_id": "svc-a", "layer": "api"})
+        gen.apply("c", {"component_id": "svc-c", "layer": "logic"})
+        index = gen.generate()
+        assert index.startswith(
+            "---\n"
+            'title: "Chronicler Documentation Index"\n'
+            "tags: [chronicler-index]\n"
+            "---\n\n"
+            "# Project Documentation\n\n"
+            "## By Layer\n"
+            "### Api\n- [[svc-a]]\n- [[svc-b]]\n\n"
+            "### Logic\n- [[svc-c]]\n\n"
+            "## Dataview: All Services\n\n"
+        )
+        assert index.endswith("SORT component_id\n```\n")
+
+    def test_generate_again_picks_up_new_components(self):
+        gen = IndexGenerator()
+        gen.apply("c", {"component_id": "svc-b", "layer": "logic"})
+        first = gen.generate()
+        assert gen.generate() == first
+        gen.apply("c", {"component_id": "svc-a", "layer": "logic"})
+        gen.apply("c", {"component_id": "svc-z", "layer": "api"})
+        second = gen.generate()
+        assert "### Api\n- [[svc-z]]\n\n### Logic\n- [[svc-a]]\n- [[svc-b]]\n\n" in second
+
+    def test_empty_state_exact_layout(self):
+        index = IndexGenerator().generate()
+        assert "## By Layer\n## Dataview: All Services\n" in index
+
 
 # ===========================================================================
 # TransformPipeline tests
@@ -426,6 +547,114 @@ class TestObsidianSyncExport:
         assert report2.synced == 0
         assert report2.skipped == 1
 
+    def test_exports_nested_tech_md_files(self, tmp_path):
+        source = _make_source_dir(tmp_path)
+        (source / "sub" / "deeper").mkdir(parents=True)
+        (source / "sub" / "deeper" / "inner.tech.md").write_text(SAMPLE_TECH_MD)
+        (source / "sub" / "notes.md").write_text("# not exported")
+        sync, vault = _make_sync(tmp_path, source)
+        report = sync.export()
+        assert report.synced == 2
+        assert (vault / "sub" / "deeper" / "inner.md").exists()
+        assert not (vault / "sub" / "notes.md").exists()
+
+    def test_unchanged_file_is_not_decoded(self, tmp_path):
+        source = _make_source_dir(tmp_path)
+        sync, vault = _make_sync(tmp_path, source)
+        sync.export()
+        with patch.object(Path, "read_text", side_effect=AssertionError("decoded")):
+            report = sync.export()
+        assert report.skipped == 1
+        assert report.errors == []
+
+    def test_changed_file_is_resynced(self, tmp_path):
+        source = _make_source_dir(tmp_path)
+        sync, vault = _make_sync(tmp_path, source)
+        sync.export()
+        (source / "auth-service.tech.md").write_text(SAMPLE_TECH_MD + "\nMore text.\n")
+        report = sync.export()
+        assert report.synced == 1
+        assert "More text." in (vault / "auth-service.md").read_text()
+
+    def test_unchanged_stat_skips_hashing(self, tmp_path):
+        import os
+
+        source = _make_source_dir(tmp_path)
+        md = source / "auth-service.tech.md"
+        os.utime(md, (1_600_000_000, 1_600_000_000))
+        sync, vault = _make_sync(tmp_path, source)
+        sync.export()
+        with patch("chronicler_obsidian.sync._file_sha256") as digest:
+            report = sync.export()
+        digest.assert_not_called()
+        assert report.skipped == 1
+
+    def test_touched_but_unchanged_file_is_skipped(self, tmp_path):
+        import os
+
+        source = _make_source_dir(tmp_path)
+        md = source / "auth-service.tech.md"
+        os.utime(md, (1_600_000_000, 1_600_000_000))
+        sync, vault = _make_sync(tmp_path, source)
+        sync.export()
+        os.utime(md, (1_700_000_000, 1_700_000_000))
+        report = sync.export()
+        assert report.synced == 0
+        assert report.skipped == 1
+        assert sync._content_hashes["auth-service.tech.md"][1] == 1_700_000_000 * 10**9
+
+    def test_recently_modified_file_is_rehashed(self, tmp_path):
+        source = _make_source_dir(tmp_path)
+        sync, vault = _make_sync(tmp_path, source)
+        sync.export()
+        # Modified inside the racy window, so its stat is not trusted
+        assert sync._content_hashes["auth-service.tech.md"][1] is None
+        with patch("chronicler_obsidian.sync._file_sha256", wraps=lambda p: "x") as digest:
+            sync.export()
+        digest.assert_called_once()
+
+    def test_hashes_persist_across_instances(self, tmp_path):
+        source = _make_source_dir(tmp_path)
+        sync, vault = _make_sync(tmp_path, source)
+        sync.export()
+        assert (source / "obsidian-sync.json").is_file()
+
+        fresh = ObsidianSync(str(source), str(vault), ObsidianConfig(), sync.pipeline)
+        report = fresh.export()
+        assert report.synced == 0
+        assert report.skipped == 1
+
+    def test_persisted_hashes_reexport_missing_vault_file(self, tmp_path):
+        source = _make_source_dir(tmp_path)
+        sync, vault = _make_sync(tmp_path, source)
+        sync.export()
+        (vault / "auth-service.md").unlink()
+
+        fresh = ObsidianSync(str(source), str(vault), ObsidianConfig(), sync.pipeline)
+        assert fresh.export().synced == 1
+        assert (vault / "auth-service.md").exists()
+
+    def test_persisted_hashes_ignored_for_other_vault(self, tmp_path):
+        source = _make_source_dir(tmp_path)
+        sync, _vault = _make_sync(tmp_path, source)
+        sync.export()
+
+        other = tmp_path / "other-vault"
+        other.mkdir()
+        fresh = ObsidianSync(str(source), str(other), ObsidianConfig(), sync.pipeline)
+        assert fresh._content_hashes == {}
+
+    @patch("chronicler_obsidian.sync.requests")
+    def test_export_does_not_mask_rest_upload(self, mock_requests, tmp_path):
+        source = _make_source_dir(tmp_path)
+        sync, vault = _make_sync(tmp_path, source)
+        sync.export()
+
+        fresh = ObsidianSync(str(source), str(vault), ObsidianConfig(), sync.pipeline)
+        report = fresh.sync_rest(api_url="https://localhost:27124", token="tok")
+        assert report.synced == 1
+        assert fresh.sync_rest(api_url="https://localhost:27124", token="tok").skipped == 1
+
 
 # ===========================================================================
 # ObsidianSync watch tests (testing internals, not actual file watching)
@@ -460,12 +689,75 @@ class TestObsidianSyncWatch:
         result = sync._sync_single_file(fake)
         assert result is False
 
+    def test_sync_single_file_skips_unchanged_save(self, tmp_path):
+        source = _make_source_dir(tmp_path)
+        pipeline = MagicMock()
+        pipeline.apply.return_value = "rendered"
+        sync, vault = _make_sync(tmp_path, source, pipeline=pipeline)
+        tech_file = source / "auth-service.tech.md"
+        assert sync._sync_single_file(tech_file) is True
+        # Autosave: same bytes rewritten
+        tech_file.write_text(SAMPLE_TECH_MD)
+        assert sync._sync_single_file(tech_file) is True
+        pipeline.apply.assert_called_once()
+
+    def test_sync_single_file_rerenders_changed_content(self, tmp_path):
+        source = _make_source_dir(tmp_path)
+        sync, vault = _make_sync(tmp_path, source)
+        tech_file = source / "auth-service.tech.md"
+        sync._sync_single_file(tech_file)
+        tech_file.write_text(SAMPLE_TECH_MD + "\nEdited.\n")
+        assert sync._sync_single_file(tech_file) is True
+        assert "Edited." in (vault / "auth-service.md").read_text()
+
+    def test_symlinked_vault_dir_escape_rejected(self, tmp_path):
+        source = _make_source_dir(tmp_path)
+        (source / "sub").mkdir()
+        (source / "sub" / "x.tech.md").write_text(SAMPLE_TECH_MD)
+        sync, vault = _make_sync(tmp_path, source)
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (vault / "sub").symlink_to(outside, target_is_directory=True)
+
+        report = sync.export()
+        assert [e.error for e in report.errors] == ["Path traversal detected"]
+        assert not (outside / "x.md").exists()
+        assert sync._sync_single_file(source / "sub" / "x.tech.md") is False
+
+    def test_symlinked_vault_file_escape_rejected(self, tmp_path):
+        source = _make_source_dir(tmp_path)
+        sync, vault = _make_sync(tmp_path, source)
+        outside = tmp_path / "outside.md"
+        outside.write_text("keep me")
+        (vault / "auth-service.md").symlink_to(outside)
+
+        report = sync.export()
+        assert [e.error for e in report.errors] == ["Path traversal detected"]
+        assert outside.read_text() == "keep me"
+
+    def test_vault_dirs_resolved_once_per_export(self, tmp_path):
+        import os
+
+        source = _make_source_dir(tmp_path, {f"svc-{i}.tech.md": SAMPLE_TECH_MD for i in range(5)})
+        (source / "sub").mkdir()
+        (source / "sub" / "inner.tech.md").write_text(SAMPLE_TECH_MD)
+        sync, vault = _make_sync(tmp_path, source)
+        with patch("chronicler_obsidian.sync.os.path.realpath", wraps=os.path.realpath) as realpath:
+            report = sync.export()
+        assert report.synced == 6
+        assert realpath.call_count == 2
+
 
 # ===========================================================================
 # ObsidianSync REST tests (mock requests)
 # ===========================================================================
 
 
+def _rest_session(mock_requests: MagicMock) -> MagicMock:
+    """The session sync_rest opens with ``with requests.Session() as session``."""
+    return mock_requests.Session.return_value.__enter__.return_value
+
+
 class TestObsidianSyncRest:
     @patch("chronicler_obsidian.sync.requests")
     def test_puts_to_correct_url_path(self, mock_requests, tmp_path):
@@ -474,10 +766,10 @@ class TestObsidianSyncRest:
         mock_resp = MagicMock()
         mock_resp.status_code = 200
         mock_resp.raise_for_status = MagicMock()
-        mock_requests.put.return_value = mock_resp
+        _rest_session(mock_requests).put.return_value = mock_resp
 
         sync.sync_rest(api_url="https://localhost:27124", token="test-token")
-        call_args = mock_requests.put.call_args
+        call_args = _rest_session(mock_requests).put.call_args
         assert "/vault/auth-service.md" in call_args[0][0]
 
     @patch("chronicler_obsidian.sync.requests")
@@ -487,10 +779,10 @@ class TestObsidianSyncRest:
         mock_resp = MagicMock()
         mock_resp.status_code = 200
         mock_resp.raise_for_status = MagicMock()
-        mock_requests.put.return_value = mock_resp
+        _rest_session(mock_requests).put.return_value = mock_resp
 
         sync.sync_rest(api_url="https://localhost:27124", token="my-secret")
-        call_args = mock_requests.put.call_args
+        call_args = _rest_session(mock_requests).put.call_args
         headers = call_args[1]["headers"] if "headers" in call_args[1] else call_args.kwargs.get("headers", {})
         assert headers["Authorization"] == "Bearer my-secret"
 
@@ -498,7 +790,7 @@ class TestObsidianSyncRest:
     def test_handles_per_file_errors(self, mock_requests, tmp_path):
         source = _make_source_dir(tmp_path)
         sync, vault = _make_sync(tmp_path, source)
-        mock_requests.put.side_effect = Exception("Connection refused")
+        _rest_session(mock_requests).put.side_effect = Exception("Connection refused")
 
         report = sync.sync_rest(api_url="https://localhost:27124", token="tok")
         assert len(report.errors) == 1
@@ -514,12 +806,36 @@ class TestObsidianSyncRest:
         mock_resp = MagicMock()
         mock_resp.status_code = 200
         mock_resp.raise_for_status = MagicMock()
-        mock_requests.put.return_value = mock_resp
+        _rest_session(mock_requests).put.return_value = mock_resp
 
         report = sync.sync_rest(api_url="https://localhost:27124", token="tok")
         assert isinstance(report, SyncReport)
         assert report.synced == 2
 
+    @patch("chronicler_obsidian.sync.requests")
+    def test_uploads_share_one_session(self, mock_requests, tmp_path):
+        source = _make_source_dir(tmp_path, {
+            f"svc-{i}.tech.md": SAMPLE_TECH_MD for i in range(20)
+        })
+        sync, vault = _make_sync(tmp_path, source)
+        session = _rest_session(mock_requests)
+
+        def put(url, **kwargs):
+            if url.endswith("/svc-3.md"):
+                raise Exception("boom")
+            return MagicMock(status_code=200)
+
+        session.put.side_effect = put
+
+        report = sync.sync_rest(api_url="https://localhost:27124", token="tok")
+        mock_requests.Session.assert_called_once()
+        assert session.put.call_count == 20
+        assert report.synced == 19
+        assert [e.file for e in report.errors] == ["svc-3.tech.md"]
+        # The failed upload is retried next time; the rest are skipped
+        again = sync.sync_rest(api_url="https://localhost:27124", token="tok")
+        assert again.skipped == 19
+
 
 # ===========================================================================
 # parse_frontmatter tests
@@ -725,6 +1041,104 @@ edges:
         assert "[[svc-b]]" in content
         assert "[[svc-a]]" in content
 
+    def test_exact_map_layout(self, tmp_path):
+        from chronicler_obsidian.map_generator import MapGenerator
+
+        chronicler = self._make_chronicler_dir(tmp_path, {
+            "a.tech.md": "---\ncomponent_id: a\nedges:\n  - target: b\n    type: calls\n  - target: c\n---\n",
+            "b.tech.md": "---\ncomponent_id: b\n---\n",
+        })
+        assert MapGenerator(chronicler).generate() == (
+            "---\n"
+            'title: "MyProject Component Map"\n'
+            "tags: [chronicler-map]\n"
+            "cssclass: chronicler-map\n"
+            "---\n"
+            "\n"
+            "## a\n"
+            "- [[b]] (calls)\n"
+            "- [[c]]\n"
+            "\n"
+            "## b\n"
+            "- (no edges)\n"
+        )
+
+    def test_header_rendered_once_per_instance(self, tmp_path):
+        from chronicler_obsidian.map_generator import MapGenerator
+
+        chronicler = self._make_chronicler_dir(tmp_path)
+        gen = MapGenerator(chronicler)
+        with patch.object(MapGenerator, "_derive_project_name") as derive:
+            first = gen.generate()
+            second = gen.generate()
+        derive.assert_not_called()
+        assert first == second
+        assert first.startswith('---\ntitle: "MyProject Component Map"\n')
+
+    def test_edges_and_component_id_share_one_parse(self, tmp_path):
+        from chronicler_obsidian import map_generator
+
+        chronicler = self._make_chronicler_dir(tmp_path)
+        md = chronicler / "auth-service.tech.md"
+        with patch.object(map_generator.yaml, "load", wraps=map_generator.yaml.load) as load:
+            edges = map_generator.parse_tech_md_edges(md)
+            cid = map_generator.parse_component_id(md)
+        assert cid == "auth-service"
+        assert len(edges) == 3
+        assert load.call_count == 1
+
+    def test_frontmatter_cache_invalidated_on_change(self, tmp_path):
+        import os
+
+        from chronicler_obsidian.map_generator import parse_component_id
+
+        chronicler = self._make_chronicler_dir(tmp_path, {
+            "svc.tech.md": "---\ncomponent_id: old-id\n---\n",
+        })
+        md = chronicler / "svc.tech.md"
+        assert parse_component_id(md) == "old-id"
+        md.write_text("---\ncomponent_id: brand-new-id\n---\n")
+        st = md.stat()
+        os.utime(md, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert parse_component_id(md) == "brand-new-id"
+
+    def test_build_edge_graph_reads_each_file_once(self, tmp_path):
+        from chronicler_obsidian import map_generator
+
+        chronicler = self._make_chronicler_dir(tmp_path, {
+            "svc-a.tech.md": "---\ncomponent_id: a\nedges:\n  - target: b\n---\n",
+            "svc-b.tech.md": "# no frontmatter\n",
+        })
+        map_generator._cached_frontmatter.cache_clear()
+        with patch("builtins.open", wraps=open) as opened:
+            graph = map_generator.build_edge_graph(chronicler)
+        assert graph == {"a": [{"target": "b"}], "svc-b": []}
+        assert opened.call_count == 2
+
+    def test_build_edge_graph_keeps_sorted_order(self, tmp_path):
+        from chronicler_obsidian.map_generator import build_edge_graph
+
+        names = [f"svc-{i:02d}" for i in range(40)]
+        chronicler = self._make_chronicler_dir(tmp_path, {
+            f"{name}.tech.md": f"---\ncomponent_id: {name}\nedges:\n  - target: t-{name}\n---\n"
+            for name in reversed(names)
+        })
+        graph = build_edge_graph(chronicler)
+        assert list(graph) == names
+        assert graph["svc-07"] == [{"target": "t-svc-07"}]
+
+
+# ===========================================================================
+# Import footprint
+# ===========================================================================
+
+
+@pytest.mark.parametrize("module", ["chronicler_obsidian.map_generator", "chronicler_obsidian.sync"])
+def test_import_does_not_load_requests(module):
+    code = f"import sys, {module}; sys.exit('requests' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
 
 class TestMapGeneratorCLI:
     """Tests for the 'chronicler obsidian map' CLI command."""
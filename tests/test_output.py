@@ -1,11 +1,15 @@
 """Tests for the output subsystem: writer and validator."""
 
+import subprocess
+import sys
+
 import pytest
 import yaml
 from pathlib import Path
 
 from chronicler_core.config.models import OutputConfig
 from chronicler_core.drafter.models import FrontmatterModel, GovernanceModel, TechDoc
+from chronicler_core.output.frontmatter import split_frontmatter
 from chronicler_core.output.writer import TechMdWriter, _sanitize_component_id
 from chronicler_core.output.validator import (
     TechMdValidator,
@@ -176,6 +180,31 @@ class TestSplitFrontmatter:
         yaml_str, body = _split_frontmatter(content)
         assert yaml_str is None
 
+    def test_dashes_inside_a_value_do_not_close(self):
+        content = "---\nfoo: a---b\n---\nbody"
+        yaml_str, body = _split_frontmatter(content)
+        assert yaml_str == "foo: a---b"
+        assert body == "body"
+
+    def test_closing_fence_at_end_of_file(self):
+        yaml_str, body = split_frontmatter("---\nfoo: bar\n---")
+        assert yaml_str == "foo: bar\n"
+        assert body == ""
+
+    def test_empty_frontmatter(self):
+        yaml_str, body = split_frontmatter("---\n---\nbody")
+        assert yaml_str == ""
+        assert body == "body"
+
+    def test_import_does_not_load_writer_stack(self):
+        code = (
+            "import sys; import chronicler_core.output.frontmatter; "
+            "heavy = {'chronicler_core.output.writer', 'chronicler_core.drafter'} & set(sys.modules); "
+            "sys.exit(sorted(heavy) or 0)"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
+
 
 # ---------------------------------------------------------------------------
 # TechMdValidator
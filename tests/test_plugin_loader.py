@@ -79,6 +79,20 @@ def test_discover_finds_registered_plugins(mock_eps):
     assert result["storage"] == []
 
 
+@patch("chronicler_core.plugins.loader.importlib.metadata.entry_points")
+def test_discover_scans_only_requested_groups(mock_eps):
+    """Reading one plugin type scans only that entry-point group, once."""
+    mock_eps.side_effect = _ep_side_effect({
+        "chronicler.plugins.queue": [make_entry_point("sqs")],
+    })
+    result = make_loader().discover()
+    mock_eps.assert_not_called()
+
+    assert result["queue"] == ["sqs"]
+    assert result["queue"] == ["sqs"]
+    mock_eps.assert_called_once_with(group="chronicler.plugins.queue")
+
+
 # -- Loading from entry points ---------------------------------------------
 
 
@@ -115,6 +129,58 @@ def test_load_storage_from_entry_point(mock_eps):
     assert loader.load_storage(name="s3") is sentinel
 
 
+@patch("chronicler_core.plugins.loader.importlib.metadata.entry_points")
+def test_load_memoizes_loaded_class(mock_eps):
+    """Repeated loads of the same plugin reuse the first ep.load() result."""
+    sentinel = MagicMock(name="FakeQueueClass")
+    ep = make_entry_point("sqs", sentinel)
+    mock_eps.side_effect = _ep_side_effect({"chronicler.plugins.queue": [ep]})
+    loader = make_loader()
+
+    assert loader.load_queue(name="sqs") is sentinel
+    assert loader.load_queue(name="sqs") is sentinel
+    ep.load.assert_called_once()
+
+
+@patch("chronicler_core.plugins.loader.importlib.metadata.entry_points")
+def test_load_memoizes_lite_default(mock_eps):
+    """The Lite default is imported once per loader, then served from cache."""
+    mock_eps.side_effect = _ep_side_effect({})
+    fake_class = MagicMock(name="SQLiteQueue")
+    fake_module = MagicMock()
+    fake_module.SQLiteQueue = fake_class
+
+    with patch("builtins.__import__", return_value=fake_module) as mock_import:
+        loader = make_loader()
+        assert loader.load_queue() is fake_class
+        assert loader.load_queue() is fake_class
+
+    assert mock_import.call_count == 1
+
+
+@patch("chronicler_core.plugins.loader.importlib.metadata.entry_points")
+def test_missing_named_plugin_raises_on_repeat_without_rescan(mock_eps):
+    """A failed explicit lookup keeps raising but only scans entry points once."""
+    mock_eps.side_effect = _ep_side_effect({})
+    loader = make_loader()
+
+    for _ in range(2):
+        with pytest.raises(PluginNotFoundError):
+            loader.load_queue(name="nonexistent")
+    assert mock_eps.call_count == 1
+
+
+@patch("chronicler_core.plugins.loader.importlib.metadata.entry_points")
+def test_load_rbac_missing_named_plugin_is_cached(mock_eps):
+    """load_rbac with an unregistered name returns None without rescanning."""
+    mock_eps.side_effect = _ep_side_effect({})
+    loader = make_loader(rbac="casbin")
+
+    assert loader.load_rbac() is None
+    assert loader.load_rbac() is None
+    assert mock_eps.call_count == 1
+
+
 # -- RBAC special handling -------------------------------------------------
 
 
@@ -5,7 +5,7 @@ from __future__ import annotations
 import pytest
 
 from chronicler_core.interfaces.rbac import Permission, RBACPlugin
-from chronicler_enterprise.plugins.rbac.rbac import ChroniclerRBAC
+from chronicler_enterprise.plugins.rbac.rbac import ChroniclerRBAC, _perm
 
 
 @pytest.fixture()
@@ -49,6 +49,43 @@ def test_list_permissions_empty(rbac: ChroniclerRBAC):
     assert rbac.list_permissions("nobody") == []
 
 
+def test_grant_is_idempotent(rbac: ChroniclerRBAC):
+    perm = Permission(resource="doc:a", action="read")
+    rbac.grant("dave", perm)
+    rbac.grant("dave", Permission(resource="doc:a", action="read"))
+    assert rbac.list_permissions("dave") == [perm]
+
+
+def test_revoke_ungranted_is_noop(rbac: ChroniclerRBAC):
+    rbac.revoke("nobody", Permission(resource="doc:a", action="read"))
+    assert rbac.list_permissions("nobody") == []
+
+
+def test_check_cache_invalidated_by_grant_and_revoke(rbac: ChroniclerRBAC):
+    perm = Permission(resource="doc:c", action="write")
+    assert rbac.check("ed", perm) is False
+    rbac.grant("ed", perm)
+    assert rbac.check("ed", perm) is True
+    rbac.revoke("ed", perm)
+    assert rbac.check("ed", perm) is False
+
+
+def test_check_cache_invalidated_by_role_and_scope(rbac: ChroniclerRBAC):
+    assert rbac.can_read("fay", "doc:team") is False
+    rbac.assign_role("fay", "viewer")
+    assert rbac.can_read("fay", "doc:team") is True
+    rbac.set_scope("doc:team", "confidential")
+    assert rbac.can_read("fay", "doc:team") is False
+
+
+def test_check_cache_is_bounded(rbac: ChroniclerRBAC):
+    rbac._CHECK_CACHE_SIZE = 2
+    rbac.assign_role("gus", "viewer")
+    for doc in ("doc:1", "doc:2", "doc:3"):
+        rbac.can_read("gus", doc)
+    assert len(rbac._check_cache) == 2
+
+
 # -- Role assignment and hierarchy --------------------------------------------
 
 
@@ -109,6 +146,36 @@ def test_visible_docs(rbac: ChroniclerRBAC):
     assert "doc:classified" not in visible
 
 
+def test_visible_docs_includes_direct_grants(rbac: ChroniclerRBAC):
+    rbac.assign_role("lee", "viewer")
+    rbac.set_scope("doc:open", "internal")
+    rbac.set_scope("doc:team", "confidential")
+    rbac.set_scope("doc:classified", "secret")
+    rbac.grant("lee", Permission(resource="doc:classified", action="read"))
+
+    assert rbac.visible_docs("lee") == ["doc:open", "doc:classified"]
+
+
+def test_visible_docs_without_role_uses_grants_only(rbac: ChroniclerRBAC):
+    rbac.set_scope("doc:open", "internal")
+    rbac.set_scope("doc:team", "confidential")
+    rbac.grant("mo", Permission(resource="doc:team", action="read"))
+
+    assert rbac.visible_docs("mo") == ["doc:team"]
+    assert rbac.visible_docs("nobody") == []
+
+
+def test_perm_interns_instances():
+    assert _perm("doc:a", "read") is _perm("doc:a", "read")
+    assert _perm("doc:a", "read") == Permission(resource="doc:a", action="read")
+
+
+def test_can_read_matches_direct_grant(rbac: ChroniclerRBAC):
+    rbac.grant("ned", Permission(resource="doc:x", action="read"))
+    assert rbac.can_read("ned", "doc:x") is True
+    assert rbac.can_write("ned", "doc:x") is False
+
+
 # -- Protocol conformance -----------------------------------------------------
 
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sqlite3
 import threading
 import uuid
 from datetime import UTC, datetime, timedelta
@@ -37,6 +38,100 @@ class TestProtocol:
         assert isinstance(queue, QueuePlugin)
 
 
+# ---------------------------------------------------------------------------
+# Connection setup
+# ---------------------------------------------------------------------------
+
+
+class TestPragmas:
+    def _pragma(self, queue: SQLiteQueue, name: str):
+        return queue._conn.execute(f"PRAGMA {name}").fetchone()[0]
+
+    def test_defaults(self, queue: SQLiteQueue):
+        assert self._pragma(queue, "journal_mode") == "wal"
+        assert self._pragma(queue, "synchronous") == 1  # NORMAL
+        assert self._pragma(queue, "temp_store") == 2  # MEMORY
+        assert self._pragma(queue, "cache_size") == -64_000
+
+    def test_overrides(self, tmp_path):
+        q = SQLiteQueue(db_path=str(tmp_path / "q.db"), synchronous="full", cache_size_kib=2_000)
+        assert self._pragma(q, "synchronous") == 2  # FULL
+        assert self._pragma(q, "cache_size") == -2_000
+
+    def test_rejects_unknown_synchronous_mode(self, tmp_path):
+        with pytest.raises(ValueError):
+            SQLiteQueue(db_path=str(tmp_path / "q.db"), synchronous="NORMAL; DROP TABLE jobs")
+
+    def test_dequeue_uses_status_created_index(self, queue: SQLiteQueue):
+        plan = queue._conn.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM jobs WHERE status = ? "
+            "ORDER BY created_at ASC LIMIT 1",
+            ("pending",),
+        ).fetchall()
+        detail = " ".join(row[-1] for row in plan)
+        assert "idx_jobs_status_created" in detail
+        assert "TEMP B-TREE" not in detail
+
+    def test_drops_legacy_status_index(self, tmp_path):
+        db = tmp_path / "old.db"
+        conn = sqlite3.connect(db)
+        conn.executescript(
+            "CREATE TABLE jobs (id TEXT PRIMARY KEY, payload_json TEXT NOT NULL, "
+            "status TEXT NOT NULL DEFAULT 'pending', created_at TEXT NOT NULL, "
+            "updated_at TEXT NOT NULL, error TEXT, attempts INTEGER NOT NULL DEFAULT 0);"
+            "CREATE INDEX idx_jobs_status ON jobs(status);"
+        )
+        conn.close()
+
+        q = SQLiteQueue(db_path=str(db))
+        names = {r[0] for r in q._conn.execute("SELECT name FROM sqlite_master WHERE type='index'")}
+        assert "idx_jobs_status" not in names
+        assert "idx_jobs_status_created" in names
+
+    def test_migrates_text_timestamps(self, tmp_path):
+        db = tmp_path / "old.db"
+        created = datetime(2024, 5, 1, 12, 0, 0, 123456, tzinfo=UTC)
+        conn = sqlite3.connect(db)
+        conn.executescript(
+            "CREATE TABLE jobs (id TEXT PRIMARY KEY, payload_json TEXT NOT NULL, "
+            "status TEXT NOT NULL DEFAULT 'pending', created_at TEXT NOT NULL, "
+            "updated_at TEXT NOT NULL, error TEXT, attempts INTEGER NOT NULL DEFAULT 0);"
+        )
+        conn.execute(
+            "INSERT INTO jobs VALUES ('old-1', '{\"k\": 1}', 'pending', ?, ?, NULL, 0)",
+            (created.isoformat(), created.isoformat()),
+        )
+        conn.commit()
+        conn.close()
+
+        q = SQLiteQueue(db_path=str(db))
+        types = {r[1]: r[2] for r in q._conn.execute("PRAGMA table_info(jobs)")}
+        assert types["created_at"] == "INTEGER"
+        assert types["updated_at"] == "INTEGER"
+        job = q.dequeue()
+        assert job.id == "old-1"
+        assert job.created_at == created
+        assert job.payload == {"k": 1}
+
+    def test_timestamps_stored_as_epoch_us(self, queue):
+        job = _make_job()
+        queue.enqueue(job)
+        row = queue._conn.execute(
+            "SELECT created_at, typeof(created_at) FROM jobs WHERE id = ?", (job.id,)
+        ).fetchone()
+        assert row[1] == "integer"
+        assert row[0] == (job.created_at - datetime(1970, 1, 1, tzinfo=UTC)) // timedelta(microseconds=1)
+        assert queue.dequeue().created_at == job.created_at
+
+    def test_close(self, tmp_path):
+        q = SQLiteQueue(db_path=str(tmp_path / "q.db"))
+        q.enqueue(_make_job())
+        q.close()
+        with pytest.raises(sqlite3.ProgrammingError):
+            q.stats()
+        assert SQLiteQueue(db_path=str(tmp_path / "q.db")).stats()["pending"] == 1
+
+
 # ---------------------------------------------------------------------------
 # Enqueue / Dequeue
 # ---------------------------------------------------------------------------
@@ -54,6 +149,15 @@ class TestEnqueueDequeue:
         assert got.payload == {"repo": "acme/app"}
         assert got.status == JobStatus.processing
 
+    def test_payload_round_trip(self, queue: SQLiteQueue):
+        payload = {"repo": "acme/app", "files": ["a.py", "b.py"], "n": 3, "nested": {"ok": True}}
+        queue.enqueue(_make_job(payload=payload))
+        assert queue.dequeue().payload == payload
+
+    def test_non_string_keys_stringified(self, queue: SQLiteQueue):
+        queue.enqueue(_make_job(payload={"counts": {1: "one"}}))
+        assert queue.dequeue().payload == {"counts": {"1": "one"}}
+
     def test_fifo_ordering(self, queue: SQLiteQueue):
         """Jobs come out in creation-time order."""
         base = datetime(2025, 1, 1, tzinfo=UTC)
@@ -71,6 +175,26 @@ class TestEnqueueDequeue:
     def test_dequeue_empty_returns_none(self, queue: SQLiteQueue):
         assert queue.dequeue() is None
 
+    def test_dequeue_returns_claimed_row(self, queue: SQLiteQueue):
+        j = _make_job(attempts=1, error="earlier")
+        queue.enqueue(j)
+
+        got = queue.dequeue()
+        assert got.status == JobStatus.processing
+        assert got.updated_at > j.updated_at
+        assert (got.attempts, got.error, got.created_at) == (1, "earlier", j.created_at)
+        assert queue.stats()["processing"] == 1
+
+    def test_fallback_without_returning(self, queue: SQLiteQueue, monkeypatch):
+        monkeypatch.setattr("chronicler_lite.queue.sqlite_queue._HAS_RETURNING", False)
+        j = _make_job()
+        queue.enqueue(j)
+
+        got = queue.dequeue()
+        assert got.id == j.id
+        assert got.status == JobStatus.processing
+        assert queue.dequeue() is None
+
     def test_dequeue_skips_non_pending(self, queue: SQLiteQueue):
         """Only pending jobs are returned by dequeue."""
         j = _make_job()
@@ -80,6 +204,36 @@ class TestEnqueueDequeue:
         assert queue.dequeue() is None
 
 
+# ---------------------------------------------------------------------------
+# Batch enqueue
+# ---------------------------------------------------------------------------
+
+
+class TestEnqueueMany:
+    def test_inserts_all_in_order(self, queue: SQLiteQueue):
+        base = datetime(2025, 1, 1, tzinfo=UTC)
+        jobs = [_make_job(id=f"b-{i}", created_at=base + timedelta(seconds=i)) for i in range(4)]
+
+        assert queue.enqueue_many(jobs) == [j.id for j in jobs]
+        assert queue.stats()["pending"] == 4
+        assert [queue.dequeue().id for _ in jobs] == [j.id for j in jobs]
+
+    def test_empty_batch(self, queue: SQLiteQueue):
+        assert queue.enqueue_many([]) == []
+        assert queue.stats()["pending"] == 0
+
+    def test_duplicate_id_rolls_back_whole_batch(self, queue: SQLiteQueue):
+        queue.enqueue(_make_job(id="dup"))
+
+        with pytest.raises(sqlite3.IntegrityError):
+            queue.enqueue_many([_make_job(id="fresh"), _make_job(id="dup")])
+
+        assert queue.stats()["pending"] == 1
+        # Connection is usable again after the rollback
+        queue.enqueue(_make_job(id="after"))
+        assert queue.stats()["pending"] == 2
+
+
 # ---------------------------------------------------------------------------
 # Ack
 # ---------------------------------------------------------------------------
@@ -139,6 +293,21 @@ class TestNack:
         assert stats["dead"] == 1
         assert stats["pending"] == 0
 
+    def test_nack_respects_subclass_max_attempts(self, tmp_path):
+        class OneShotQueue(SQLiteQueue):
+            MAX_ATTEMPTS = 1
+
+        q = OneShotQueue(db_path=str(tmp_path / "q.db"))
+        j = _make_job()
+        q.enqueue(j)
+        q.dequeue()
+        q.nack(j.id, "boom")
+
+        dead = q.dead_letters()
+        assert [d.id for d in dead] == [j.id]
+        assert dead[0].attempts == 1
+        assert dead[0].error == "boom"
+
     def test_nack_nonexistent_job_is_noop(self, queue: SQLiteQueue):
         # Should not raise
         queue.nack("no-such-id", "reason")
@@ -267,3 +267,17 @@ class TestRepoMetadataUrlValidation:
                 component_id="test/repo", name="repo", full_name="test/repo",
                 url="not-a-url",
             )
+
+    def test_missing_host_rejected(self):
+        with pytest.raises(ValidationError, match="valid host"):
+            RepoMetadata(
+                component_id="test/repo", name="repo", full_name="test/repo",
+                url="https:///repo",
+            )
+
+    def test_uppercase_scheme_allowed(self):
+        meta = RepoMetadata(
+            component_id="test/repo", name="repo", full_name="test/repo",
+            url="HTTPS://github.com/test/repo",
+        )
+        assert meta.url == "HTTPS://github.com/test/repo"
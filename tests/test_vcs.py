@@ -13,7 +13,26 @@ from chronicler_core.vcs.crawler import (
     VCSCrawler,
     _matches_key_file,
 )
-from chronicler_core.vcs.models import FileNode, RepoMetadata
+from chronicler_core.vcs.models import CrawlResult, FileNode, RepoMetadata
+
+
+# ── FileNode ────────────────────────────────────────────────────────
+
+
+class TestFileNode:
+    def test_is_immutable(self):
+        node = FileNode(path="a.py", name="a.py", type="file")
+        with pytest.raises(AttributeError):
+            node.path = "b.py"
+
+    def test_crawl_result_keeps_instances_and_dumps(self):
+        node = FileNode(path="a.py", name="a.py", type="file", size=10, sha="s")
+        meta = RepoMetadata(component_id="acme/x", name="x", full_name="acme/x")
+        result = CrawlResult(metadata=meta, tree=[node])
+        assert result.tree[0] is node
+        assert result.model_dump()["tree"][0] == {
+            "path": "a.py", "name": "a.py", "type": "file", "size": 10, "sha": "s",
+        }
 
 
 # ── _matches_key_file ───────────────────────────────────────────────